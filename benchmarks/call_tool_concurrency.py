@@ -0,0 +1,83 @@
+"""Throughput and tail latency of concurrent call_tool requests
+
+Fires N concurrent dynamodb_table_describe calls against a stubbed client
+whose methods sleep for a fixed latency, once with the executor disabled
+(every boto3 call runs inline on the event loop, as before) and once with
+the thread pool enabled.
+
+    uv run python benchmarks/call_tool_concurrency.py --requests 200 --latency 0.05
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+
+from mcp import types
+
+from mcp_server_aws import server as aws_server
+from mcp_server_aws.executor import AWSExecutor
+
+
+class StubClient:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def __getattr__(self, operation):
+        def call(**kwargs):
+            time.sleep(self.latency)
+            return {"Operation": operation, "Parameters": kwargs}
+        return call
+
+
+async def _run(max_workers: int, requests: int, latency: float) -> dict:
+    server, aws = aws_server._get_server()
+    aws.executor = AWSExecutor(max_workers=max_workers)
+    stub = StubClient(latency)
+    aws.get_boto3_client = lambda service_name, region_name=None: stub
+    handler = server.request_handlers[types.CallToolRequest]
+
+    async def one(i: int, submitted: float) -> float:
+        request = types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(
+                name="dynamodb_table_describe",
+                arguments={"table_name": f"table-{i}"}
+            )
+        )
+        await handler(request)
+        return time.perf_counter() - submitted
+
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(one(i, started) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+    aws.executor.shutdown()
+
+    latencies = sorted(latencies)
+    return {
+        "throughput": requests / elapsed,
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05, help="Stubbed AWS latency in seconds")
+    parser.add_argument("--workers", type=int, default=32)
+    args = parser.parse_args()
+
+    for label, workers in (("inline (before)", 0), (f"pool={args.workers} (after)", args.workers)):
+        result = asyncio.run(_run(workers, args.requests, args.latency))
+        print(
+            f"{label:<20} {result['throughput']:8.1f} req/s  "
+            f"p50 {result['p50'] * 1000:8.1f} ms  p99 {result['p99'] * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
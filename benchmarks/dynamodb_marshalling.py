@@ -0,0 +1,99 @@
+"""Marshalling and unmarshalling throughput for large DynamoDB item lists
+
+Compares the original utils.get_dynamodb_type helper, boto3's
+TypeSerializer/TypeDeserializer and the marshalling module. Every run
+starts from a collected heap and its time includes collecting the
+young objects it left behind, so deferring GC work is not counted as
+a win.
+
+    uv run python benchmarks/dynamodb_marshalling.py --items 100000
+"""
+import gc
+import argparse
+import time
+from decimal import Decimal
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+from mcp_server_aws.marshalling import marshal_items, unmarshal_items
+
+
+def legacy_get_dynamodb_type(value):
+    if isinstance(value, str):
+        return {'S': value}
+    elif isinstance(value, (int, float)):
+        return {'N': str(value)}
+    elif isinstance(value, bool):
+        return {'BOOL': value}
+    elif value is None:
+        return {'NULL': True}
+    elif isinstance(value, list):
+        return {'L': [legacy_get_dynamodb_type(v) for v in value]}
+    elif isinstance(value, dict):
+        return {'M': {k: legacy_get_dynamodb_type(v) for k, v in value.items()}}
+    else:
+        raise ValueError(f"Unsupported type for DynamoDB: {type(value)}")
+
+
+def plain_items(count: int) -> list[dict]:
+    return [
+        {
+            "pk": f"user#{i}",
+            "sk": "profile",
+            "score": i * 1.5,
+            "visits": i,
+            "active": i % 2 == 0,
+            "email": None,
+            "tags": ["a", "b", "c"],
+            "address": {"city": "Seattle", "zip": "98101"}
+        }
+        for i in range(count)
+    ]
+
+
+def _measure(func, items, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        result = func(items)
+        gc.collect(1)
+        best = min(best, time.perf_counter() - started)
+        del result
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    items = plain_items(args.items)
+    # boto3 refuses floats, so its runs get Decimal scores
+    boto3_items = [{**item, "score": Decimal(str(item["score"]))} for item in items]
+    marshalled = marshal_items(items)
+
+    serializer = TypeSerializer()
+    deserializer = TypeDeserializer()
+    marshal_cases = [
+        ("legacy get_dynamodb_type", lambda batch: [
+            {k: legacy_get_dynamodb_type(v) for k, v in item.items()} for item in batch], items),
+        ("boto3 TypeSerializer", lambda batch: [
+            {k: serializer.serialize(v) for k, v in item.items()} for item in batch], boto3_items),
+        ("marshal_items", marshal_items, items),
+    ]
+    unmarshal_cases = [
+        ("boto3 TypeDeserializer", lambda batch: [
+            {k: deserializer.deserialize(v) for k, v in item.items()} for item in batch], marshalled),
+        ("unmarshal_items", unmarshal_items, marshalled),
+    ]
+    for label, cases in (("marshal", marshal_cases), ("unmarshal", unmarshal_cases)):
+        print(f"{label} {args.items} items")
+        for name, func, batch in cases:
+            seconds = _measure(func, batch, args.repeat)
+            print(f"  {name:<26} {seconds * 1000:9.1f} ms  {args.items / seconds:12,.0f} items/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Serialization time and output size for each output format
+
+Builds large responses shaped like EC2 describe_instances and DynamoDB scan
+results and compares the original indent=2 json.dumps path with the
+compact, pretty and table formats.
+
+    uv run python benchmarks/serialization.py --instances 2000 --items 20000
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from mcp_server_aws.formatting import serialize_response
+
+
+def legacy_serializer(obj):
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+def ec2_response(count: int) -> dict:
+    launched = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return {
+        "Reservations": [
+            {
+                "ReservationId": f"r-{i:017x}",
+                "OwnerId": "123456789012",
+                "Instances": [{
+                    "InstanceId": f"i-{i:017x}",
+                    "InstanceType": "m5.large",
+                    "LaunchTime": launched + timedelta(minutes=i),
+                    "State": {"Code": 16, "Name": "running"},
+                    "PrivateIpAddress": f"10.0.{i // 256 % 256}.{i % 256}",
+                    "SubnetId": "subnet-0123456789abcdef0",
+                    "VpcId": "vpc-0123456789abcdef0",
+                    "Placement": {"AvailabilityZone": "us-east-1a", "Tenancy": "default"},
+                    "BlockDeviceMappings": [
+                        {
+                            "DeviceName": f"/dev/xvd{chr(97 + d)}",
+                            "Ebs": {
+                                "AttachTime": launched,
+                                "DeleteOnTermination": True,
+                                "Status": "attached",
+                                "VolumeId": f"vol-{i:08x}{d:09x}"
+                            }
+                        }
+                        for d in range(3)
+                    ],
+                    "NetworkInterfaces": [{
+                        "NetworkInterfaceId": f"eni-{i:017x}",
+                        "MacAddress": "02:00:00:00:00:00",
+                        "PrivateIpAddresses": [{"Primary": True, "PrivateIpAddress": f"10.0.0.{i % 256}"}],
+                        "Groups": [{"GroupId": "sg-0123456789abcdef0", "GroupName": "default"}]
+                    }],
+                    "Tags": [{"Key": "Name", "Value": f"worker-{i}"}, {"Key": "team", "Value": "data"}]
+                }]
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def dynamodb_response(count: int) -> dict:
+    return {
+        "Items": [
+            {
+                "pk": {"S": f"user#{i}"},
+                "sk": {"S": "profile"},
+                "score": {"N": str(Decimal(i) / 7)},
+                "active": {"BOOL": i % 2 == 0},
+                "avatar": {"B": bytes(32)},
+                "tags": {"SS": ["a", "b", "c"]}
+            }
+            for i in range(count)
+        ],
+        "Count": count,
+        "ScannedCount": count
+    }
+
+
+def _measure(render, response, repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        text = render(response)
+        best = min(best, time.perf_counter() - started)
+    return best, len(text.encode())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--instances", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # bytes are not serializable by the legacy path, so its DynamoDB run drops them
+    legacy_items = dynamodb_response(args.items)
+    for item in legacy_items["Items"]:
+        del item["avatar"]
+
+    cases = [
+        ("ec2 describe_instances", ec2_response(args.instances), ec2_response(args.instances)),
+        ("dynamodb scan", dynamodb_response(args.items), legacy_items),
+    ]
+    renderers = [
+        ("legacy indent=2", None),
+        ("pretty", "pretty"),
+        ("compact", "compact"),
+        ("table", "table"),
+    ]
+    for label, response, legacy_response in cases:
+        print(label)
+        for name, output_format in renderers:
+            if output_format is None:
+                seconds, size = _measure(
+                    lambda r: json.dumps(r, indent=2, default=legacy_serializer), legacy_response, args.repeat)
+            else:
+                seconds, size = _measure(
+                    lambda r: serialize_response(r, output_format), response, args.repeat)
+            print(f"  {name:<16} {seconds * 1000:9.1f} ms  {size / 1024:10.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Cold-start cost of the server: time to initialize and to the first tool call
+
+Each run starts a fresh interpreter that imports the server, builds it,
+answers list_tools and then serves one dynamodb_table_list call against a
+botocore Stubber attached to the pooled client, so client creation and
+model loading are included but no request leaves the machine (a run that
+reaches a real endpoint fails). Runs are repeated for three modes:
+
+    eager    boto3 imported up front, as the server used to
+    lazy     boto3 imported by the first tool call (default)
+    prewarm  lazy, with AWS_MCP_PREWARM_SERVICES=dynamodb started after
+             initialization and the first call arriving --think-time later
+
+    uv run python benchmarks/startup.py --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+CHILD = r"""
+import asyncio, json, os, sys, time
+started = time.perf_counter()
+if os.environ["BENCH_MODE"] == "eager":
+    import boto3
+from mcp import types
+from mcp_server_aws import server as aws_server
+imported = time.perf_counter()
+
+async def main():
+    server, aws = aws_server._get_server()
+    await server.request_handlers[types.ListToolsRequest](types.ListToolsRequest(method="tools/list"))
+    initialized = time.perf_counter()
+    prewarm = aws.start_prewarm()
+    await asyncio.sleep(float(os.environ["BENCH_THINK_TIME"]))
+
+    stubbed = set()
+
+    def refuse_network(request, **kwargs):
+        raise RuntimeError(f"Benchmark reached a real endpoint: {request.url}")
+
+    def stub(client):
+        # Attached to the pooled client itself, which is what both the
+        # cached fast path and a fresh build hand to the tool
+        if client is not None and id(client) not in stubbed:
+            from botocore.stub import Stubber
+            stubber = Stubber(client)
+            stubber.add_response("list_tables", {"TableNames": ["bench"]})
+            stubber.activate()
+            client.meta.events.register("before-send", refuse_network)
+            stubbed.add(id(client))
+        return client
+
+    pool = aws.clients
+    get, cached = pool.get, pool.cached
+    pool.get = lambda *args, **kwargs: stub(get(*args, **kwargs))
+    pool.cached = lambda *args, **kwargs: stub(cached(*args, **kwargs))
+
+    call_started = time.perf_counter()
+    request = types.CallToolRequest(
+        method="tools/call",
+        params=types.CallToolRequestParams(name="dynamodb_table_list", arguments={})
+    )
+    result = (await server.request_handlers[types.CallToolRequest](request)).root
+    finished = time.perf_counter()
+    if result.isError or '"bench"' not in result.content[0].text:
+        raise RuntimeError(f"First call was not served by the stub: {result.content[0].text}")
+    if prewarm is not None:
+        prewarm.join()
+    aws.executor.shutdown()
+    print(json.dumps({
+        "import": imported - started,
+        "initialize": initialized - started,
+        "first_call": finished - call_started,
+    }))
+
+asyncio.run(main())
+"""
+
+
+def _run(mode: str, think_time: float) -> dict:
+    env = {
+        **os.environ,
+        "BENCH_MODE": mode,
+        "BENCH_THINK_TIME": str(think_time if mode == "prewarm" else 0),
+        "AWS_ACCESS_KEY_ID": "benchmark",
+        "AWS_SECRET_ACCESS_KEY": "benchmark",
+        "AWS_MCP_AUDIT_DB": ":memory:",
+        "AWS_MCP_PREWARM_SERVICES": "dynamodb" if mode == "prewarm" else "",
+    }
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD], env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--think-time", type=float, default=1.0,
+                        help="Delay between initialization and the first call in prewarm mode")
+    args = parser.parse_args()
+
+    for mode in ("eager", "lazy", "prewarm"):
+        runs = [_run(mode, args.think_time) for _ in range(args.runs)]
+        summary = {metric: statistics.median(run[metric] for run in runs) * 1000 for metric in runs[0]}
+        print(
+            f"{mode:<8} import {summary['import']:7.1f} ms  "
+            f"initialize {summary['initialize']:7.1f} ms  "
+            f"first call {summary['first_call']:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
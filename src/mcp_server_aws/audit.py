@@ -0,0 +1,162 @@
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+DEFAULT_AUDIT_DB = Path.home() / ".mcp-server-aws" / "audit.db"
+DEFAULT_MAX_ENTRIES = 100_000
+DEFAULT_MAX_AGE_DAYS = 30
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+PRUNE_INTERVAL = 500
+
+# Arguments carrying request bodies are summarised instead of stored
+PAYLOAD_KEYS = {"file_content", "payload", "payloads", "invocations", "item", "items", "parameters"}
+MAX_STRING_LENGTH = 256
+MAX_LIST_LENGTH = 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit_entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    service TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    parameters TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON audit_entries (timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_service ON audit_entries (service, timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_operation ON audit_entries (operation, timestamp);
+"""
+
+
+def _normalize_timestamp(value: str) -> str:
+    """Convert an ISO timestamp to the naive UTC form entries are stored in"""
+    timestamp = datetime.fromisoformat(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp.isoformat()
+
+
+def compact_parameters(value, key: str | None = None):
+    """Strip payload bodies and truncate large values before they are persisted"""
+    if key in PAYLOAD_KEYS:
+        if isinstance(value, str):
+            return f"<{len(value)} chars omitted>"
+        if isinstance(value, (list, dict)):
+            return f"<{type(value).__name__} of {len(value)} entries omitted>"
+    if isinstance(value, dict):
+        return {k: compact_parameters(v, k) for k, v in value.items()}
+    if isinstance(value, list):
+        items = [compact_parameters(v) for v in value[:MAX_LIST_LENGTH]]
+        if len(value) > MAX_LIST_LENGTH:
+            items.append(f"<{len(value) - MAX_LIST_LENGTH} more entries omitted>")
+        return items
+    if isinstance(value, str) and len(value) > MAX_STRING_LENGTH:
+        return value[:MAX_STRING_LENGTH] + f"...<{len(value) - MAX_STRING_LENGTH} chars omitted>"
+    return value
+
+
+class AuditLog:
+    """Append-only SQLite store for the audit://aws-operations resource
+
+    The database location comes from AWS_MCP_AUDIT_DB (':memory:' keeps the
+    log in memory). Entries beyond AWS_MCP_AUDIT_MAX_ENTRIES or older than
+    AWS_MCP_AUDIT_MAX_AGE_DAYS are pruned as new entries arrive.
+    """
+
+    def __init__(self, path: str | None = None, max_entries: int | None = None, max_age_days: float | None = None):
+        path = path or os.getenv("AWS_MCP_AUDIT_DB", str(DEFAULT_AUDIT_DB))
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries or int(os.getenv("AWS_MCP_AUDIT_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+        self.max_age_days = max_age_days or float(os.getenv("AWS_MCP_AUDIT_MAX_AGE_DAYS", DEFAULT_MAX_AGE_DAYS))
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self.prune()
+
+    def append(self, service: str, operation: str, parameters: dict) -> None:
+        entry = (
+            datetime.utcnow().isoformat(),
+            service,
+            operation,
+            json.dumps(compact_parameters(parameters), default=str)
+        )
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO audit_entries (timestamp, service, operation, parameters) VALUES (?, ?, ?, ?)",
+                entry
+            )
+            self._conn.commit()
+            self._writes_since_prune += 1
+            prune = self._writes_since_prune >= PRUNE_INTERVAL
+        if prune:
+            self.prune()
+
+    def prune(self) -> None:
+        """Apply the size and age retention limits"""
+        cutoff = (datetime.utcnow() - timedelta(days=self.max_age_days)).isoformat()
+        with self._lock:
+            self._conn.execute("DELETE FROM audit_entries WHERE timestamp < ?", (cutoff,))
+            self._conn.execute(
+                "DELETE FROM audit_entries WHERE id <= (SELECT MAX(id) FROM audit_entries) - ?",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+            self._writes_since_prune = 0
+
+    def query(
+        self,
+        service: str | None = None,
+        operation: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int | None = None,
+        before_id: int | None = None
+    ) -> list[dict]:
+        """Return matching entries, newest first"""
+        clauses, params = [], []
+        if service:
+            clauses.append("service = ?")
+            params.append(service)
+        if operation:
+            clauses.append("operation = ?")
+            params.append(operation)
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(_normalize_timestamp(since))
+        if until:
+            clauses.append("timestamp < ?")
+            params.append(_normalize_timestamp(until))
+        if before_id:
+            clauses.append("id < ?")
+            params.append(before_id)
+
+        sql = "SELECT id, timestamp, service, operation, parameters FROM audit_entries"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY id DESC LIMIT ?"
+        params.append(min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {**dict(row), "parameters": json.loads(row["parameters"])}
+            for row in rows
+        ]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM audit_entries").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
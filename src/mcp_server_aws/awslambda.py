@@ -0,0 +1,308 @@
+import os
+import json
+import time
+import base64
+import codecs
+import asyncio
+import logging
+import threading
+
+logger = logging.getLogger("aws-mcp-server")
+
+DEFAULT_INVOKE_CONCURRENCY = 16
+DEFAULT_INVOKE_TIMEOUT = 60
+DEFAULT_STREAM_BUFFER_BYTES = 1024 * 1024
+
+
+def decode_payload(raw: bytes) -> tuple[object, str]:
+    """Decode a function's response payload as JSON, then text, then base64"""
+    try:
+        text = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return base64.b64encode(raw).decode("ascii"), "base64"
+    if not text:
+        return None, "json"
+    try:
+        return json.loads(text), "json"
+    except ValueError:
+        return text, "text"
+
+
+def invoke(client, params: dict) -> dict:
+    """Invoke a function and decode its payload and log tail
+
+    A payload that is not JSON comes back as text, or base64 when it is
+    not UTF-8, with PayloadEncoding saying which.
+    """
+    response = client.invoke(**params)
+    if "Payload" in response:
+        payload, encoding = decode_payload(response["Payload"].read())
+        response["Payload"] = payload
+        if encoding != "json":
+            response["PayloadEncoding"] = encoding
+    if "LogResult" in response:
+        response["LogResult"] = base64.b64decode(response["LogResult"]).decode("utf-8", "replace")
+    return response
+
+
+def invoke_stream(client, params: dict, on_chunk=None, max_buffer_bytes: int | None = None) -> dict:
+    """Invoke a function through invoke_with_response_stream, handing chunks on as they arrive
+
+    on_chunk(text, encoding, streamed_bytes) receives each chunk as soon
+    as Lambda sends it: UTF-8 text while the stream decodes, base64 from
+    the first chunk that does not. Only the first max_buffer_bytes are
+    kept for the final result, which is marked Truncated beyond that.
+    """
+    max_buffer_bytes = max_buffer_bytes or int(
+        os.getenv("AWS_MCP_LAMBDA_STREAM_BUFFER_BYTES", DEFAULT_STREAM_BUFFER_BYTES))
+    started = time.monotonic()
+    response = client.invoke_with_response_stream(**params)
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    encoding = "text"
+    buffered = bytearray()
+    streamed = 0
+    chunks = 0
+    first_chunk_seconds = None
+    complete = {}
+    for event in response["EventStream"]:
+        if "PayloadChunk" in event:
+            data = event["PayloadChunk"]["Payload"]
+            chunks += 1
+            streamed += len(data)
+            if first_chunk_seconds is None:
+                first_chunk_seconds = round(time.monotonic() - started, 3)
+            room = max_buffer_bytes - len(buffered)
+            if room > 0:
+                buffered += data[:room]
+            if on_chunk is not None:
+                if encoding == "text":
+                    try:
+                        on_chunk(decoder.decode(data), encoding, streamed)
+                        continue
+                    except UnicodeDecodeError:
+                        encoding = "base64"
+                on_chunk(base64.b64encode(data).decode("ascii"), encoding, streamed)
+        elif "InvokeComplete" in event:
+            complete = event["InvokeComplete"]
+
+    truncated = streamed > len(buffered)
+    result = {
+        "StatusCode": response.get("StatusCode"),
+        "ExecutedVersion": response.get("ExecutedVersion"),
+    }
+    if truncated:
+        # A cut-off JSON document would not parse, so the prefix is returned as
+        # text (ignoring a character split at the cut) or base64
+        try:
+            result["Payload"] = codecs.getincrementaldecoder("utf-8")().decode(bytes(buffered))
+            result["PayloadEncoding"] = "text"
+        except UnicodeDecodeError:
+            result["Payload"] = base64.b64encode(bytes(buffered)).decode("ascii")
+            result["PayloadEncoding"] = "base64"
+    else:
+        payload, payload_encoding = decode_payload(bytes(buffered))
+        result["Payload"] = payload
+        if payload_encoding != "json":
+            result["PayloadEncoding"] = payload_encoding
+    if complete.get("ErrorCode"):
+        result["FunctionError"] = complete["ErrorCode"]
+        result["ErrorDetails"] = complete.get("ErrorDetails")
+    if complete.get("LogResult"):
+        result["LogResult"] = base64.b64decode(complete["LogResult"]).decode("utf-8", "replace")
+    result.update({
+        "Truncated": truncated,
+        "StreamedBytes": streamed,
+        "Chunks": chunks,
+        "FirstChunkSeconds": first_chunk_seconds,
+        "ElapsedSeconds": round(time.monotonic() - started, 3),
+    })
+    return result
+
+
+def invoke_params(function_name: str, payload=None, invocation_type: str | None = None,
+                  qualifier: str | None = None, log_tail: bool = False) -> dict:
+    params = {
+        "FunctionName": function_name,
+        "Payload": json.dumps(payload if payload is not None else {}).encode()
+    }
+    if invocation_type:
+        params["InvocationType"] = invocation_type
+    if qualifier:
+        params["Qualifier"] = qualifier
+    if log_tail:
+        params["LogType"] = "Tail"
+    return params
+
+
+async def batch_invoke(
+    aws,
+    client,
+    requests: list[dict],
+    max_concurrency: int | None = None,
+    timeout: float | None = None
+) -> dict:
+    """Run many invocations concurrently and return their results in request order
+
+    Each result carries its StatusCode, FunctionError and decoded payload
+    and log tail. A call that raises or exceeds timeout is reported with
+    an Error instead of failing the batch; a timed-out invocation still
+    completes on AWS, only its result is discarded.
+    """
+    max_concurrency = max_concurrency or int(
+        os.getenv("AWS_MCP_LAMBDA_INVOKE_CONCURRENCY", DEFAULT_INVOKE_CONCURRENCY))
+    timeout = timeout or DEFAULT_INVOKE_TIMEOUT
+    if max_concurrency < 1:
+        raise ValueError("Invoke concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(max_concurrency)
+    started = time.monotonic()
+
+    async def run_one(index: int, params: dict) -> dict:
+        result = {"Index": index, "FunctionName": params["FunctionName"]}
+        async with semaphore:
+            call_started = time.monotonic()
+            try:
+                response = await asyncio.wait_for(aws.run("lambda", invoke, client, params), timeout)
+            except asyncio.TimeoutError:
+                result["Error"] = f"Timed out after {timeout:g}s"
+            except Exception as e:
+                logger.warning(f"Invocation {index} of {params['FunctionName']} failed: {e}")
+                result["Error"] = str(e)
+            else:
+                response.pop("ResponseMetadata", None)
+                result.update(response)
+            result["Seconds"] = round(time.monotonic() - call_started, 3)
+        return result
+
+    results = await asyncio.gather(*(run_one(i, params) for i, params in enumerate(requests)))
+    return {
+        "Results": results,
+        "Invocations": len(results),
+        "Succeeded": sum(1 for r in results if "Error" not in r and not r.get("FunctionError")),
+        "FunctionErrors": sum(1 for r in results if r.get("FunctionError")),
+        "Failed": sum(1 for r in results if "Error" in r),
+        "ElapsedSeconds": round(time.monotonic() - started, 3),
+    }
+
+
+DEFAULT_INDEX_TTL = 300
+# list_functions returns at most 50 functions per page
+LIST_PAGE_SIZE = 50
+
+
+def list_functions(client, max_items: int | None = None, marker: str | None = None) -> dict:
+    """Follow NextMarker through every page, or until max_items functions are read"""
+    request = {}
+    if marker:
+        request["Marker"] = marker
+    functions: list[dict] = []
+    pages = 0
+    while True:
+        request["MaxItems"] = min(LIST_PAGE_SIZE, max_items - len(functions)) if max_items else LIST_PAGE_SIZE
+        page = client.list_functions(**request)
+        pages += 1
+        functions.extend(page.get("Functions", []))
+        marker = page.get("NextMarker")
+        if not marker or (max_items and len(functions) >= max_items):
+            break
+        request["Marker"] = marker
+    return {"Functions": functions, "NextMarker": marker, "Pages": pages}
+
+
+def tagged_functions(tagging_client, tags: dict) -> dict[str, dict]:
+    """Tags of the functions matching every tag filter, by function ARN
+
+    tags maps a key to a value, a list of accepted values, or None to only
+    require the key. Matching happens in the Resource Groups Tagging API
+    instead of one ListTags call per function.
+    """
+    tag_filters = [
+        {"Key": key} if value is None else {"Key": key, "Values": value if isinstance(value, list) else [value]}
+        for key, value in tags.items()
+    ]
+    request = {"ResourceTypeFilters": ["lambda:function"], "TagFilters": tag_filters}
+    matches = {}
+    while True:
+        page = tagging_client.get_resources(**request)
+        for resource in page.get("ResourceTagMappingList", []):
+            matches[resource["ResourceARN"]] = {tag["Key"]: tag["Value"] for tag in resource.get("Tags", [])}
+        if not page.get("PaginationToken"):
+            break
+        request["PaginationToken"] = page["PaginationToken"]
+    return matches
+
+
+def indexed_name(function_name: str) -> str | None:
+    """The function name behind a name, ARN or partial ARN, or None when it is qualified
+
+    A qualified reference (name:alias, or an ARN ending in a version or
+    alias) names a specific version, which the index does not hold.
+    """
+    parts = function_name.split(":")
+    if len(parts) == 1:
+        return function_name
+    if parts[0] == "arn":
+        return parts[6] if len(parts) == 7 and parts[5] == "function" else None
+    if len(parts) == 3 and parts[1] == "function":
+        return parts[2]
+    return None
+
+
+class FunctionIndex:
+    """Per-region index of function configurations
+
+    A complete listing marks a region fresh for AWS_MCP_LAMBDA_INDEX_TTL
+    seconds, during which lists and lookups are answered locally. Entries
+    are only replaced when their CodeSha256 or LastModified moved, so
+    refreshes report what actually changed.
+    """
+
+    def __init__(self, ttl: float | None = None):
+        self.ttl = ttl if ttl is not None else float(os.getenv("AWS_MCP_LAMBDA_INDEX_TTL", DEFAULT_INDEX_TTL))
+        self._functions: dict[str, dict[str, dict]] = {}
+        self._synced_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def update(self, region: str, functions: list[dict], complete: bool) -> dict:
+        stats = {"added": 0, "changed": 0, "unchanged": 0, "removed": 0}
+        with self._lock:
+            index = self._functions.setdefault(region, {})
+            for function in functions:
+                name = function["FunctionName"]
+                old = index.get(name)
+                if old is None:
+                    stats["added"] += 1
+                elif (old.get("CodeSha256"), old.get("LastModified")) == (
+                        function.get("CodeSha256"), function.get("LastModified")):
+                    stats["unchanged"] += 1
+                    continue
+                else:
+                    stats["changed"] += 1
+                index[name] = function
+            if complete:
+                seen = {function["FunctionName"] for function in functions}
+                for name in set(index) - seen:
+                    del index[name]
+                    stats["removed"] += 1
+                self._synced_at[region] = time.monotonic()
+        return stats
+
+    def age(self, region: str) -> float | None:
+        synced_at = self._synced_at.get(region)
+        return round(time.monotonic() - synced_at, 3) if synced_at is not None else None
+
+    def fresh(self, region: str) -> bool:
+        age = self.age(region)
+        return age is not None and age < self.ttl
+
+    def functions(self, region: str) -> list[dict]:
+        with self._lock:
+            return sorted(self._functions.get(region, {}).values(), key=lambda f: f["FunctionName"])
+
+    def get(self, region: str, name: str) -> dict | None:
+        """Look a function up by name or unqualified ARN; qualified names are never indexed"""
+        name = indexed_name(name)
+        if name is None:
+            return None
+        with self._lock:
+            return self._functions.get(region, {}).get(name)
@@ -0,0 +1,216 @@
+import os
+import json
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+logger = logging.getLogger("aws-mcp-server")
+
+DEFAULT_MAX_ENTRIES = 512
+
+# Arguments asking for a fresh read; they never change what AWS is asked
+# for, so they are left out of the key and the fresh result replaces the entry
+BYPASS_ARGUMENTS = ("bypass_cache", "refresh")
+UNCACHED_ARGUMENTS = set(BYPASS_ARGUMENTS)
+
+
+def bypasses_cache(arguments: dict) -> bool:
+    return any(arguments.get(name) for name in BYPASS_ARGUMENTS)
+
+
+def parse_ttls(spec: str | None) -> dict[str, float]:
+    """Parse a per-tool TTL spec such as 'ec2_list_instances=5,lambda_get_function=0'"""
+    ttls: dict[str, float] = {}
+    if not spec:
+        return ttls
+
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        tool, sep, value = part.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid cache TTL entry: {part}")
+        ttl = float(value)
+        if ttl < 0:
+            raise ValueError(f"Cache TTL for {tool} cannot be negative")
+        ttls[tool.strip()] = ttl
+    return ttls
+
+
+def resource_tags(name: str, arguments: dict) -> set[str]:
+    """Resources a cached read depends on"""
+    if name == "s3_bucket_list":
+        return {"s3:buckets"}
+    if name == "dynamodb_table_list":
+        return {"dynamodb:tables"}
+    if name in ("dynamodb_table_describe", "dynamodb_describe_ttl"):
+        return {f"dynamodb:table:{arguments.get('table_name')}"}
+    if name == "ec2_list_instances":
+        return {"ec2:instances"}
+    if name == "ec2_describe_instance":
+        return {"ec2:instances", f"ec2:instance:{arguments.get('instance_id')}"}
+    if name == "lambda_list_functions":
+        return {"lambda:functions"}
+    if name == "lambda_get_function":
+        return {f"lambda:function:{arguments.get('function_name')}"}
+    if name == "cloudwatch_list_metrics":
+        return {"cloudwatch:metrics"}
+    return set()
+
+
+def _table_tags(arguments: dict) -> set[str]:
+    return {"dynamodb:tables", f"dynamodb:table:{arguments.get('table_name')}"}
+
+
+def _instance_tags(arguments: dict) -> set[str]:
+    return {"ec2:instances"} | {f"ec2:instance:{i}" for i in arguments.get("instance_ids", [])}
+
+
+def _nothing(arguments: dict) -> set[str]:
+    return set()
+
+
+# Resources each mutating tool changes. Every non-read-only tool needs an
+# entry, even when no cached read depends on what it touches: a mutator
+# missing here drops the whole cache instead of guessing.
+INVALIDATIONS: dict[str, Callable[[dict], set[str]]] = {
+    "s3_bucket_create": lambda arguments: {"s3:buckets"},
+    "s3_bucket_delete": lambda arguments: {"s3:buckets"},
+    "s3_object_upload": _nothing,
+    "s3_object_upload_chunk": _nothing,
+    "s3_object_delete": _nothing,
+    "s3_object_download": _nothing,
+    "dynamodb_table_create": _table_tags,
+    "dynamodb_table_delete": _table_tags,
+    "dynamodb_table_update": _table_tags,
+    "dynamodb_update_ttl": lambda arguments: {f"dynamodb:table:{arguments.get('table_name')}"},
+    "dynamodb_item_put": _nothing,
+    "dynamodb_item_update": _nothing,
+    "dynamodb_item_delete": _nothing,
+    "dynamodb_item_batch_write": _nothing,
+    "dynamodb_batch_execute": _nothing,
+    "ec2_start_instances": _instance_tags,
+    "ec2_stop_instances": _instance_tags,
+    "lambda_invoke": _nothing,
+}
+
+
+def invalidated_tags(name: str, arguments: dict) -> set[str] | None:
+    """Resources a mutating call changes, or None when the tool is not mapped"""
+    tags = INVALIDATIONS.get(name)
+    return tags(arguments) if tags is not None else None
+
+
+class ResponseCache:
+    """Read-through LRU cache of tool results with per-tool TTLs
+
+    Default TTLs are the cache_ttl each tool declares in its ToolSpec;
+    overrides come from AWS_MCP_CACHE_TTL (e.g. 'ec2_list_instances=5';
+    0 disables caching for a tool) and the size bound from
+    AWS_MCP_CACHE_MAX_ENTRIES. Entries are tagged with the resources they
+    read so mutating calls can drop them.
+    """
+
+    def __init__(
+        self,
+        default_ttls: dict[str, float] | None = None,
+        max_entries: int | None = None,
+        ttls: dict[str, float] | None = None
+    ):
+        self.max_entries = max_entries if max_entries is not None else int(
+            os.getenv("AWS_MCP_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+        overrides = ttls if ttls is not None else parse_ttls(os.getenv("AWS_MCP_CACHE_TTL"))
+        self.ttls = {**(default_ttls or {}), **overrides}
+        self._entries: OrderedDict[tuple, tuple[float, object, set[str]]] = OrderedDict()
+        self._tags: dict[str, set[tuple]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+        self._tool_stats: dict[str, dict[str, int]] = {}
+
+    def cacheable(self, name: str) -> bool:
+        return self.max_entries > 0 and self.ttls.get(name, 0) > 0
+
+    @staticmethod
+    def key(name: str, arguments: dict) -> tuple:
+        relevant = {k: v for k, v in arguments.items() if k not in UNCACHED_ARGUMENTS}
+        return name, json.dumps(relevant, sort_keys=True, default=str)
+
+    def _count(self, name: str, outcome: str) -> None:
+        self._stats[outcome] += 1
+        tool_stats = self._tool_stats.setdefault(name, {"hits": 0, "misses": 0})
+        tool_stats[outcome] += 1
+
+    def _drop(self, key: tuple) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def get(self, name: str, arguments: dict):
+        """Return the cached result, or None on a miss"""
+        key = self.key(name, arguments)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._drop(key)
+                self._stats["expirations"] += 1
+                entry = None
+            if entry is None:
+                self._count(name, "misses")
+                return None
+            self._entries.move_to_end(key)
+            self._count(name, "hits")
+            return entry[1]
+
+    def put(self, name: str, arguments: dict, value) -> None:
+        key = self.key(name, arguments)
+        tags = resource_tags(name, arguments)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + self.ttls[name], value, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+
+    def invalidate(self, name: str, arguments: dict) -> int:
+        """Drop entries that read resources a mutating call changes"""
+        tags = invalidated_tags(name, arguments)
+        if tags is None:
+            logger.warning(f"No cache invalidation mapped for {name}, dropping every cached result")
+        elif not tags:
+            return 0
+        with self._lock:
+            if tags is None:
+                keys = set(self._entries)
+            else:
+                keys = set().union(*(self._tags.get(tag, ()) for tag in tags))
+            for key in keys:
+                self._drop(key)
+            self._stats["invalidations"] += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_ratio": round(self._stats["hits"] / lookups, 4) if lookups else None,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttls": dict(self.ttls),
+                "tools": {name: dict(counts) for name, counts in self._tool_stats.items()},
+            }
@@ -0,0 +1,174 @@
+import os
+import time
+import hashlib
+import logging
+import threading
+
+logger = logging.getLogger("aws-mcp-server")
+
+DEFAULT_REGION = "us-east-1"
+DEFAULT_MAX_POOL_CONNECTIONS = 50
+DEFAULT_SESSION_TTL = 900
+
+# boto3 service names used by the tools, pre-warmed by AWS_MCP_PREWARM_SERVICES=all
+TOOL_SERVICES = ("s3", "dynamodb", "ec2", "lambda", "cloudwatch", "logs", "bedrock-runtime", "resourcegroupstaggingapi")
+
+# Error codes meaning the credentials a client was built with are no longer valid
+EXPIRED_CREDENTIAL_ERRORS = {
+    "ExpiredToken",
+    "ExpiredTokenException",
+    "RequestExpired",
+    "InvalidClientTokenId",
+    "UnrecognizedClientException",
+}
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "yes")
+
+
+def _fingerprint(*values: str | None) -> str:
+    digest = hashlib.sha256()
+    for value in values:
+        digest.update((value or "").encode())
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+class ClientPool:
+    """Thread-safe pool of boto3 clients keyed by credentials, region and service
+
+    One boto3 Session is shared per credential set (explicit keys from the
+    environment or the default chain for AWS_PROFILE). Changing the
+    environment credentials therefore picks up a fresh session, sessions
+    without self-refreshing credentials are rebuilt after
+    AWS_MCP_SESSION_TTL seconds, and reset() drops everything after an
+    expired-token error. Clients are configured with
+    AWS_MCP_MAX_POOL_CONNECTIONS connections and TCP keep-alive
+    (AWS_MCP_TCP_KEEPALIVE) so concurrent calls reuse warm connections.
+
+    boto3 itself is only imported when the first client is requested.
+    """
+
+    def __init__(
+        self,
+        max_pool_connections: int | None = None,
+        tcp_keepalive: bool | None = None,
+        session_ttl: float | None = None
+    ):
+        self.max_pool_connections = max_pool_connections or int(
+            os.getenv("AWS_MCP_MAX_POOL_CONNECTIONS", DEFAULT_MAX_POOL_CONNECTIONS))
+        self.tcp_keepalive = tcp_keepalive if tcp_keepalive is not None else _env_flag(
+            "AWS_MCP_TCP_KEEPALIVE", True)
+        self.session_ttl = session_ttl if session_ttl is not None else float(
+            os.getenv("AWS_MCP_SESSION_TTL", DEFAULT_SESSION_TTL))
+        self._config = None
+        self._lock = threading.Lock()
+        self._sessions: dict[str, tuple[float, object]] = {}
+        self._clients: dict[tuple[str, str, str], object] = {}
+
+    @staticmethod
+    def credential_key() -> str:
+        """Identify the credential set the environment currently selects"""
+        access_key = os.getenv("AWS_ACCESS_KEY_ID")
+        secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
+        if access_key and secret_key:
+            return "keys:" + _fingerprint(access_key, secret_key, os.getenv("AWS_SESSION_TOKEN"))
+        return "profile:" + (os.getenv("AWS_PROFILE") or "default")
+
+    @property
+    def config(self):
+        if self._config is None:
+            from botocore.config import Config
+            self._config = Config(
+                max_pool_connections=self.max_pool_connections,
+                tcp_keepalive=self.tcp_keepalive
+            )
+        return self._config
+
+    def _new_session(self, credential_key: str):
+        import boto3
+        if credential_key.startswith("keys:"):
+            logger.debug("Using explicit AWS credentials")
+            return boto3.Session(
+                aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+                aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+                aws_session_token=os.getenv("AWS_SESSION_TOKEN")
+            )
+        logger.debug("Using default AWS credential chain")
+        return boto3.Session()
+
+    def _session(self, credential_key: str):
+        """Return the shared session for a credential set, rebuilding stale ones"""
+        entry = self._sessions.get(credential_key)
+        if entry is not None:
+            created, session = entry
+            if time.monotonic() - created < self.session_ttl:
+                return session
+            from botocore.credentials import RefreshableCredentials
+            if isinstance(session.get_credentials(), RefreshableCredentials):
+                # botocore refreshes these itself before they expire
+                self._sessions[credential_key] = (time.monotonic(), session)
+                return session
+            self._drop_credential_set(credential_key)
+
+        # The environment selects one credential set at a time, so clients
+        # built for a previous (e.g. rotated) set are released here
+        for stale in [key for key in self._sessions if key != credential_key]:
+            self._drop_credential_set(stale)
+        session = self._new_session(credential_key)
+        self._sessions[credential_key] = (time.monotonic(), session)
+        return session
+
+    def _drop_credential_set(self, credential_key: str) -> None:
+        self._sessions.pop(credential_key, None)
+        for key in [key for key in self._clients if key[0] == credential_key]:
+            del self._clients[key]
+
+    def cached(self, service_name: str, region_name: str | None = None):
+        """Return the pooled client if it exists and its session is fresh, without ever blocking"""
+        region_name = region_name or os.getenv("AWS_REGION") or DEFAULT_REGION
+        credential_key = self.credential_key()
+        client = self._clients.get((credential_key, region_name, service_name))
+        entry = self._sessions.get(credential_key)
+        if client is not None and entry is not None and time.monotonic() - entry[0] < self.session_ttl:
+            return client
+        return None
+
+    def get(self, service_name: str, region_name: str | None = None):
+        """Return a pooled client, creating it on first use"""
+        client = self.cached(service_name, region_name)
+        if client is not None:
+            return client
+
+        region_name = region_name or os.getenv("AWS_REGION") or DEFAULT_REGION
+        credential_key = self.credential_key()
+        key = (credential_key, region_name, service_name)
+        # Session.client is not thread-safe, so creation is serialized
+        with self._lock:
+            session = self._session(credential_key)
+            client = self._clients.get(key)
+            if client is None:
+                client = session.client(service_name, region_name=region_name, config=self.config)
+                self._clients[key] = client
+            return client
+
+    def prewarm(self, services: list[str], region_name: str | None = None) -> None:
+        """Create clients ahead of time so the first tool call skips model loading"""
+        for service_name in services:
+            try:
+                self.get(service_name, region_name)
+            except Exception as e:
+                logger.warning(f"Failed to pre-warm {service_name} client: {e}")
+
+    def reset(self) -> None:
+        """Forget every session and client, e.g. after credentials expired"""
+        with self._lock:
+            self._sessions.clear()
+            self._clients.clear()
+
+    def __len__(self) -> int:
+        return len(self._clients)
@@ -0,0 +1,796 @@
+import os
+import re
+import json
+import time
+import random
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from pathlib import Path
+from .utils import encode_cursor, decode_cursor
+
+
+def apply_projection(params: dict, attributes: list[str] | None) -> dict:
+    """Push an attribute list down to DynamoDB as a ProjectionExpression
+
+    Each dotted attribute path is rewritten with #projN placeholders so
+    reserved words and special characters are safe. An explicit
+    ProjectionExpression already in params takes precedence.
+    """
+    if not attributes or "ProjectionExpression" in params:
+        return params
+
+    names = dict(params.get("ExpressionAttributeNames", {}))
+    placeholders: dict[str, str] = {}
+    expressions = []
+    for attribute in attributes:
+        parts = []
+        for name in attribute.split("."):
+            if name not in placeholders:
+                placeholders[name] = f"#proj{len(placeholders)}"
+                names[placeholders[name]] = name
+            parts.append(placeholders[name])
+        expressions.append(".".join(parts))
+
+    params["ProjectionExpression"] = ", ".join(expressions)
+    params["ExpressionAttributeNames"] = names
+    return params
+
+
+class CapacityLimiter:
+    """Token bucket that keeps consumed capacity under a per-second budget
+
+    Requests may start while the bucket is positive; the capacity each one
+    actually consumed is charged afterwards, so a large page can push the
+    bucket negative and delay the requests that follow.
+    """
+
+    def __init__(self, units_per_second: float):
+        self.units_per_second = units_per_second
+        self._tokens = units_per_second
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.units_per_second, self._tokens + (now - self._updated) * self.units_per_second)
+        self._updated = now
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens > 0:
+                    return
+                wait_seconds = -self._tokens / self.units_per_second + 0.01
+            time.sleep(wait_seconds)
+
+    def consume(self, units: float) -> None:
+        with self._lock:
+            self._refill()
+            self._tokens -= units
+
+
+def _consumed_units(response: dict) -> float:
+    consumed = response.get("ConsumedCapacity")
+    if isinstance(consumed, list):
+        return sum(entry.get("CapacityUnits", 0) for entry in consumed)
+    if consumed:
+        return consumed.get("CapacityUnits", 0)
+    return 0
+
+
+# Segments scanned at once unless max_concurrency says otherwise
+DEFAULT_SCAN_CONCURRENCY = 4
+
+
+def parallel_scan(
+    client,
+    params: dict,
+    total_segments: int | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+    max_capacity_per_second: float | None = None,
+    max_concurrency: int | None = None
+) -> dict:
+    """Scan a table page by page across parallel segments
+
+    Each segment follows LastEvaluatedKey until it is exhausted or the
+    shared row limit is reached. Before every page a segment reserves its
+    share of the rows still unclaimed and sends that as the page Limit,
+    so concurrent segments never return more than limit rows between them
+    and the returned NextCursor resumes every unfinished segment exactly
+    where it stopped.
+    """
+    if cursor:
+        state = decode_cursor(cursor)
+        total_segments = state["total_segments"]
+        positions = {int(segment): key for segment, key in state["segments"].items()}
+    else:
+        total_segments = total_segments or 1
+        positions = {segment: None for segment in range(total_segments)}
+
+    limiter = CapacityLimiter(max_capacity_per_second) if max_capacity_per_second else None
+    lock = threading.Condition()
+    items: list[dict] = []
+    totals = {"Count": 0, "ScannedCount": 0, "CapacityUnits": 0.0}
+    budget = {"reserved": 0, "active": len(positions)}
+
+    def reserve() -> int | None:
+        # Rows a segment may ask for next: None without a limit, 0 once the
+        # limit is met. While other segments hold reservations that may come
+        # back unused, wait for them instead of giving up early.
+        if not limit:
+            return params.get("Limit")
+        with lock:
+            while True:
+                unclaimed = limit - len(items) - budget["reserved"]
+                if unclaimed > 0:
+                    share = -(-unclaimed // budget["active"])
+                    share = min(share, params.get("Limit", share))
+                    budget["reserved"] += share
+                    return share
+                if not budget["reserved"]:
+                    return 0
+                lock.wait()
+
+    def scan_segment(segment: int) -> None:
+        start_key = positions[segment]
+        try:
+            while True:
+                page_limit = reserve()
+                if page_limit == 0:
+                    return
+                request = dict(params, ReturnConsumedCapacity="TOTAL")
+                if total_segments > 1:
+                    request.update(Segment=segment, TotalSegments=total_segments)
+                if start_key:
+                    request["ExclusiveStartKey"] = start_key
+                if page_limit:
+                    request["Limit"] = page_limit
+
+                try:
+                    if limiter:
+                        limiter.acquire()
+                    page = client.scan(**request)
+                except BaseException:
+                    if limit:
+                        with lock:
+                            budget["reserved"] -= page_limit
+                            lock.notify_all()
+                    raise
+                units = _consumed_units(page)
+                if limiter:
+                    limiter.consume(units)
+
+                start_key = page.get("LastEvaluatedKey")
+                with lock:
+                    items.extend(page.get("Items", []))
+                    totals["Count"] += page.get("Count", 0)
+                    totals["ScannedCount"] += page.get("ScannedCount", 0)
+                    totals["CapacityUnits"] += units
+                    if limit:
+                        budget["reserved"] -= page_limit
+                        lock.notify_all()
+                    if start_key:
+                        positions[segment] = start_key
+                    else:
+                        del positions[segment]
+                if not start_key:
+                    return
+        finally:
+            with lock:
+                budget["active"] -= 1
+                lock.notify_all()
+
+    started = time.monotonic()
+    workers = max(1, min(max_concurrency or DEFAULT_SCAN_CONCURRENCY, len(positions) or 1))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aws-mcp-ddb-scan") as pool:
+        for future in [pool.submit(scan_segment, segment) for segment in list(positions)]:
+            future.result()
+
+    next_cursor = None
+    if positions:
+        next_cursor = encode_cursor({"total_segments": total_segments, "segments": positions})
+    return {
+        "Items": items,
+        "Count": totals["Count"],
+        "ScannedCount": totals["ScannedCount"],
+        "ConsumedCapacityUnits": totals["CapacityUnits"],
+        "TotalSegments": total_segments,
+        "ElapsedSeconds": round(time.monotonic() - started, 3),
+        "NextCursor": next_cursor
+    }
+
+
+def paginated_query(
+    client,
+    params: dict,
+    limit: int | None = None,
+    all_pages: bool = False,
+    cursor: str | None = None
+) -> dict:
+    """Run a query across pages up to limit items
+
+    Without limit or all_pages only the first page is read. Limit is passed
+    through to each request, so the returned NextCursor resumes exactly
+    after the last item returned. With Select=COUNT only counts are summed.
+    """
+    request = dict(params, ReturnConsumedCapacity="TOTAL")
+    if cursor:
+        request["ExclusiveStartKey"] = decode_cursor(cursor)["key"]
+
+    count_only = params.get("Select") == "COUNT"
+    items: list[dict] = []
+    totals = {"Count": 0, "ScannedCount": 0, "CapacityUnits": 0.0}
+    pages = 0
+    while True:
+        if limit:
+            request["Limit"] = limit - totals["Count"]
+        page = client.query(**request)
+        pages += 1
+        items.extend(page.get("Items", []))
+        totals["Count"] += page.get("Count", 0)
+        totals["ScannedCount"] += page.get("ScannedCount", 0)
+        totals["CapacityUnits"] += _consumed_units(page)
+
+        last_key = page.get("LastEvaluatedKey")
+        if not last_key:
+            break
+        request["ExclusiveStartKey"] = last_key
+        if limit and totals["Count"] >= limit:
+            break
+        if not limit and not all_pages:
+            break
+
+    response = {
+        "Count": totals["Count"],
+        "ScannedCount": totals["ScannedCount"],
+        "ConsumedCapacityUnits": totals["CapacityUnits"],
+        "Pages": pages,
+        "NextCursor": encode_cursor({"key": last_key}) if last_key else None
+    }
+    if not count_only:
+        response["Items"] = items
+    return response
+
+
+BATCH_WRITE_SIZE = 25
+DEFAULT_WRITE_CONCURRENCY = 4
+DEFAULT_WRITE_ATTEMPTS = 8
+BACKOFF_BASE_SECONDS = 0.05
+BACKOFF_CAP_SECONDS = 5.0
+DEFAULT_SPILL_DIR = Path.home() / ".mcp-server-aws" / "spill"
+THROTTLING_ERRORS = {
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+}
+
+
+class AdaptiveBackoff:
+    """Shared, jittered exponential backoff driven by throttling signals
+
+    Every throttled or partially processed request raises the level for
+    all workers; every fully processed request lowers it again.
+    """
+
+    def __init__(self, base: float = BACKOFF_BASE_SECONDS, cap: float = BACKOFF_CAP_SECONDS):
+        self.base = base
+        self.cap = cap
+        self.level = 0
+        self._lock = threading.Lock()
+
+    def delay(self) -> float:
+        with self._lock:
+            level = self.level
+        if level == 0:
+            return 0.0
+        return random.uniform(0, min(self.cap, self.base * 2 ** level))
+
+    def throttled(self) -> None:
+        with self._lock:
+            self.level = min(self.level + 1, 16)
+
+    def succeeded(self) -> None:
+        with self._lock:
+            self.level = max(self.level - 1, 0)
+
+
+def _request_key(request: dict, key_attributes: list[str]) -> str:
+    if "PutRequest" in request:
+        item = request["PutRequest"]["Item"]
+    else:
+        item = request["DeleteRequest"]["Key"]
+    return json.dumps([item.get(name) for name in key_attributes], sort_keys=True, default=str)
+
+
+def dedupe_write_requests(requests: list[dict], key_attributes: list[str]) -> list[dict]:
+    """Keep only the last write per key, since a batch may not touch a key twice"""
+    latest = {_request_key(request, key_attributes): request for request in requests}
+    return list(latest.values())
+
+
+# Spill ids are file names inside the spill directory: the table name, a UTC
+# timestamp and a random suffix, e.g. orders-20240101T120000-1a2b3c4d.jsonl
+SPILL_ID_PATTERN = re.compile(r"(?P<table>[A-Za-z0-9_.-]{3,255})-\d{8}T\d{6}-[0-9a-f]{8}\.jsonl")
+
+
+def spill_directory(spill_dir: str | None = None) -> Path:
+    return Path(spill_dir or os.getenv("AWS_MCP_DYNAMODB_SPILL_DIR", str(DEFAULT_SPILL_DIR)))
+
+
+def spill_write_requests(table_name: str, requests: list[dict], spill_dir: str | None = None) -> str:
+    """Save failed write requests to a new JSONL spill file and return its spill id"""
+    directory = spill_directory(spill_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    spill_id = f"{table_name}-{time.strftime('%Y%m%dT%H%M%S', time.gmtime())}-{secrets.token_hex(4)}.jsonl"
+    with open(directory / spill_id, "x") as f:
+        for request in requests:
+            f.write(json.dumps(request, default=str) + "\n")
+    return spill_id
+
+
+def resolve_spill_id(table_name: str, spill_id: str, spill_dir: str | None = None) -> Path:
+    """Path of a spill file written for table_name
+
+    Only ids spill_write_requests produces are accepted, and the resolved
+    path (following symlinks) must stay inside the spill directory.
+    """
+    match = SPILL_ID_PATTERN.fullmatch(spill_id)
+    if not match:
+        raise ValueError(f"Invalid spill id: {spill_id}")
+    if match["table"] != table_name:
+        raise ValueError(f"Spill id {spill_id} was not written for table {table_name}")
+    directory = os.path.realpath(spill_directory(spill_dir))
+    path = os.path.realpath(os.path.join(directory, spill_id))
+    if os.path.dirname(path) != directory:
+        raise ValueError(f"Spill id {spill_id} resolves outside the spill directory")
+    if not os.path.isfile(path):
+        raise ValueError(f"Unknown spill id: {spill_id}")
+    return Path(path)
+
+
+def load_spilled_requests(path: str | Path) -> list[dict]:
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def batch_write(
+    client,
+    table_name: str,
+    requests: list[dict],
+    key_attributes: list[str] | None = None,
+    max_concurrency: int | None = None,
+    max_attempts: int | None = None,
+    spill: bool = True
+) -> dict:
+    """Write requests with several batch_write_item calls in flight
+
+    Duplicate keys are collapsed first. UnprocessedItems and throttling
+    errors are retried with shared adaptive backoff; requests still failing
+    after max_attempts are saved to a new spill file for later replay.
+    """
+    started = time.monotonic()
+    if key_attributes is None:
+        key_schema = client.describe_table(TableName=table_name)["Table"]["KeySchema"]
+        key_attributes = [key["AttributeName"] for key in key_schema]
+    unique = dedupe_write_requests(requests, key_attributes)
+    max_attempts = max_attempts or DEFAULT_WRITE_ATTEMPTS
+    backoff = AdaptiveBackoff()
+    lock = threading.Lock()
+    stats = {"processed": 0, "retries": 0, "throttled": 0}
+    failed: list[dict] = []
+    errors: list[str] = []
+
+    def write_batch(batch: list[dict]) -> None:
+        pending = batch
+        for attempt in range(1, max_attempts + 1):
+            delay = backoff.delay()
+            if delay:
+                time.sleep(delay)
+            try:
+                response = client.batch_write_item(RequestItems={table_name: pending})
+            except client.exceptions.ClientError as e:
+                code = e.response.get("Error", {}).get("Code")
+                if code not in THROTTLING_ERRORS:
+                    with lock:
+                        failed.extend(pending)
+                        errors.append(str(e))
+                    return
+                backoff.throttled()
+                with lock:
+                    stats["throttled"] += 1
+                    stats["retries"] += 1
+                continue
+
+            unprocessed = response.get("UnprocessedItems", {}).get(table_name, [])
+            with lock:
+                stats["processed"] += len(pending) - len(unprocessed)
+            if not unprocessed:
+                backoff.succeeded()
+                return
+            backoff.throttled()
+            pending = unprocessed
+            if attempt < max_attempts:
+                with lock:
+                    stats["retries"] += 1
+
+        with lock:
+            failed.extend(pending)
+
+    batches = [unique[i:i + BATCH_WRITE_SIZE] for i in range(0, len(unique), BATCH_WRITE_SIZE)]
+    workers = max(1, min(max_concurrency or DEFAULT_WRITE_CONCURRENCY, len(batches) or 1))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aws-mcp-ddb-write") as pool:
+        for future in [pool.submit(write_batch, batch) for batch in batches]:
+            future.result()
+
+    spill_id = spill_write_requests(table_name, failed) if failed and spill else None
+    return {
+        "total_items": len(requests),
+        "duplicates_removed": len(requests) - len(unique),
+        "processed_items": stats["processed"],
+        "failed_items": len(failed),
+        "failed_items_details": failed if failed else None,
+        "errors": errors[:10] if errors else None,
+        "spill_id": spill_id,
+        "spill_file": str(spill_directory() / spill_id) if spill_id else None,
+        "batches": len(batches),
+        "retries": stats["retries"],
+        "throttled_requests": stats["throttled"],
+        "elapsed_seconds": round(time.monotonic() - started, 3)
+    }
+
+
+BATCH_GET_SIZE = 100
+DEFAULT_READ_CONCURRENCY = 4
+DEFAULT_READ_ATTEMPTS = 8
+
+
+def _key_signature(key: dict) -> tuple:
+    """Hashable form of a primary key; numbers are normalized as DynamoDB returns them"""
+    signature = []
+    for name, value in sorted(key.items()):
+        (tag, raw), = value.items()
+        if tag == "N":
+            raw = str(Decimal(raw).normalize())
+        signature.append((name, tag, raw))
+    return tuple(signature)
+
+
+def _include_key_attributes(request: dict, key_names: list[str]) -> None:
+    """Make sure a projected read still returns the key attributes
+
+    Results are matched back to the requested keys by their key attributes,
+    so any the projection leaves out are appended. They stay in the
+    results, so every item shows which key it answers.
+    """
+    expression = request.get("ProjectionExpression")
+    if not expression:
+        return
+    names = dict(request.get("ExpressionAttributeNames", {}))
+    projected = set()
+    for path in expression.split(","):
+        top_level = re.split(r"[.\[]", path.strip(), maxsplit=1)[0]
+        projected.add(names.get(top_level, top_level))
+    added = [name for name in key_names if name not in projected]
+    if added:
+        for i, name in enumerate(added):
+            names[f"#bgkey{i}"] = name
+        request["ProjectionExpression"] = ", ".join([expression] + [f"#bgkey{i}" for i in range(len(added))])
+        request["ExpressionAttributeNames"] = names
+
+
+def batch_get(
+    client,
+    request_items: dict,
+    max_concurrency: int | None = None,
+    max_attempts: int | None = None
+) -> dict:
+    """Read any number of keys with concurrent 100-key batch_get_item calls
+
+    Duplicate keys are requested once. UnprocessedKeys and throttling
+    errors are retried with shared adaptive backoff, and each table's items
+    come back in the order their keys were first requested, always with
+    their key attributes, even under a projection. Keys that do
+    not exist are listed under MissingKeys; keys still unread after
+    max_attempts are returned under UnprocessedKeys.
+    """
+    started = time.monotonic()
+    max_attempts = max_attempts or DEFAULT_READ_ATTEMPTS
+    backoff = AdaptiveBackoff()
+    lock = threading.Lock()
+    stats = {"requests": 0, "retries": 0, "throttled": 0, "consumed": 0.0}
+    errors: list[str] = []
+
+    table_options: dict[str, dict] = {}
+    ordered: dict[str, list[tuple]] = {}
+    keys_by_signature: dict[str, dict[tuple, dict]] = {}
+    found: dict[str, dict[tuple, dict]] = {}
+    unprocessed: dict[str, list[dict]] = {}
+    requested = 0
+    for table, request in request_items.items():
+        options = {k: v for k, v in request.items() if k != "Keys"}
+        keys_by_signature[table] = {}
+        for key in request["Keys"]:
+            requested += 1
+            keys_by_signature[table].setdefault(_key_signature(key), key)
+        ordered[table] = list(keys_by_signature[table])
+        key_names = sorted({name for key in request["Keys"] for name in key})
+        _include_key_attributes(options, key_names)
+        table_options[table] = options
+        found[table] = {}
+
+    units = [(table, key) for table in ordered for key in keys_by_signature[table].values()]
+    chunks = [units[i:i + BATCH_GET_SIZE] for i in range(0, len(units), BATCH_GET_SIZE)]
+
+    def read_chunk(chunk: list[tuple[str, dict]]) -> None:
+        pending: dict[str, list[dict]] = {}
+        for table, key in chunk:
+            pending.setdefault(table, []).append(key)
+        for attempt in range(1, max_attempts + 1):
+            delay = backoff.delay()
+            if delay:
+                time.sleep(delay)
+            try:
+                response = client.batch_get_item(
+                    RequestItems={
+                        table: {**table_options[table], "Keys": keys}
+                        for table, keys in pending.items()
+                    },
+                    ReturnConsumedCapacity="TOTAL"
+                )
+            except client.exceptions.ClientError as e:
+                code = e.response.get("Error", {}).get("Code")
+                if code not in THROTTLING_ERRORS:
+                    with lock:
+                        errors.append(str(e))
+                    break
+                backoff.throttled()
+                with lock:
+                    stats["throttled"] += 1
+                    stats["retries"] += 1
+                continue
+
+            with lock:
+                stats["requests"] += 1
+                stats["consumed"] += _consumed_units(response)
+                for table, items in response.get("Responses", {}).items():
+                    names = keys_by_signature[table][next(iter(keys_by_signature[table]))].keys()
+                    for item in items:
+                        found[table][_key_signature({name: item[name] for name in names})] = item
+            pending = {
+                table: request["Keys"]
+                for table, request in response.get("UnprocessedKeys", {}).items()
+                if request.get("Keys")
+            }
+            if not pending:
+                backoff.succeeded()
+                return
+            backoff.throttled()
+            if attempt < max_attempts:
+                with lock:
+                    stats["retries"] += 1
+
+        with lock:
+            for table, keys in pending.items():
+                unprocessed.setdefault(table, []).extend(keys)
+
+    workers = max(1, min(max_concurrency or DEFAULT_READ_CONCURRENCY, len(chunks) or 1))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aws-mcp-ddb-read") as pool:
+        for future in [pool.submit(read_chunk, chunk) for chunk in chunks]:
+            future.result()
+
+    unread = {
+        table: {_key_signature(key) for key in keys}
+        for table, keys in unprocessed.items()
+    }
+    responses, missing = {}, {}
+    for table, signatures in ordered.items():
+        items = []
+        for signature in signatures:
+            item = found[table].get(signature)
+            if item is None:
+                if signature not in unread.get(table, ()):
+                    missing.setdefault(table, []).append(keys_by_signature[table][signature])
+                continue
+            items.append(item)
+        responses[table] = items
+
+    return {
+        "Responses": responses,
+        "MissingKeys": missing,
+        "UnprocessedKeys": {table: {"Keys": keys} for table, keys in unprocessed.items()},
+        "RequestedKeys": requested,
+        "DuplicateKeysRemoved": requested - len(units),
+        "Requests": stats["requests"],
+        "Retries": stats["retries"],
+        "ThrottledRequests": stats["throttled"],
+        "ConsumedCapacityUnits": stats["consumed"],
+        "Errors": errors[:10] if errors else None,
+        "ElapsedSeconds": round(time.monotonic() - started, 3)
+    }
+
+
+BATCH_STATEMENT_SIZE = 25
+DEFAULT_STATEMENT_CONCURRENCY = 4
+DEFAULT_STATEMENT_ATTEMPTS = 8
+RETRYABLE_STATEMENT_ERRORS = {
+    "ProvisionedThroughputExceeded",
+    "ThrottlingError",
+    "RequestLimitExceeded",
+    "InternalServerError",
+}
+
+
+def _is_select(statement: str) -> bool:
+    return statement.lstrip().upper().startswith("SELECT")
+
+
+def _call_with_retries(client, method, backoff: AdaptiveBackoff, max_attempts: int, stats: dict, lock, **kwargs):
+    """Call a DynamoDB method, retrying throttling errors with shared backoff"""
+    for attempt in range(1, max_attempts + 1):
+        delay = backoff.delay()
+        if delay:
+            time.sleep(delay)
+        try:
+            response = method(**kwargs)
+        except client.exceptions.ClientError as e:
+            code = e.response.get("Error", {}).get("Code")
+            if code not in THROTTLING_ERRORS or attempt == max_attempts:
+                raise
+            backoff.throttled()
+            with lock:
+                stats["throttled"] += 1
+                stats["retries"] += 1
+            continue
+        backoff.succeeded()
+        return response
+
+
+def execute_paginated(
+    client,
+    statement: str,
+    parameters: list | None = None,
+    limit: int | None = None,
+    next_token: str | None = None,
+    consistent_read: bool = False,
+    backoff: AdaptiveBackoff | None = None,
+    max_attempts: int | None = None,
+    stats: dict | None = None,
+    lock=None
+) -> dict:
+    """Run a PartiQL SELECT through execute_statement, following NextToken
+
+    Pages are read until the results run out or limit items have been
+    collected; a NextToken is returned when more remain.
+    """
+    backoff = backoff or AdaptiveBackoff()
+    stats = stats if stats is not None else {"retries": 0, "throttled": 0, "consumed": 0.0}
+    lock = lock or threading.Lock()
+    items: list[dict] = []
+    pages = 0
+    while True:
+        params = {"Statement": statement, "ReturnConsumedCapacity": "TOTAL"}
+        if parameters:
+            params["Parameters"] = parameters
+        if consistent_read:
+            params["ConsistentRead"] = True
+        if next_token:
+            params["NextToken"] = next_token
+        if limit:
+            params["Limit"] = limit - len(items)
+        response = _call_with_retries(
+            client, client.execute_statement, backoff, max_attempts or DEFAULT_STATEMENT_ATTEMPTS,
+            stats, lock, **params)
+        pages += 1
+        with lock:
+            stats["consumed"] += _consumed_units(response)
+        items.extend(response.get("Items", []))
+        next_token = response.get("NextToken")
+        if not next_token or (limit and len(items) >= limit):
+            break
+    return {"Items": items, "Count": len(items), "Pages": pages, "NextToken": next_token}
+
+
+def batch_execute(
+    client,
+    statements: list[str],
+    parameters: list[list] | None = None,
+    max_concurrency: int | None = None,
+    max_attempts: int | None = None,
+    paginate_selects: bool = False,
+    limit: int | None = None,
+    consistent_read: bool = False
+) -> dict:
+    """Run any number of PartiQL statements with concurrent batch calls
+
+    Statements are sent in 25-statement batch_execute_statement chunks on a
+    bounded pool, and statements failing with a throttling error are
+    retried with shared adaptive backoff. With paginate_selects, SELECTs
+    run through execute_statement instead, so they are not limited to
+    single-item reads and return every page up to limit. Responses are in
+    statement order.
+    """
+    started = time.monotonic()
+    parameters = parameters or []
+    if len(parameters) > len(statements):
+        raise ValueError("More parameter lists than statements")
+    max_attempts = max_attempts or DEFAULT_STATEMENT_ATTEMPTS
+    backoff = AdaptiveBackoff()
+    lock = threading.Lock()
+    stats = {"retries": 0, "throttled": 0, "consumed": 0.0, "requests": 0}
+    responses: list[dict | None] = [None] * len(statements)
+
+    def request(index: int) -> dict:
+        entry = {"Statement": statements[index]}
+        if index < len(parameters) and parameters[index]:
+            entry["Parameters"] = parameters[index]
+        if consistent_read:
+            entry["ConsistentRead"] = True
+        return entry
+
+    def run_select(index: int) -> None:
+        try:
+            responses[index] = execute_paginated(
+                client, statements[index], request(index).get("Parameters"),
+                limit=limit, consistent_read=consistent_read, backoff=backoff,
+                max_attempts=max_attempts, stats=stats, lock=lock)
+        except client.exceptions.ClientError as e:
+            error = e.response.get("Error", {})
+            responses[index] = {"Error": {"Code": error.get("Code"), "Message": error.get("Message")}}
+
+    def run_chunk(indexes: list[int]) -> None:
+        pending = indexes
+        for attempt in range(1, max_attempts + 1):
+            try:
+                response = _call_with_retries(
+                    client, client.batch_execute_statement, backoff, max_attempts, stats, lock,
+                    Statements=[request(index) for index in pending],
+                    ReturnConsumedCapacity="TOTAL")
+            except client.exceptions.ClientError as e:
+                error = e.response.get("Error", {})
+                for index in pending:
+                    responses[index] = {"Error": {"Code": error.get("Code"), "Message": error.get("Message")}}
+                return
+            with lock:
+                stats["requests"] += 1
+                stats["consumed"] += _consumed_units(response)
+            retry = []
+            for index, result in zip(pending, response.get("Responses", [])):
+                responses[index] = result
+                if result.get("Error", {}).get("Code") in RETRYABLE_STATEMENT_ERRORS:
+                    retry.append(index)
+            if not retry or attempt == max_attempts:
+                return
+            backoff.throttled()
+            with lock:
+                stats["retries"] += 1
+            pending = retry
+            delay = backoff.delay()
+            if delay:
+                time.sleep(delay)
+
+    selects = [i for i, statement in enumerate(statements) if paginate_selects and _is_select(statement)]
+    batched = [i for i in range(len(statements)) if not (paginate_selects and _is_select(statements[i]))]
+    chunks = [batched[i:i + BATCH_STATEMENT_SIZE] for i in range(0, len(batched), BATCH_STATEMENT_SIZE)]
+    workers = max(1, min(max_concurrency or DEFAULT_STATEMENT_CONCURRENCY, len(chunks) + len(selects) or 1))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aws-mcp-ddb-partiql") as pool:
+        futures = [pool.submit(run_chunk, chunk) for chunk in chunks]
+        futures += [pool.submit(run_select, index) for index in selects]
+        for future in futures:
+            future.result()
+
+    failed = sum(1 for response in responses if response and "Error" in response)
+    return {
+        "Responses": responses,
+        "Succeeded": len(statements) - failed,
+        "Failed": failed,
+        "Chunks": len(chunks),
+        "PaginatedSelects": len(selects),
+        "Retries": stats["retries"],
+        "ThrottledRequests": stats["throttled"],
+        "ConsumedCapacityUnits": stats["consumed"],
+        "ElapsedSeconds": round(time.monotonic() - started, 3)
+    }
@@ -0,0 +1,303 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .dynamodb import THROTTLING_ERRORS, AdaptiveBackoff, CapacityLimiter
+from .utils import encode_cursor, decode_cursor
+
+INSTANCE_STATES = ("pending", "running", "shutting-down", "terminated", "stopping", "stopped")
+# describe_instances accepts MaxResults between 5 and 1000
+MIN_PAGE_SIZE = 5
+MAX_PAGE_SIZE = 1000
+
+
+def instance_filters(
+    filters: list[dict] | None = None,
+    states: list[str] | None = None,
+    tags: dict | None = None
+) -> list[dict]:
+    """Compile state and tag shortcuts into describe_instances filters
+
+    tags maps a tag key to a value, a list of accepted values, or None
+    (or "*") to only require the key. Every filter is evaluated by EC2,
+    so non-matching instances never leave AWS.
+    """
+    filters = list(filters or [])
+    if states:
+        unknown = set(states) - set(INSTANCE_STATES)
+        if unknown:
+            raise ValueError(f"Unknown instance states: {', '.join(sorted(unknown))}")
+        filters.append({"Name": "instance-state-name", "Values": list(states)})
+    for key, value in (tags or {}).items():
+        if value is None or value == "*":
+            filters.append({"Name": "tag-key", "Values": [key]})
+        else:
+            filters.append({"Name": f"tag:{key}", "Values": value if isinstance(value, list) else [value]})
+    return filters
+
+
+def summarize_instance(instance: dict) -> dict:
+    """Flatten an instance to the fields an inventory needs"""
+    tags = {tag["Key"]: tag["Value"] for tag in instance.get("Tags", [])}
+    return {
+        "InstanceId": instance["InstanceId"],
+        "Name": tags.get("Name"),
+        "State": instance.get("State", {}).get("Name"),
+        "InstanceType": instance.get("InstanceType"),
+        "PrivateIpAddress": instance.get("PrivateIpAddress"),
+        "PublicIpAddress": instance.get("PublicIpAddress"),
+        "AvailabilityZone": instance.get("Placement", {}).get("AvailabilityZone"),
+        "VpcId": instance.get("VpcId"),
+        "SubnetId": instance.get("SubnetId"),
+        "LaunchTime": instance.get("LaunchTime"),
+        "Tags": tags,
+    }
+
+
+def describe_instances(
+    client,
+    filters: list[dict],
+    max_results: int | None = None,
+    max_instances: int | None = None,
+    next_token: str | None = None,
+    summary: bool = False
+) -> dict:
+    """Page through describe_instances until every match or max_instances is read
+
+    Pages hold up to max_results instances (1000 by default). Near
+    max_instances the page size shrinks to what is still needed; a page
+    that still holds more (EC2 returns at least 5 instances) is cut at
+    max_instances. NextToken is then a cursor that replays the cut page
+    with the same page size and skips the instances already returned, so
+    a resumed listing continues right after the last instance returned.
+    With summary the Reservations tree is replaced by a flat Instances
+    list of summarize_instance views.
+    """
+    if max_instances is not None and max_instances < 1:
+        raise ValueError("max_instances must be at least 1")
+    page_size = min(max(max_results or MAX_PAGE_SIZE, MIN_PAGE_SIZE), MAX_PAGE_SIZE)
+    state = decode_cursor(next_token) if next_token else {"token": None, "skip": 0}
+    token, skip, replay_size = state["token"], state["skip"], state.get("page_size")
+    request = {"Filters": filters}
+
+    reservations: list[dict] = []
+    count = 0
+    pages = 0
+    cursor = None
+    while True:
+        if replay_size:
+            request["MaxResults"], replay_size = replay_size, None
+        elif max_instances:
+            request["MaxResults"] = max(min(page_size, max_instances - count), MIN_PAGE_SIZE)
+        else:
+            request["MaxResults"] = page_size
+        if token:
+            request["NextToken"] = token
+        page = client.describe_instances(**request)
+        pages += 1
+
+        # Instances of this page returned so far, including those skipped on a replay
+        taken = 0
+        cut = False
+        for reservation in page.get("Reservations", []):
+            instances = reservation.get("Instances", [])
+            start = min(max(skip - taken, 0), len(instances))
+            kept = instances[start:]
+            if max_instances and count + len(kept) > max_instances:
+                kept = kept[:max_instances - count]
+                cut = True
+            taken += start + len(kept)
+            if kept:
+                reservations.append(reservation if len(kept) == len(instances) else {**reservation, "Instances": kept})
+                count += len(kept)
+            if cut:
+                break
+
+        if cut:
+            cursor = encode_cursor({"token": token, "page_size": request["MaxResults"], "skip": taken})
+            break
+        skip = 0
+        token = page.get("NextToken")
+        if not token:
+            break
+        if max_instances and count >= max_instances:
+            cursor = encode_cursor({"token": token, "skip": 0})
+            break
+
+    response = {"Count": count, "Pages": pages, "NextToken": cursor}
+    if summary:
+        response["Instances"] = [
+            summarize_instance(instance)
+            for reservation in reservations
+            for instance in reservation.get("Instances", [])
+        ]
+    else:
+        response["Reservations"] = reservations
+    return response
+
+
+STATE_CHANGE_CHUNK_SIZE = 50
+DEFAULT_STATE_CHANGE_CONCURRENCY = 4
+DEFAULT_STATE_CHANGE_RATE = 5.0
+DEFAULT_STATE_CHANGE_ATTEMPTS = 5
+DEFAULT_WAIT_TIMEOUT = 600
+DEFAULT_POLL_INTERVAL = 5.0
+# describe_instance_status accepts at most 100 explicit instance IDs
+STATUS_BATCH_SIZE = 100
+
+STATE_CHANGES = {
+    "start": ("start_instances", "StartingInstances", "running"),
+    "stop": ("stop_instances", "StoppingInstances", "stopped"),
+}
+# States an instance cannot leave towards the target, so waiting is pointless
+DEAD_END_STATES = {"shutting-down", "terminated"}
+
+
+def change_instance_states(
+    client,
+    action: str,
+    instance_ids: list[str],
+    chunk_size: int | None = None,
+    max_concurrency: int | None = None,
+    requests_per_second: float | None = None,
+    wait: bool = False,
+    wait_timeout: float | None = None,
+    poll_interval: float | None = None,
+    progress=None
+) -> dict:
+    """Start or stop any number of instances and optionally wait for the target state
+
+    IDs are sent in chunks with several requests in flight, all drawn from
+    one requests_per_second budget. A chunk rejected as a whole (e.g. over
+    one unknown ID) is retried ID by ID, so every instance gets its own
+    outcome. With wait, a single describe_instance_status poller tracks
+    every pending instance, 100 IDs per call, until each one reaches the
+    target state, hits a dead end or wait_timeout passes.
+    """
+    method_name, changes_key, target = STATE_CHANGES[action]
+    method = getattr(client, method_name)
+    started = time.monotonic()
+    ids = list(dict.fromkeys(instance_ids))
+    chunk_size = min(chunk_size or STATE_CHANGE_CHUNK_SIZE, 1000)
+    limiter = CapacityLimiter(requests_per_second or DEFAULT_STATE_CHANGE_RATE)
+    backoff = AdaptiveBackoff()
+    lock = threading.Lock()
+    stats = {"requests": 0, "retries": 0, "throttled": 0}
+    changes: list[dict] = []
+    outcomes = {instance_id: {"InstanceId": instance_id, "Outcome": "not-requested"} for instance_id in ids}
+
+    def call(func, **kwargs):
+        for attempt in range(1, DEFAULT_STATE_CHANGE_ATTEMPTS + 1):
+            delay = backoff.delay()
+            if delay:
+                time.sleep(delay)
+            limiter.acquire()
+            limiter.consume(1)
+            with lock:
+                stats["requests"] += 1
+            try:
+                response = func(**kwargs)
+            except client.exceptions.ClientError as e:
+                if e.response.get("Error", {}).get("Code") not in THROTTLING_ERRORS or attempt == DEFAULT_STATE_CHANGE_ATTEMPTS:
+                    raise
+                backoff.throttled()
+                with lock:
+                    stats["throttled"] += 1
+                    stats["retries"] += 1
+                continue
+            backoff.succeeded()
+            return response
+
+    def record(change: dict) -> None:
+        outcome = outcomes[change["InstanceId"]]
+        outcome["PreviousState"] = change["PreviousState"]["Name"]
+        outcome["State"] = change["CurrentState"]["Name"]
+        outcome["RequestedAfterSeconds"] = round(time.monotonic() - started, 3)
+        outcome["Outcome"] = "reached" if outcome["State"] == target else "requested"
+        if outcome["Outcome"] == "reached":
+            outcome["Seconds"] = 0.0
+
+    def submit(chunk: list[str]) -> None:
+        try:
+            response = call(method, InstanceIds=chunk)
+        except client.exceptions.ClientError as e:
+            if len(chunk) > 1:
+                for instance_id in chunk:
+                    submit([instance_id])
+                return
+            with lock:
+                outcomes[chunk[0]].update(Outcome="failed", Error=str(e))
+            return
+        with lock:
+            for change in response.get(changes_key, []):
+                changes.append(change)
+                record(change)
+
+    chunks = [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+    workers = max(1, min(max_concurrency or DEFAULT_STATE_CHANGE_CONCURRENCY, len(chunks) or 1))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aws-mcp-ec2-state") as pool:
+        for future in [pool.submit(submit, chunk) for chunk in chunks]:
+            future.result()
+
+    if wait:
+        _wait_for_state(
+            client, call, outcomes, target, started,
+            wait_timeout or DEFAULT_WAIT_TIMEOUT,
+            poll_interval or DEFAULT_POLL_INTERVAL,
+            progress
+        )
+
+    counts: dict[str, int] = {}
+    for outcome in outcomes.values():
+        counts[outcome["Outcome"]] = counts.get(outcome["Outcome"], 0) + 1
+    return {
+        changes_key: changes,
+        "Instances": list(outcomes.values()),
+        "TargetState": target,
+        "Outcomes": counts,
+        "Chunks": len(chunks),
+        "Requests": stats["requests"],
+        "Retries": stats["retries"],
+        "ThrottledRequests": stats["throttled"],
+        "ElapsedSeconds": round(time.monotonic() - started, 3),
+    }
+
+
+def _wait_for_state(client, call, outcomes: dict, target: str, started: float,
+                    wait_timeout: float, poll_interval: float, progress=None) -> None:
+    """Poll describe_instance_status for every pending instance at once"""
+    deadline = time.monotonic() + wait_timeout
+    pending = [i for i, outcome in outcomes.items() if outcome.get("Outcome") == "requested"]
+    total = len(pending)
+    while pending and time.monotonic() < deadline:
+        time.sleep(min(poll_interval, max(deadline - time.monotonic(), 0)))
+        states = {}
+        for i in range(0, len(pending), STATUS_BATCH_SIZE):
+            request = {"InstanceIds": pending[i:i + STATUS_BATCH_SIZE], "IncludeAllInstances": True}
+            while True:
+                page = call(client.describe_instance_status, **request)
+                for status in page.get("InstanceStatuses", []):
+                    states[status["InstanceId"]] = status["InstanceState"]["Name"]
+                if not page.get("NextToken"):
+                    break
+                request["NextToken"] = page["NextToken"]
+
+        elapsed = round(time.monotonic() - started, 3)
+        still_pending = []
+        for instance_id in pending:
+            outcome = outcomes[instance_id]
+            state = states.get(instance_id, outcome["State"])
+            outcome["State"] = state
+            if state == target:
+                outcome["Outcome"] = "reached"
+                outcome["Seconds"] = round(elapsed - outcome["RequestedAfterSeconds"], 3)
+            elif state in DEAD_END_STATES:
+                outcome["Outcome"] = "failed"
+                outcome["Error"] = f"Instance is {state}"
+            else:
+                still_pending.append(instance_id)
+        pending = still_pending
+        if progress:
+            progress(total - len(pending), total)
+
+    for instance_id in pending:
+        outcomes[instance_id]["Outcome"] = "timeout"
@@ -0,0 +1,82 @@
+import os
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
+
+logger = logging.getLogger("aws-mcp-server")
+
+DEFAULT_MAX_WORKERS = 32
+
+
+def parse_service_limits(spec: str | None) -> dict[str, int]:
+    """Parse a per-service concurrency spec such as 's3=16,dynamodb=8'"""
+    limits: dict[str, int] = {}
+    if not spec:
+        return limits
+
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        service, sep, value = part.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid service concurrency entry: {part}")
+        limit = int(value)
+        if limit < 1:
+            raise ValueError(f"Concurrency limit for {service} must be at least 1")
+        limits[service.strip()] = limit
+    return limits
+
+
+class AWSExecutor:
+    """Runs blocking boto3 calls on a bounded thread pool
+
+    The pool size is taken from AWS_MCP_MAX_WORKERS and per-service limits
+    from AWS_MCP_SERVICE_CONCURRENCY (e.g. 's3=16,dynamodb=8'). Services
+    without an explicit limit may use the whole pool. A pool size of 0
+    runs every call inline on the event loop.
+    """
+
+    def __init__(self, max_workers: int | None = None, service_limits: dict[str, int] | None = None):
+        if max_workers is None:
+            max_workers = int(os.getenv("AWS_MCP_MAX_WORKERS", DEFAULT_MAX_WORKERS))
+        if max_workers < 0:
+            raise ValueError("AWS_MCP_MAX_WORKERS must not be negative")
+        self.max_workers = max_workers
+        if service_limits is None:
+            service_limits = parse_service_limits(os.getenv("AWS_MCP_SERVICE_CONCURRENCY"))
+        self.service_limits = service_limits
+        self._pool: ThreadPoolExecutor | None = None
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="aws-mcp"
+            )
+        return self._pool
+
+    def _get_semaphore(self, service: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(service)
+        if semaphore is None:
+            limit = min(self.service_limits.get(service, self.max_workers), self.max_workers)
+            semaphore = self._semaphores[service] = asyncio.Semaphore(limit)
+        return semaphore
+
+    async def run(self, service: str, func: Callable[..., Any], /, *args, **kwargs) -> Any:
+        """Run func(*args, **kwargs) in the pool, honouring the service's concurrency limit"""
+        if self.max_workers == 0:
+            return func(*args, **kwargs)
+
+        async with self._get_semaphore(service):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_pool(), partial(func, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
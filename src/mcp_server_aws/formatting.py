@@ -0,0 +1,151 @@
+import os
+import io
+import csv
+import json
+import base64
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+import jmespath
+
+OUTPUT_FORMATS = ("compact", "pretty", "table")
+DEFAULT_OUTPUT_FORMAT = "pretty"
+
+
+def _decimal(obj: Decimal):
+    return int(obj) if obj == obj.to_integral_value() else float(obj)
+
+
+def _bytes(obj: bytes) -> str:
+    return base64.b64encode(obj).decode()
+
+
+# Exact-type lookup first; isinstance checks only for subclasses
+_SERIALIZERS = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    Decimal: _decimal,
+    bytes: _bytes,
+    bytearray: _bytes,
+    set: list,
+    frozenset: list,
+}
+
+
+def custom_json_serializer(obj):
+    serializer = _SERIALIZERS.get(type(obj))
+    if serializer is not None:
+        return serializer(obj)
+    for obj_type, serializer in _SERIALIZERS.items():
+        if isinstance(obj, obj_type):
+            return serializer(obj)
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+_compact_encoder = json.JSONEncoder(separators=(",", ":"), default=custom_json_serializer)
+_pretty_encoder = json.JSONEncoder(indent=2, default=custom_json_serializer)
+
+
+def default_output_format() -> str:
+    output_format = os.getenv("AWS_MCP_OUTPUT_FORMAT", DEFAULT_OUTPUT_FORMAT)
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format: {output_format}")
+    return output_format
+
+
+def _find_rows(response) -> list:
+    """Pick the list a tabular view should be built from: the largest top-level list"""
+    if isinstance(response, list):
+        return response
+    if isinstance(response, dict):
+        lists = [value for value in response.values() if isinstance(value, list)]
+        if lists:
+            return max(lists, key=len)
+    return [response]
+
+
+def _flatten(value, prefix: str, row: dict) -> None:
+    if isinstance(value, dict) and value:
+        for key, child in value.items():
+            _flatten(child, f"{prefix}.{key}" if prefix else str(key), row)
+    elif isinstance(value, (list, dict)):
+        row[prefix] = _compact_encoder.encode(value)
+    elif isinstance(value, (str, int, float, bool)) or value is None:
+        row[prefix or "value"] = value
+    else:
+        row[prefix or "value"] = custom_json_serializer(value)
+
+
+def to_table(response) -> str:
+    """Project a response onto CSV, one row per entry of its main list"""
+    rows = []
+    for entry in _find_rows(response):
+        row: dict = {}
+        _flatten(entry, "", row)
+        rows.append(row)
+    if not rows:
+        return ""
+
+    columns = list(dict.fromkeys(column for row in rows for column in row))
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=256)
+def _compile_query(query: str):
+    try:
+        return jmespath.compile(query)
+    except jmespath.exceptions.ParseError as e:
+        raise ValueError(f"Invalid JMESPath query {query!r}: {e}")
+
+
+def _select(value, paths: list[list[str]]):
+    """Keep only the given dotted paths, mapping over lists along the way"""
+    if isinstance(value, list):
+        return [_select(entry, paths) for entry in value]
+    if not isinstance(value, dict):
+        return value
+
+    grouped: dict[str, list[list[str]]] = {}
+    for path in paths:
+        if path[0] in value:
+            grouped.setdefault(path[0], []).append(path[1:])
+
+    selected = {}
+    for key, rests in grouped.items():
+        if any(not rest for rest in rests):
+            selected[key] = value[key]
+        else:
+            selected[key] = _select(value[key], rests)
+    return selected
+
+
+def project_response(response, query: str | None = None, fields: list[str] | None = None, include_metadata: bool = False):
+    """Trim a response before serialization
+
+    ResponseMetadata is dropped unless include_metadata is set, fields keeps
+    only the listed dotted paths (e.g. "Functions.FunctionName") and query
+    applies a JMESPath expression to what remains.
+    """
+    if isinstance(response, dict) and not include_metadata and "ResponseMetadata" in response:
+        response = {k: v for k, v in response.items() if k != "ResponseMetadata"}
+    if fields:
+        response = _select(response, [field.split(".") for field in fields])
+    if query:
+        response = _compile_query(query).search(response)
+    return response
+
+
+def serialize_response(response, output_format: str | None = None) -> str:
+    """Render a response as compact JSON, pretty JSON or a CSV table"""
+    output_format = output_format or default_output_format()
+    if output_format == "compact":
+        return _compact_encoder.encode(response)
+    if output_format == "pretty":
+        return _pretty_encoder.encode(response)
+    if output_format == "table":
+        return to_table(response)
+    raise ValueError(f"Unsupported output format: {output_format}")
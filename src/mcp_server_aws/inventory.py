@@ -0,0 +1,328 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from .ec2 import describe_instances
+
+logger = logging.getLogger("aws-mcp-server")
+
+DEFAULT_STATE_INTERVAL = 30
+DEFAULT_FULL_INTERVAL = 300
+# Summary fields with an exact-match index; tags are indexed separately
+INDEXED_FIELDS = ("State", "InstanceType", "VpcId", "SubnetId", "AvailabilityZone")
+# describe_instances filters accept up to 200 values
+NEW_INSTANCE_BATCH_SIZE = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ec2_instances (
+    region TEXT NOT NULL,
+    instance_id TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (region, instance_id)
+);
+CREATE TABLE IF NOT EXISTS ec2_inventory_sync (
+    region TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL,
+    states_synced_at REAL NOT NULL
+);
+"""
+
+
+def _normalize(instance: dict) -> dict:
+    # Stored as text so snapshots loaded back from SQLite compare equal
+    launch_time = instance.get("LaunchTime")
+    if isinstance(launch_time, datetime):
+        return {**instance, "LaunchTime": launch_time.isoformat()}
+    return instance
+
+
+def _any(values) -> list:
+    if values is None:
+        return []
+    return values if isinstance(values, list) else [values]
+
+
+class InstanceInventory:
+    """Indexed snapshot of one region's instances
+
+    Instances are kept as summarize_instance views with set indexes on
+    state, type, VPC, subnet, AZ, tag key and tag key/value, so a query
+    only intersects the sets its filters name. Refreshes apply a diff and
+    only re-index instances that changed.
+    """
+
+    def __init__(self, region: str):
+        self.region = region
+        self.synced_at: float | None = None
+        self.states_synced_at: float | None = None
+        self._instances: dict[str, dict] = {}
+        self._indexes: dict[str, dict[str, set[str]]] = {field: {} for field in INDEXED_FIELDS}
+        self._tags: dict[tuple[str, str], set[str]] = {}
+        self._tag_keys: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def _index_entries(self, instance: dict):
+        for field in INDEXED_FIELDS:
+            yield self._indexes[field], instance.get(field)
+        for key, value in instance.get("Tags", {}).items():
+            yield self._tags, (key, value)
+            yield self._tag_keys, key
+
+    def _put(self, instance: dict) -> bool:
+        instance_id = instance["InstanceId"]
+        old = self._instances.get(instance_id)
+        if old == instance:
+            return False
+        if old is not None:
+            self._remove(instance_id)
+        self._instances[instance_id] = instance
+        for index, value in self._index_entries(instance):
+            index.setdefault(value, set()).add(instance_id)
+        return True
+
+    def _remove(self, instance_id: str) -> None:
+        instance = self._instances.pop(instance_id)
+        for index, value in self._index_entries(instance):
+            ids = index.get(value)
+            if ids is not None:
+                ids.discard(instance_id)
+                if not ids:
+                    del index[value]
+
+    def apply(self, instances: list[dict], complete: bool) -> dict:
+        """Merge instances into the index; complete snapshots also drop the ones missing"""
+        stats = {"added": 0, "updated": 0, "removed": 0}
+        with self._lock:
+            seen = set()
+            for instance in map(_normalize, instances):
+                seen.add(instance["InstanceId"])
+                existed = instance["InstanceId"] in self._instances
+                if self._put(instance):
+                    stats["updated" if existed else "added"] += 1
+            if complete:
+                for instance_id in set(self._instances) - seen:
+                    self._remove(instance_id)
+                    stats["removed"] += 1
+        return stats
+
+    def full_refresh(self, client) -> dict:
+        """Re-read every instance of the region"""
+        started = time.time()
+        response = describe_instances(client, [], summary=True)
+        stats = self.apply(response["Instances"], complete=True)
+        self.synced_at = self.states_synced_at = started
+        return stats
+
+    def state_refresh(self, client) -> dict:
+        """Cheap incremental pass: update states from describe_instance_status
+
+        Only instances whose state changed are re-indexed, instances that
+        disappeared are dropped and unknown IDs are described in full.
+        """
+        started = time.time()
+        states = {}
+        request = {"IncludeAllInstances": True, "MaxResults": 1000}
+        while True:
+            page = client.describe_instance_status(**request)
+            for status in page.get("InstanceStatuses", []):
+                states[status["InstanceId"]] = status["InstanceState"]["Name"]
+            if not page.get("NextToken"):
+                break
+            request["NextToken"] = page["NextToken"]
+
+        with self._lock:
+            known = dict(self._instances)
+        updated = [
+            dict(known[instance_id], State=state)
+            for instance_id, state in states.items()
+            if instance_id in known and known[instance_id]["State"] != state
+        ]
+        new_ids = [instance_id for instance_id in states if instance_id not in known]
+        for i in range(0, len(new_ids), NEW_INSTANCE_BATCH_SIZE):
+            filters = [{"Name": "instance-id", "Values": new_ids[i:i + NEW_INSTANCE_BATCH_SIZE]}]
+            updated.extend(describe_instances(client, filters, summary=True)["Instances"])
+
+        stats = self.apply(updated, complete=False)
+        with self._lock:
+            for instance_id in set(known) - set(states):
+                if instance_id in self._instances:
+                    self._remove(instance_id)
+                    stats["removed"] += 1
+        self.states_synced_at = started
+        return stats
+
+    def query(
+        self,
+        states: list[str] | None = None,
+        instance_types: list[str] | None = None,
+        vpc_ids: list[str] | None = None,
+        subnet_ids: list[str] | None = None,
+        availability_zones: list[str] | None = None,
+        tags: dict | None = None,
+        limit: int | None = None
+    ) -> list[dict]:
+        """Instances matching every given filter; each filter accepts any of its values"""
+        with self._lock:
+            candidates = []
+            for field, values in zip(INDEXED_FIELDS, (states, instance_types, vpc_ids, subnet_ids, availability_zones)):
+                if values:
+                    index = self._indexes[field]
+                    candidates.append(set().union(*(index.get(value, ()) for value in _any(values))))
+            for key, values in (tags or {}).items():
+                if values is None or values == "*":
+                    candidates.append(self._tag_keys.get(key, set()))
+                else:
+                    candidates.append(set().union(*(self._tags.get((key, value), ()) for value in _any(values))))
+
+            if candidates:
+                candidates.sort(key=len)
+                ids = candidates[0].intersection(*candidates[1:])
+            else:
+                ids = self._instances.keys()
+            matches = [self._instances[instance_id] for instance_id in sorted(ids)]
+        return matches[:limit] if limit else matches
+
+    def staleness(self) -> dict:
+        now = time.time()
+        return {
+            "SyncedAt": datetime.fromtimestamp(self.synced_at).isoformat() if self.synced_at else None,
+            "StaleSeconds": round(now - self.synced_at, 3) if self.synced_at else None,
+            "StateStaleSeconds": round(now - self.states_synced_at, 3) if self.states_synced_at else None,
+        }
+
+    def snapshot(self) -> list[dict]:
+        with self._lock:
+            return list(self._instances.values())
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+
+class InventoryStore:
+    """SQLite copy of the inventory so a restarted server starts warm"""
+
+    def __init__(self, path: str):
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def save(self, inventory: InstanceInventory) -> None:
+        rows = [
+            (inventory.region, instance["InstanceId"], json.dumps(instance, default=str))
+            for instance in inventory.snapshot()
+        ]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM ec2_instances WHERE region = ?", (inventory.region,))
+            self._conn.executemany("INSERT INTO ec2_instances VALUES (?, ?, ?)", rows)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ec2_inventory_sync VALUES (?, ?, ?)",
+                (inventory.region, inventory.synced_at, inventory.states_synced_at)
+            )
+
+    def load(self, inventory: InstanceInventory) -> bool:
+        with self._lock:
+            sync = self._conn.execute(
+                "SELECT synced_at, states_synced_at FROM ec2_inventory_sync WHERE region = ?",
+                (inventory.region,)
+            ).fetchone()
+            if sync is None:
+                return False
+            rows = self._conn.execute(
+                "SELECT data FROM ec2_instances WHERE region = ?", (inventory.region,)).fetchall()
+        inventory.apply([json.loads(data) for data, in rows], complete=True)
+        inventory.synced_at, inventory.states_synced_at = sync
+        return True
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class EC2Inventory:
+    """Per-region instance inventories kept fresh by a background thread
+
+    A region is swept in full the first time it is queried and then
+    tracked: every AWS_MCP_EC2_INVENTORY_INTERVAL seconds its states are
+    refreshed incrementally and every AWS_MCP_EC2_INVENTORY_FULL_INTERVAL
+    seconds it is swept again to pick up tag and placement changes. With
+    AWS_MCP_EC2_INVENTORY_DB set, snapshots are also kept in SQLite.
+    """
+
+    def __init__(
+        self,
+        get_client,
+        state_interval: float | None = None,
+        full_interval: float | None = None,
+        db_path: str | None = None
+    ):
+        self._get_client = get_client
+        self.state_interval = state_interval or float(
+            os.getenv("AWS_MCP_EC2_INVENTORY_INTERVAL", DEFAULT_STATE_INTERVAL))
+        self.full_interval = full_interval or float(
+            os.getenv("AWS_MCP_EC2_INVENTORY_FULL_INTERVAL", DEFAULT_FULL_INTERVAL))
+        db_path = db_path or os.getenv("AWS_MCP_EC2_INVENTORY_DB")
+        self.store = InventoryStore(db_path) if db_path else None
+        self._regions: dict[str, InstanceInventory] = {}
+        self._refresh_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def refresh(self, region: str, full: bool = True) -> dict:
+        inventory = self._regions[region]
+        with self._refresh_locks[region]:
+            client = self._get_client("ec2", region)
+            if full or inventory.synced_at is None:
+                stats = inventory.full_refresh(client)
+            else:
+                stats = inventory.state_refresh(client)
+        if self.store is not None:
+            self.store.save(inventory)
+        return stats
+
+    def get(self, region: str, max_staleness: float | None = None) -> InstanceInventory:
+        """Return the region's inventory, sweeping it if it is empty or older than max_staleness"""
+        with self._lock:
+            inventory = self._regions.get(region)
+            if inventory is None:
+                inventory = self._regions[region] = InstanceInventory(region)
+                self._refresh_locks[region] = threading.Lock()
+                if self.store is not None:
+                    self.store.load(inventory)
+            self._start()
+
+        stale = inventory.synced_at is None
+        if max_staleness is not None and inventory.synced_at is not None:
+            stale = time.time() - min(inventory.synced_at, inventory.states_synced_at) > max_staleness
+        if stale:
+            self.refresh(region)
+        return inventory
+
+    def _start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="aws-mcp-ec2-inventory", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.state_interval):
+            with self._lock:
+                regions = list(self._regions.items())
+            for region, inventory in regions:
+                if inventory.synced_at is None:
+                    continue
+                full = time.time() - inventory.synced_at >= self.full_interval
+                try:
+                    self.refresh(region, full=full)
+                except Exception as e:
+                    logger.warning(f"EC2 inventory refresh for {region} failed: {e}")
+
+    def close(self) -> None:
+        self._stop.set()
+        if self.store is not None:
+            self.store.close()
@@ -0,0 +1,152 @@
+import gc
+import math
+from contextlib import contextmanager
+from decimal import Decimal
+
+# Batches at least this large are converted with the cyclic GC paused
+GC_PAUSE_MIN_ITEMS = 1000
+
+def _float(value: float) -> dict:
+    if math.isnan(value) or math.isinf(value):
+        raise ValueError(f"DynamoDB numbers cannot be {value}")
+    return {"N": repr(value)}
+
+
+def _set(value) -> dict:
+    if not value:
+        raise ValueError("DynamoDB sets cannot be empty")
+    kinds = {type(v) for v in value}
+    if kinds <= {str}:
+        return {"SS": list(value)}
+    if kinds <= {bytes, bytearray}:
+        return {"BS": [bytes(v) for v in value]}
+    if kinds <= {int, float, Decimal}:
+        return {"NS": [_marshal(v)["N"] for v in value]}
+    raise ValueError(f"Unsupported set member types for DynamoDB: {sorted(k.__name__ for k in kinds)}")
+
+
+_MARSHALLERS = {
+    float: _float,
+    Decimal: lambda value: {"N": str(value)},
+    bytes: lambda value: {"B": value},
+    bytearray: lambda value: {"B": bytes(value)},
+    tuple: lambda value: {"L": [_marshal(v) for v in value]},
+    set: _set,
+    frozenset: _set,
+}
+
+
+def _marshal(value) -> dict:
+    # Exact type checks keep bool out of the int branch; the common JSON types
+    # are tested inline before falling back to the dispatch table
+    value_type = type(value)
+    if value_type is str:
+        return {"S": value}
+    if value_type is bool:
+        return {"BOOL": value}
+    if value_type is int:
+        return {"N": str(value)}
+    if value_type is dict:
+        return {"M": {k: _marshal(v) for k, v in value.items()}}
+    if value_type is list:
+        return {"L": [_marshal(v) for v in value]}
+    if value is None:
+        return {"NULL": True}
+    marshaller = _MARSHALLERS.get(value_type)
+    if marshaller is not None:
+        return marshaller(value)
+    for base in (bool, int, str, dict, list):
+        if isinstance(value, base):
+            return _marshal(base(value))
+    for value_type, marshaller in _MARSHALLERS.items():
+        if isinstance(value, value_type):
+            return marshaller(value)
+    raise ValueError(f"Unsupported type for DynamoDB: {type(value)}")
+
+
+def _number_value(value: str):
+    if "." in value or "e" in value or "E" in value:
+        return Decimal(value)
+    return int(value)
+
+
+def _unmarshal(attribute: dict):
+    (tag, value), = attribute.items()
+    if tag == "S" or tag == "BOOL" or tag == "B":
+        return value
+    if tag == "N":
+        return _number_value(value)
+    if tag == "M":
+        return {k: _unmarshal(v) for k, v in value.items()}
+    if tag == "L":
+        return [_unmarshal(v) for v in value]
+    if tag == "NULL":
+        return None
+    if tag == "SS" or tag == "BS":
+        return set(value)
+    if tag == "NS":
+        return {_number_value(v) for v in value}
+    raise ValueError(f"Unsupported DynamoDB attribute type: {tag}")
+
+
+def marshal_value(value) -> dict:
+    """Convert a plain Python value into a DynamoDB attribute value
+
+    Booleans map to BOOL, ints, floats and Decimals to N, bytes to B and
+    sets to SS, NS or BS depending on their members.
+    """
+    return _marshal(value)
+
+
+def unmarshal_value(attribute: dict):
+    """Convert a DynamoDB attribute value back into a plain Python value
+
+    Integral numbers come back as int and the rest as Decimal so no
+    precision is lost; sets come back as Python sets.
+    """
+    return _unmarshal(attribute)
+
+
+def marshal_item(item: dict) -> dict:
+    return {key: _marshal(value) for key, value in item.items()}
+
+
+def unmarshal_item(item: dict) -> dict:
+    return {key: _unmarshal(value) for key, value in item.items()}
+
+
+@contextmanager
+def _gc_paused(size: int):
+    """Pause the cyclic GC while a large batch is converted
+
+    Converting allocates several dicts per item and the results are
+    acyclic, but the allocations alone keep triggering collections,
+    including full ones that walk the growing result again and again.
+    """
+    if size < GC_PAUSE_MIN_ITEMS or not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def marshal_items(items: list[dict]) -> list[dict]:
+    with _gc_paused(len(items)):
+        return [{key: _marshal(value) for key, value in item.items()} for item in items]
+
+
+def unmarshal_items(items: list[dict]) -> list[dict]:
+    with _gc_paused(len(items)):
+        return [{key: _unmarshal(value) for key, value in item.items()} for item in items]
+
+
+def unmarshal_response(response: dict) -> dict:
+    """Replace the Item/Items of a DynamoDB response with plain JSON values"""
+    if "Item" in response:
+        response = {**response, "Item": unmarshal_item(response["Item"])}
+    if "Items" in response:
+        response = {**response, "Items": unmarshal_items(response["Items"])}
+    return response
@@ -0,0 +1,131 @@
+import os
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger("aws-mcp-server")
+
+DEFAULT_REGION_CONCURRENCY = 8
+DEFAULT_REGION_TIMEOUT = 30
+# Continuation tokens a regional response may carry, and the arguments resuming them
+TOKEN_KEYS = ("NextToken", "NextMarker", "LastEvaluatedTableName")
+CURSOR_ARGUMENTS = ("next_token", "marker", "exclusive_start_table_name")
+
+# Enabled regions per credential set, looked up once for regions="all"
+_enabled_regions: dict[str, list[str]] = {}
+
+
+async def enabled_regions(aws) -> list[str]:
+    """Regions enabled for the account, as reported by EC2 describe_regions"""
+    credential_key = aws.clients.credential_key()
+    regions = _enabled_regions.get(credential_key)
+    if regions is None:
+        ec2_client = await aws.client('ec2')
+        response = await aws.run("ec2", ec2_client.describe_regions)
+        regions = _enabled_regions[credential_key] = sorted(
+            region["RegionName"] for region in response["Regions"])
+    return regions
+
+
+async def resolve_regions(aws, regions) -> list[str] | None:
+    """Expand a regions argument ("all", a comma-separated string or a list) into region names"""
+    if not regions:
+        return None
+    if isinstance(regions, str):
+        regions = regions.split(",")
+    regions = [region.strip() for region in regions if region.strip()]
+    if regions == ["all"]:
+        return await enabled_regions(aws)
+    if "all" in regions:
+        raise ValueError('"all" cannot be combined with other regions')
+    return list(dict.fromkeys(regions))
+
+
+def tag_region(item, region: str):
+    return {**item, "Region": region}
+
+
+async def fan_out(
+    regions: list[str],
+    call: Callable[[str], Awaitable[dict]],
+    key: str,
+    tag: Callable[[Any, str], Any] = tag_region,
+    max_concurrency: int | None = None,
+    timeout: float | None = None
+) -> dict:
+    """Run call(region) for every region concurrently and merge the key lists
+
+    Every merged entry is tagged with the region it came from and each
+    region's continuation token is returned under NextTokens. A region
+    that fails or exceeds the timeout is reported under FailedRegions
+    instead of failing the request; a timed-out boto3 call still finishes
+    on its worker thread, its result is just discarded.
+    """
+    max_concurrency = max_concurrency or int(
+        os.getenv("AWS_MCP_REGION_CONCURRENCY", DEFAULT_REGION_CONCURRENCY))
+    timeout = timeout or float(os.getenv("AWS_MCP_REGION_TIMEOUT", DEFAULT_REGION_TIMEOUT))
+    if max_concurrency < 1:
+        raise ValueError("Region concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(max_concurrency)
+    started = time.monotonic()
+
+    async def run_region(region: str):
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(call(region), timeout), None
+            except asyncio.TimeoutError:
+                return None, f"Timed out after {timeout:g}s"
+            except Exception as e:
+                logger.warning(f"Region {region} failed: {e}")
+                return None, str(e)
+
+    outcomes = await asyncio.gather(*(run_region(region) for region in regions))
+
+    merged = []
+    counts = {}
+    tokens = {}
+    failed = {}
+    for region, (response, error) in zip(regions, outcomes):
+        if error is not None:
+            failed[region] = error
+            continue
+        items = response.get(key, [])
+        merged.extend(tag(item, region) for item in items)
+        counts[region] = len(items)
+        token = next((response[k] for k in TOKEN_KEYS if response.get(k)), None)
+        if token:
+            tokens[region] = token
+
+    return {
+        key: merged,
+        "Regions": counts,
+        "NextTokens": tokens or None,
+        "FailedRegions": failed or None,
+        "ElapsedSeconds": round(time.monotonic() - started, 3),
+    }
+
+
+async def regional(aws, arguments: dict, call: Callable[[str | None], Awaitable[dict]], key: str,
+                   tag: Callable[[Any, str], Any] = tag_region) -> dict:
+    """Run call in the default region, or across the regions the arguments ask for
+
+    A token only resumes the region it came from, so a cursor argument is
+    rejected with more than one region; resume each region of NextTokens
+    on its own.
+    """
+    regions = await resolve_regions(aws, arguments.get("regions"))
+    if regions is None:
+        return await call(None)
+    if len(regions) > 1:
+        cursors = [name for name in CURSOR_ARGUMENTS if arguments.get(name)]
+        if cursors:
+            raise ValueError(f"{cursors[0]} resumes a single region; pass one region from NextTokens")
+    return await fan_out(
+        regions,
+        call,
+        key,
+        tag,
+        max_concurrency=arguments.get("region_concurrency"),
+        timeout=arguments.get("region_timeout")
+    )
@@ -0,0 +1,94 @@
+import os
+import logging
+from dataclasses import replace
+from typing import Callable
+from mcp.types import Tool
+from .tools import BUILTIN_SERVICES, COST_CLASSES, ToolSpec, with_common_properties
+
+logger = logging.getLogger("aws-mcp-server")
+
+# Entry point group third-party packages use to add services
+ENTRY_POINT_GROUP = "mcp_server_aws.services"
+
+
+def _env_list(name: str) -> list[str] | None:
+    value = os.getenv(name, "").strip()
+    if not value or value == "all":
+        return None
+    return [entry.strip() for entry in value.split(",") if entry.strip()]
+
+
+class ToolRegistry:
+    """Tool name to ToolSpec map for the enabled services, built once at startup
+
+    Services come from a name -> loader mapping, where a loader returns the
+    service's ToolSpecs and is only called (importing its handlers) when the
+    service is enabled. AWS_MCP_SERVICES restricts the enabled services and
+    AWS_MCP_READ_ONLY drops every mutating tool.
+    """
+
+    def __init__(
+        self,
+        services: dict[str, Callable[[], list[ToolSpec]]],
+        enabled: list[str] | None = None,
+        read_only: bool | None = None
+    ):
+        enabled = enabled if enabled is not None else _env_list("AWS_MCP_SERVICES")
+        if read_only is None:
+            read_only = os.getenv("AWS_MCP_READ_ONLY", "").lower() in ("1", "true", "yes")
+        if enabled is not None:
+            unknown = set(enabled) - set(services)
+            if unknown:
+                raise ValueError(f"Unknown services: {', '.join(sorted(unknown))}")
+
+        self._specs: dict[str, ToolSpec] = {}
+        for service, load in services.items():
+            if enabled is not None and service not in enabled:
+                continue
+            for spec in load():
+                if spec.cost not in COST_CLASSES:
+                    raise ValueError(f"Invalid cost class for {spec.name}: {spec.cost}")
+                if spec.name in self._specs:
+                    raise ValueError(f"Duplicate tool: {spec.name}")
+                if read_only and not spec.read_only:
+                    continue
+                self._specs[spec.name] = with_common_properties(replace(spec, service=service))
+        self._tools = [spec.tool for spec in self._specs.values()]
+
+    def get(self, name: str) -> ToolSpec:
+        try:
+            return self._specs[name]
+        except KeyError:
+            raise ValueError(f"Unknown tool: {name}")
+
+    def tools(self) -> list[Tool]:
+        return list(self._tools)
+
+    def specs(self) -> list[ToolSpec]:
+        return list(self._specs.values())
+
+    def cache_ttls(self) -> dict[str, float]:
+        return {name: spec.cache_ttl for name, spec in self._specs.items() if spec.cache_ttl}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+
+def discover_services() -> dict[str, Callable[[], list[ToolSpec]]]:
+    """Built-in services plus any registered under the mcp_server_aws.services entry point group"""
+    from importlib.metadata import entry_points
+
+    services = dict(BUILTIN_SERVICES)
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        if entry_point.name in services:
+            logger.warning(f"Ignoring service plugin {entry_point.name}: name already registered")
+            continue
+        services[entry_point.name] = entry_point.load()
+    return services
+
+
+def load_registry(enabled: list[str] | None = None, read_only: bool | None = None) -> ToolRegistry:
+    return ToolRegistry(discover_services(), enabled=enabled, read_only=read_only)
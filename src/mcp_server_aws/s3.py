@@ -0,0 +1,751 @@
+import os
+import json
+import time
+import base64
+import random
+import logging
+import threading
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import Callable
+from .utils import encode_cursor, decode_cursor
+
+logger = logging.getLogger("aws-mcp-server")
+
+MIB = 1024 * 1024
+MIN_PART_SIZE = 5 * MIB
+MAX_PARTS = 10000
+DEFAULT_MULTIPART_THRESHOLD = 8 * MIB
+DEFAULT_PART_SIZE = 8 * MIB
+DEFAULT_PART_CONCURRENCY = 4
+PART_MAX_ATTEMPTS = 3
+DEFAULT_READ_CHUNK_SIZE = 1 * MIB
+LINE_SCAN_CHUNK_SIZE = 256 * 1024
+LIST_PAGE_SIZE = 1000
+DEFAULT_LIST_CONCURRENCY = 8
+DEFAULT_CHUNKED_UPLOAD_TTL = 3600
+CHUNKED_UPLOAD_SWEEP_INTERVAL = 60
+DEFAULT_DOWNLOAD_DIR = Path.home() / ".mcp-server-aws" / "downloads"
+
+ProgressCallback = Callable[[float, float | None], None]
+
+
+def use_cli_fallback() -> bool:
+    """Whether S3 object operations should shell out to the aws CLI"""
+    return os.getenv("AWS_MCP_S3_USE_CLI", "").lower() in ("1", "true", "yes")
+
+
+def download_directory(download_dir: str | None = None) -> Path:
+    return Path(download_dir or os.getenv("AWS_MCP_S3_DOWNLOAD_DIR", str(DEFAULT_DOWNLOAD_DIR)))
+
+
+def resolve_download_path(path: str, download_dir: str | None = None) -> str:
+    """Local file a download may write, inside the download directory
+
+    Relative paths are taken from the download directory; the resolved
+    path (following symlinks) must stay inside it.
+    """
+    directory = os.path.realpath(download_directory(download_dir))
+    resolved = os.path.realpath(os.path.join(directory, path))
+    if resolved == directory or os.path.commonpath([directory, resolved]) != directory:
+        raise ValueError(f"Download path {path} resolves outside the download directory")
+    os.makedirs(os.path.dirname(resolved), exist_ok=True)
+    return resolved
+
+
+class S3Engine:
+    """S3 data path running in-process on a pooled boto3 client"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def create_bucket(self, bucket_name: str, region: str | None = None) -> dict:
+        params = {"Bucket": bucket_name}
+        if region and region != "us-east-1":
+            params["CreateBucketConfiguration"] = {"LocationConstraint": region}
+        response = self.client.create_bucket(**params)
+        logger.info(f"Successfully created bucket: {bucket_name}")
+        return response
+
+    def upload_object(
+        self,
+        bucket_name: str,
+        object_key: str,
+        body: bytes,
+        multipart_threshold: int | None = None,
+        part_size: int | None = None,
+        max_concurrency: int | None = None,
+        progress: ProgressCallback | None = None
+    ) -> dict:
+        """Upload body with a single put, or as a parallel multipart upload above the threshold"""
+        multipart_threshold = multipart_threshold or DEFAULT_MULTIPART_THRESHOLD
+        if len(body) < multipart_threshold:
+            response = self.client.put_object(Bucket=bucket_name, Key=object_key, Body=body)
+            if progress:
+                progress(len(body), len(body))
+            return response
+
+        upload_id = self.client.create_multipart_upload(Bucket=bucket_name, Key=object_key)["UploadId"]
+        try:
+            part_size = _fit_part_size(len(body), part_size or DEFAULT_PART_SIZE)
+            view = memoryview(body)
+            chunks = [view[offset:offset + part_size] for offset in range(0, len(body), part_size)]
+            parts = self.upload_parts(
+                bucket_name, object_key, upload_id, chunks,
+                first_part_number=1,
+                max_concurrency=max_concurrency,
+                progress=progress,
+                total_bytes=len(body)
+            )
+            response = self.complete_multipart_upload(bucket_name, object_key, upload_id, parts)
+        except Exception:
+            self.abort_multipart_upload(bucket_name, object_key, upload_id)
+            raise
+
+        response["Parts"] = parts
+        return response
+
+    def upload_parts(
+        self,
+        bucket_name: str,
+        object_key: str,
+        upload_id: str,
+        chunks: list,
+        first_part_number: int,
+        max_concurrency: int | None = None,
+        progress: ProgressCallback | None = None,
+        total_bytes: int | None = None,
+        bytes_already_sent: int = 0
+    ) -> list[dict]:
+        """Upload consecutive parts concurrently, retrying each part independently"""
+        lock = threading.Lock()
+        sent = bytes_already_sent
+
+        def upload(part_number: int, chunk) -> dict:
+            nonlocal sent
+            part = self._upload_part(bucket_name, object_key, upload_id, part_number, chunk)
+            with lock:
+                sent += part["Size"]
+                if progress:
+                    progress(sent, total_bytes)
+            return part
+
+        workers = max(1, min(max_concurrency or DEFAULT_PART_CONCURRENCY, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aws-mcp-s3-part") as pool:
+            futures = [
+                pool.submit(upload, first_part_number + index, chunk)
+                for index, chunk in enumerate(chunks)
+            ]
+            return [future.result() for future in futures]
+
+    def _upload_part(self, bucket_name: str, object_key: str, upload_id: str, part_number: int, chunk) -> dict:
+        for attempt in range(1, PART_MAX_ATTEMPTS + 1):
+            try:
+                response = self.client.upload_part(
+                    Bucket=bucket_name,
+                    Key=object_key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=bytes(chunk)
+                )
+                return {
+                    "PartNumber": part_number,
+                    "ETag": response["ETag"],
+                    "Size": len(chunk),
+                    "Attempts": attempt
+                }
+            except Exception as e:
+                if attempt == PART_MAX_ATTEMPTS:
+                    raise RuntimeError(f"Part {part_number} failed after {attempt} attempts: {e}")
+                delay = random.uniform(0, 0.2 * 2 ** attempt)
+                logger.warning(f"Retrying part {part_number} of upload {upload_id} in {delay:.2f}s: {e}")
+                time.sleep(delay)
+
+    def complete_multipart_upload(self, bucket_name: str, object_key: str, upload_id: str, parts: list[dict]) -> dict:
+        return self.client.complete_multipart_upload(
+            Bucket=bucket_name,
+            Key=object_key,
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [{"PartNumber": part["PartNumber"], "ETag": part["ETag"]} for part in parts]
+            }
+        )
+
+    def abort_multipart_upload(self, bucket_name: str, object_key: str, upload_id: str) -> dict:
+        try:
+            return self.client.abort_multipart_upload(Bucket=bucket_name, Key=object_key, UploadId=upload_id)
+        except Exception as e:
+            logger.error(f"Failed to abort multipart upload {upload_id}: {e}")
+            return {}
+
+    def delete_object(self, bucket_name: str, object_key: str) -> dict:
+        return self.client.delete_object(Bucket=bucket_name, Key=object_key)
+
+    def list_objects(
+        self,
+        bucket_name: str,
+        prefix: str | None = None,
+        delimiter: str | None = None,
+        start_after: str | None = None,
+        max_keys: int | None = None,
+        cursor: str | None = None
+    ) -> dict:
+        """List up to max_keys objects, following continuation tokens; pass NextCursor back to continue"""
+        params = {"Bucket": bucket_name}
+        if prefix:
+            params["Prefix"] = prefix
+        if delimiter:
+            params["Delimiter"] = delimiter
+        if cursor:
+            params["ContinuationToken"] = decode_cursor(cursor)["token"]
+        elif start_after:
+            params["StartAfter"] = start_after
+
+        max_keys = max_keys or LIST_PAGE_SIZE
+        contents: list[dict] = []
+        common_prefixes: list[dict] = []
+        next_token = None
+        while True:
+            # Keys and common prefixes both count towards MaxKeys
+            remaining = max_keys - len(contents) - len(common_prefixes)
+            page = self.client.list_objects_v2(**params, MaxKeys=min(remaining, LIST_PAGE_SIZE))
+            contents.extend(page.get("Contents", []))
+            common_prefixes.extend(page.get("CommonPrefixes", []))
+            next_token = page.get("NextContinuationToken") if page.get("IsTruncated") else None
+            if not next_token or len(contents) + len(common_prefixes) >= max_keys:
+                break
+            params["ContinuationToken"] = next_token
+
+        response = {
+            "Name": bucket_name,
+            "Prefix": prefix or "",
+            "KeyCount": len(contents),
+            "Contents": contents,
+            "IsTruncated": next_token is not None,
+            "NextCursor": encode_cursor({"token": next_token}) if next_token else None
+        }
+        if delimiter:
+            response["Delimiter"] = delimiter
+            response["CommonPrefixes"] = common_prefixes
+        return response
+
+    def list_objects_exhaustive(
+        self,
+        bucket_name: str,
+        prefix: str | None = None,
+        delimiter: str | None = None,
+        max_keys: int | None = None,
+        max_concurrency: int | None = None
+    ) -> dict:
+        """List every object under prefix, fanning out over common prefixes in parallel"""
+        delimiter = delimiter or "/"
+        started = time.monotonic()
+
+        def list_prefix(sub_prefix: str) -> tuple[list[dict], list[str]]:
+            params = {"Bucket": bucket_name, "Prefix": sub_prefix, "Delimiter": delimiter}
+            contents, children = [], []
+            while True:
+                page = self.client.list_objects_v2(**params)
+                contents.extend(page.get("Contents", []))
+                children.extend(p["Prefix"] for p in page.get("CommonPrefixes", []))
+                if not page.get("IsTruncated"):
+                    return contents, children
+                params["ContinuationToken"] = page["NextContinuationToken"]
+
+        contents: list[dict] = []
+        prefixes_listed = 0
+        truncated = False
+        workers = max(1, max_concurrency or DEFAULT_LIST_CONCURRENCY)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aws-mcp-s3-list") as pool:
+            pending = {pool.submit(list_prefix, prefix or "")}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page_contents, children = future.result()
+                    prefixes_listed += 1
+                    contents.extend(page_contents)
+                    if max_keys and len(contents) >= max_keys:
+                        truncated = True
+                        continue
+                    pending.update(pool.submit(list_prefix, child) for child in children)
+                if truncated:
+                    for future in pending:
+                        future.cancel()
+                    break
+
+        contents.sort(key=lambda item: item["Key"])
+        if max_keys and len(contents) > max_keys:
+            contents = contents[:max_keys]
+        return {
+            "Name": bucket_name,
+            "Prefix": prefix or "",
+            "KeyCount": len(contents),
+            "Contents": contents,
+            "IsTruncated": truncated,
+            "PrefixesListed": prefixes_listed,
+            "ElapsedSeconds": round(time.monotonic() - started, 3)
+        }
+
+    def read_object(self, bucket_name: str, object_key: str) -> str:
+        response = self.client.get_object(Bucket=bucket_name, Key=object_key)
+        with response["Body"] as body:
+            return body.read().decode("utf-8", errors="replace")
+
+    def get_range(self, bucket_name: str, object_key: str, start: int, end: int | None = None, etag: str | None = None) -> tuple[bytes, dict]:
+        """Fetch bytes start..end (inclusive) and the object's size, ETag and content type"""
+        params = {
+            "Bucket": bucket_name,
+            "Key": object_key,
+            "Range": f"bytes={start}-{'' if end is None else end}"
+        }
+        if etag:
+            params["IfMatch"] = etag
+        try:
+            response = self.client.get_object(**params)
+        except self.client.exceptions.ClientError as e:
+            # Reading at or past the end of the object
+            if e.response.get("Error", {}).get("Code") == "InvalidRange":
+                head = self.client.head_object(Bucket=bucket_name, Key=object_key)
+                return b"", _object_info(head, head["ContentLength"])
+            raise
+        with response["Body"] as body:
+            data = body.read()
+        total = int(response["ContentRange"].rsplit("/", 1)[1]) if "ContentRange" in response else len(data)
+        return data, _object_info(response, total)
+
+    def read_range(self, bucket_name: str, object_key: str, offset: int = 0, length: int | None = None, encoding: str = "auto") -> dict:
+        """Read length bytes starting at offset; a negative offset reads from the end"""
+        if length is not None and length < 1:
+            raise ValueError("length must be at least 1")
+        if offset < 0:
+            size = self.client.head_object(Bucket=bucket_name, Key=object_key)["ContentLength"]
+            offset = max(size + offset, 0)
+        end = offset + length - 1 if length is not None else None
+        data, info = self.get_range(bucket_name, object_key, offset, end)
+        body, body_encoding, consumed = encode_body(data, encoding)
+        return {
+            **info,
+            "Range": {"Start": offset, "End": offset + consumed - 1 if consumed else None},
+            "Encoding": body_encoding,
+            "Body": body
+        }
+
+    def read_page(self, bucket_name: str, object_key: str, cursor: str | None = None, chunk_size: int | None = None, encoding: str = "auto") -> dict:
+        """Read the next fixed-size chunk of an object; pass NextCursor back to continue"""
+        state = decode_cursor(cursor) if cursor else {"offset": 0}
+        offset = state["offset"]
+        chunk_size = chunk_size or state.get("chunk_size") or DEFAULT_READ_CHUNK_SIZE
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        data, info = self.get_range(bucket_name, object_key, offset, offset + chunk_size - 1, etag=state.get("etag"))
+        body, body_encoding, consumed = encode_body(data, encoding)
+        if data and not consumed:
+            # The chunk is shorter than the UTF-8 character at offset; widen it
+            # to the longest character so the cursor always moves forward
+            data, info = self.get_range(bucket_name, object_key, offset, offset + max(chunk_size, 4) - 1, etag=info["ETag"])
+            body, body_encoding, consumed = encode_body(data, encoding)
+            if not consumed:
+                body, body_encoding, consumed = encode_body(data, "base64")
+
+        next_offset = offset + consumed
+        next_cursor = None
+        if next_offset < info["ContentLength"]:
+            next_cursor = encode_cursor({"offset": next_offset, "chunk_size": chunk_size, "etag": info["ETag"]})
+        return {
+            **info,
+            "Range": {"Start": offset, "End": next_offset - 1 if consumed else None},
+            "Encoding": body_encoding,
+            "Body": body,
+            "NextCursor": next_cursor
+        }
+
+    def read_lines(self, bucket_name: str, object_key: str, head: int | None = None, tail: int | None = None) -> dict:
+        """Read the first `head` or last `tail` lines without fetching the whole object"""
+        if (head is None) == (tail is None):
+            raise ValueError("Pass exactly one of head_lines and tail_lines")
+        if (head if head is not None else tail) < 1:
+            raise ValueError("head_lines and tail_lines must be at least 1")
+        if head is not None:
+            data, info = self._scan_head(bucket_name, object_key, head)
+            lines = data.splitlines(keepends=True)[:head]
+        else:
+            data, info = self._scan_tail(bucket_name, object_key, tail)
+            lines = data.splitlines(keepends=True)[-tail:]
+        return {
+            **info,
+            "Lines": len(lines),
+            "Encoding": "text",
+            "Body": b"".join(lines).decode("utf-8", errors="replace")
+        }
+
+    def _scan_head(self, bucket_name: str, object_key: str, lines: int) -> tuple[bytes, dict]:
+        buffer = bytearray()
+        offset = 0
+        while True:
+            data, info = self.get_range(bucket_name, object_key, offset, offset + LINE_SCAN_CHUNK_SIZE - 1)
+            buffer += data
+            offset += len(data)
+            if not data or offset >= info["ContentLength"] or buffer.count(b"\n") >= lines:
+                return bytes(buffer), info
+
+    def _scan_tail(self, bucket_name: str, object_key: str, lines: int) -> tuple[bytes, dict]:
+        head = self.client.head_object(Bucket=bucket_name, Key=object_key)
+        info = _object_info(head, head["ContentLength"])
+        buffer = b""
+        end = info["ContentLength"]
+        while end > 0:
+            start = max(end - LINE_SCAN_CHUNK_SIZE, 0)
+            data, info = self.get_range(bucket_name, object_key, start, end - 1, etag=info["ETag"])
+            buffer = data + buffer
+            end = start
+            # A trailing newline terminates the last line rather than starting a new one
+            if buffer.rstrip(b"\n").count(b"\n") >= lines:
+                break
+        return buffer, info
+
+    def download_object(
+        self,
+        bucket_name: str,
+        object_key: str,
+        path: str,
+        part_size: int | None = None,
+        max_concurrency: int | None = None,
+        progress: ProgressCallback | None = None
+    ) -> dict:
+        """Download an object to a local file using parallel ranged GETs"""
+        head = self.client.head_object(Bucket=bucket_name, Key=object_key)
+        size = head["ContentLength"]
+        etag = head["ETag"]
+        part_size = part_size or DEFAULT_PART_SIZE
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+
+        with open(path, "wb") as f:
+            f.truncate(size)
+
+        lock = threading.Lock()
+        received = 0
+
+        def fetch(byte_range: tuple[int, int]) -> None:
+            nonlocal received
+            start, end = byte_range
+            data, _ = self.get_range(bucket_name, object_key, start, end, etag=etag)
+            with open(path, "r+b") as f:
+                f.seek(start)
+                f.write(data)
+            with lock:
+                received += len(data)
+                if progress:
+                    progress(received, size)
+
+        started = time.monotonic()
+        workers = max(1, min(max_concurrency or DEFAULT_PART_CONCURRENCY, len(ranges) or 1))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aws-mcp-s3-range") as pool:
+            for future in [pool.submit(fetch, byte_range) for byte_range in ranges]:
+                future.result()
+
+        return {
+            **_object_info(head, size),
+            "Path": os.path.abspath(path),
+            "Parts": len(ranges),
+            "ElapsedSeconds": round(time.monotonic() - started, 3)
+        }
+
+
+def _object_info(response: dict, total: int) -> dict:
+    return {
+        "ContentLength": total,
+        "ContentType": response.get("ContentType"),
+        "ETag": response.get("ETag"),
+        "LastModified": response.get("LastModified")
+    }
+
+
+def encode_body(data: bytes, encoding: str = "auto") -> tuple[str, str, int]:
+    """Render object bytes for a TextContent response
+
+    Returns the rendered body, the encoding used and how many bytes of data
+    it covers. In "auto" mode UTF-8 text is returned as-is, a multi-byte
+    character cut off at the end is left for the next read, and anything
+    else (including data containing NUL bytes) is returned as base64.
+    """
+    if encoding == "base64":
+        return base64.b64encode(data).decode(), "base64", len(data)
+    if encoding == "text":
+        return data.decode("utf-8", errors="replace"), "text", len(data)
+
+    if b"\x00" in data:
+        return base64.b64encode(data).decode(), "base64", len(data)
+    try:
+        return data.decode("utf-8"), "text", len(data)
+    except UnicodeDecodeError as e:
+        if e.reason == "unexpected end of data" and e.start >= len(data) - 3:
+            try:
+                return data[:e.start].decode("utf-8"), "text", e.start
+            except UnicodeDecodeError:
+                pass
+    return base64.b64encode(data).decode(), "base64", len(data)
+
+
+def _fit_part_size(total_bytes: int, part_size: int) -> int:
+    """Clamp part_size to S3's minimum and grow it so the upload fits in MAX_PARTS"""
+    part_size = max(part_size, MIN_PART_SIZE)
+    return max(part_size, -(-total_bytes // MAX_PARTS))
+
+
+class ChunkedUpload:
+    """Multipart upload fed by successive tool calls
+
+    Incoming chunks are buffered until a full part is available, so at most
+    one part plus one chunk is held in memory at a time.
+    """
+
+    def __init__(self, bucket_name: str, object_key: str, upload_id: str, part_size: int, region: str | None = None):
+        self.bucket_name = bucket_name
+        self.object_key = object_key
+        self.upload_id = upload_id
+        self.part_size = part_size
+        self.region = region
+        self.buffer = bytearray()
+        self.parts: list[dict] = []
+        self.bytes_received = 0
+        self.bytes_uploaded = 0
+        self.updated_at = time.monotonic()
+        self.closed = False
+        self.lock = threading.Lock()
+
+    def status(self) -> dict:
+        return {
+            "UploadId": self.upload_id,
+            "Bucket": self.bucket_name,
+            "Key": self.object_key,
+            "BytesReceived": self.bytes_received,
+            "BytesUploaded": self.bytes_uploaded,
+            "BufferedBytes": len(self.buffer),
+            "PartsUploaded": len(self.parts)
+        }
+
+
+class ChunkedUploads:
+    """Registry of in-progress chunked uploads keyed by S3 upload id
+
+    An upload that receives no chunk for AWS_MCP_S3_CHUNKED_UPLOAD_TTL
+    seconds is aborted by a background sweep, and close() aborts whatever
+    is left, so abandoned uploads do not leave billed parts behind in S3.
+    """
+
+    def __init__(self, get_client=None, ttl: float | None = None):
+        self._get_client = get_client
+        self.ttl = ttl if ttl is not None else float(
+            os.getenv("AWS_MCP_S3_CHUNKED_UPLOAD_TTL", DEFAULT_CHUNKED_UPLOAD_TTL))
+        self._uploads: dict[str, ChunkedUpload] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, engine: S3Engine, bucket_name: str, object_key: str, part_size: int | None = None, region: str | None = None) -> ChunkedUpload:
+        upload_id = engine.client.create_multipart_upload(Bucket=bucket_name, Key=object_key)["UploadId"]
+        upload = ChunkedUpload(bucket_name, object_key, upload_id, max(part_size or DEFAULT_PART_SIZE, MIN_PART_SIZE), region)
+        with self._lock:
+            self._uploads[upload_id] = upload
+            if self._thread is None and self._get_client is not None and self.ttl > 0:
+                self._thread = threading.Thread(target=self._run, name="aws-mcp-s3-upload-sweep", daemon=True)
+                self._thread.start()
+        return upload
+
+    def get(self, upload_id: str) -> ChunkedUpload:
+        with self._lock:
+            upload = self._uploads.get(upload_id)
+        if upload is None:
+            raise ValueError(f"Unknown or expired upload id: {upload_id}")
+        return upload
+
+    def sweep(self, now: float | None = None) -> list[str]:
+        """Abort every upload idle for longer than the TTL and return their ids"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            stale = [upload for upload in self._uploads.values() if now - upload.updated_at > self.ttl]
+        aborted = []
+        for upload in stale:
+            # An upload busy with a chunk is in use, whatever its timestamp says
+            if not upload.lock.acquire(blocking=False):
+                continue
+            try:
+                if upload.closed or now - upload.updated_at <= self.ttl:
+                    continue
+                self._close(upload)
+            finally:
+                upload.lock.release()
+            logger.warning(f"Aborting chunked upload {upload.upload_id} to s3://{upload.bucket_name}/{upload.object_key} after {self.ttl:g}s without a chunk")
+            self._abort(upload)
+            aborted.append(upload.upload_id)
+        return aborted
+
+    def _run(self) -> None:
+        while not self._stop.wait(min(self.ttl, CHUNKED_UPLOAD_SWEEP_INTERVAL)):
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.warning(f"Chunked upload sweep failed: {e}")
+
+    def _close(self, upload: ChunkedUpload) -> None:
+        upload.closed = True
+        with self._lock:
+            self._uploads.pop(upload.upload_id, None)
+
+    def _abort(self, upload: ChunkedUpload) -> dict:
+        engine = S3Engine(self._get_client("s3", upload.region))
+        return engine.abort_multipart_upload(upload.bucket_name, upload.object_key, upload.upload_id)
+
+    def close(self) -> None:
+        """Stop the sweep and abort the uploads still in progress"""
+        self._stop.set()
+        with self._lock:
+            uploads = list(self._uploads.values())
+            self._uploads.clear()
+        if self._get_client is None:
+            return
+        for upload in uploads:
+            upload.closed = True
+            self._abort(upload)
+
+    def append(
+        self,
+        engine: S3Engine,
+        upload: ChunkedUpload,
+        chunk: bytes,
+        offset: int | None = None,
+        final: bool = False,
+        max_concurrency: int | None = None,
+        progress: ProgressCallback | None = None
+    ) -> dict:
+        """Buffer a chunk, flush every full part and complete the upload when final is set"""
+        with upload.lock:
+            if upload.closed:
+                raise ValueError(f"Unknown or expired upload id: {upload.upload_id}")
+            upload.updated_at = time.monotonic()
+            if offset is not None and offset != upload.bytes_received:
+                raise ValueError(
+                    f"Chunk offset {offset} does not match bytes received so far ({upload.bytes_received})")
+
+            upload.buffer += chunk
+            upload.bytes_received += len(chunk)
+
+            full_parts = len(upload.buffer) // upload.part_size
+            if final:
+                flush_size = len(upload.buffer)
+            else:
+                flush_size = full_parts * upload.part_size
+
+            if flush_size or (final and not upload.parts):
+                chunks = [
+                    bytes(upload.buffer[i:i + upload.part_size])
+                    for i in range(0, flush_size, upload.part_size)
+                ] or [b""]
+                try:
+                    parts = engine.upload_parts(
+                        upload.bucket_name, upload.object_key, upload.upload_id, chunks,
+                        first_part_number=len(upload.parts) + 1,
+                        max_concurrency=max_concurrency,
+                        progress=progress,
+                        bytes_already_sent=upload.bytes_uploaded
+                    )
+                except Exception:
+                    # Drop the chunk so the caller can resend it from the same offset
+                    if chunk:
+                        del upload.buffer[-len(chunk):]
+                    upload.bytes_received -= len(chunk)
+                    raise
+                del upload.buffer[:flush_size]
+                upload.parts.extend(parts)
+                upload.bytes_uploaded += flush_size
+            upload.updated_at = time.monotonic()
+
+            if not final:
+                return upload.status()
+
+            response = engine.complete_multipart_upload(upload.bucket_name, upload.object_key, upload.upload_id, upload.parts)
+            self._close(upload)
+            response.update(upload.status())
+            response["Parts"] = upload.parts
+            return response
+
+    def abort(self, engine: S3Engine, upload: ChunkedUpload) -> dict:
+        with upload.lock:
+            if upload.closed:
+                raise ValueError(f"Unknown or expired upload id: {upload.upload_id}")
+            self._close(upload)
+        response = engine.abort_multipart_upload(upload.bucket_name, upload.object_key, upload.upload_id)
+        response.update(upload.status())
+        return response
+
+
+class S3CliEngine:
+    """Fallback S3 data path that shells out to `aws s3api`"""
+
+    def _run(self, cli_command: list[str]) -> subprocess.CompletedProcess:
+        return subprocess.run(cli_command, capture_output=True, text=True, check=True)
+
+    def create_bucket(self, bucket_name: str, region: str | None = None) -> dict:
+        cli_command = ["aws", "s3api", "create-bucket", "--bucket", bucket_name]
+        if region:
+            cli_command.extend(["--region", region])
+            if region != 'us-east-1':
+                cli_command.extend(["--create-bucket-configuration", f"LocationConstraint={region}"])
+
+        try:
+            cli_result = self._run(cli_command)
+        except subprocess.CalledProcessError as e:
+            logger.error(f"AWS CLI bucket creation failed: {e.stderr}")
+            raise RuntimeError(f"Failed to create bucket: {e.stderr}")
+        logger.info(f"Successfully created bucket using AWS CLI: {bucket_name}")
+        return json.loads(cli_result.stdout)
+
+    def upload_object(self, bucket_name: str, object_key: str, body: bytes, **options) -> dict:
+        """Upload body with put-object; multipart options are not supported on the CLI path"""
+        with tempfile.NamedTemporaryFile(delete=False) as tmp:
+            tmp.write(body)
+            tmp_path = tmp.name
+
+        try:
+            cli_result = self._run([
+                "aws", "s3api", "put-object",
+                "--bucket", bucket_name,
+                "--key", object_key,
+                "--body", tmp_path
+            ])
+            return json.loads(cli_result.stdout) if cli_result.stdout else {"Status": "Success"}
+        finally:
+            os.unlink(tmp_path)
+
+    def delete_object(self, bucket_name: str, object_key: str) -> dict:
+        cli_result = self._run([
+            "aws", "s3api", "delete-object",
+            "--bucket", bucket_name,
+            "--key", object_key
+        ])
+        return json.loads(cli_result.stdout) if cli_result.stdout else {"Status": "Success"}
+
+    def list_objects(self, bucket_name: str) -> dict:
+        cli_result = self._run([
+            "aws", "s3api", "list-objects-v2",
+            "--bucket", bucket_name
+        ])
+        return json.loads(cli_result.stdout)
+
+    def read_object(self, bucket_name: str, object_key: str) -> str:
+        with tempfile.NamedTemporaryFile(delete=False) as tmp:
+            tmp_path = tmp.name
+
+        try:
+            self._run([
+                "aws", "s3api", "get-object",
+                "--bucket", bucket_name,
+                "--key", object_key,
+                tmp_path
+            ])
+            with open(tmp_path, "rb") as f:
+                return f.read().decode("utf-8", errors="replace")
+        finally:
+            os.unlink(tmp_path)
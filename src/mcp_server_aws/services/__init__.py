@@ -0,0 +1,93 @@
+"""Built-in service plugins
+
+Each module holds the tool handlers for one AWS service. A handler is an
+``async def <tool_name>(aws, arguments)`` returning the raw response, which
+call_tool audits and formats; tools.py binds every handler to its schema.
+"""
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from mcp.server import request_ctx
+from mcp.types import ProgressNotification, ProgressNotificationParams, ServerNotification
+
+logger = logging.getLogger("aws-mcp-server")
+
+
+class _ProgressSends:
+    """Progress notifications of one tool call, sent one after another"""
+
+    def __init__(self):
+        self.futures = []
+        self.closed = False
+        self.lock = threading.Lock()
+
+
+_progress_sends: ContextVar[_ProgressSends | None] = ContextVar("aws_mcp_progress_sends", default=None)
+
+
+@asynccontextmanager
+async def progress_scope():
+    """Deliver every progress notification a handler sends before its result goes out
+
+    Reports arriving afterwards (e.g. from a worker thread that outlived a
+    timeout) are dropped rather than sent after the result.
+    """
+    sends = _ProgressSends()
+    token = _progress_sends.set(sends)
+    try:
+        yield
+    finally:
+        _progress_sends.reset(token)
+        with sends.lock:
+            sends.closed = True
+            futures = list(sends.futures)
+        if futures:
+            await asyncio.gather(*(asyncio.wrap_future(f) for f in futures), return_exceptions=True)
+
+
+async def _send_after(previous, notification) -> None:
+    if previous is not None:
+        await asyncio.gather(asyncio.wrap_future(previous), return_exceptions=True)
+    try:
+        await notification
+    except Exception as e:
+        logger.warning(f"Progress notification failed: {e}")
+
+
+def get_progress_reporter():
+    """Return a thread-safe callback forwarding progress to the client, if it asked for it"""
+    try:
+        ctx = request_ctx.get()
+    except LookupError:
+        return None
+    progress_token = ctx.meta.progressToken if ctx.meta else None
+    if progress_token is None:
+        return None
+
+    loop = asyncio.get_running_loop()
+    sends = _progress_sends.get()
+
+    def report(progress: float, total: float | None = None, **fields) -> None:
+        """Send a progress notification; extra fields (e.g. a streamed chunk) ride along in its params"""
+        if not fields:
+            notification = ctx.session.send_progress_notification(progress_token, progress, total)
+        else:
+            notification = ctx.session.send_notification(ServerNotification(ProgressNotification(
+                method="notifications/progress",
+                params=ProgressNotificationParams(
+                    progressToken=progress_token, progress=progress, total=total, **fields)
+            )))
+        if sends is None:
+            asyncio.run_coroutine_threadsafe(notification, loop)
+            return
+        with sends.lock:
+            if sends.closed:
+                notification.close()
+                return
+            # Each send waits for the previous one so chunks arrive in order
+            previous = sends.futures[-1] if sends.futures else None
+            sends.futures.append(asyncio.run_coroutine_threadsafe(_send_after(previous, notification), loop))
+
+    return report
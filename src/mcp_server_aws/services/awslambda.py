@@ -0,0 +1,127 @@
+import os
+from ..awslambda import (
+    batch_invoke, indexed_name, invoke, invoke_params, invoke_stream, list_functions, tagged_functions
+)
+from ..clients import DEFAULT_REGION
+from ..regions import regional
+from . import get_progress_reporter
+
+
+def _region(arguments: dict, region: str | None = None) -> str:
+    return region or arguments.get("region") or os.getenv("AWS_REGION") or DEFAULT_REGION
+
+
+async def lambda_list_functions(aws, arguments: dict):
+    """List functions across every page, filtered and served from the metadata index while fresh"""
+    max_items = arguments.get("max_items")
+    marker = arguments.get("marker")
+
+    async def list_region(region):
+        region = _region(arguments, region)
+        index = aws.function_index
+        response = {"NextMarker": None, "Pages": 0}
+        changes = None
+        fresh_read = max_items or marker or arguments.get("refresh") or arguments.get("bypass_cache")
+        from_index = not fresh_read and index.fresh(region)
+        if from_index:
+            functions = index.functions(region)
+        else:
+            lambda_client = await aws.client('lambda', region_name=region)
+            response = await aws.run("lambda", list_functions, lambda_client, max_items, marker)
+            functions = response["Functions"]
+            changes = index.update(region, functions, complete=not (max_items or marker))
+
+        runtimes = arguments.get("runtimes")
+        if runtimes:
+            functions = [f for f in functions if f.get("Runtime") in runtimes]
+        name_prefix = arguments.get("name_prefix")
+        if name_prefix:
+            functions = [f for f in functions if f["FunctionName"].startswith(name_prefix)]
+        if arguments.get("tags"):
+            tagging_client = await aws.client('resourcegroupstaggingapi', region_name=region)
+            tagged = await aws.run("resourcegroupstaggingapi", tagged_functions, tagging_client, arguments["tags"])
+            functions = [{**f, "Tags": tagged[f["FunctionArn"]]} for f in functions if f["FunctionArn"] in tagged]
+
+        return {
+            "Functions": functions,
+            "Count": len(functions),
+            "NextMarker": response["NextMarker"],
+            "Pages": response["Pages"],
+            "FromIndex": from_index,
+            "IndexAgeSeconds": index.age(region),
+            "IndexChanges": changes,
+        }
+
+    return await regional(aws, arguments, list_region, "Functions")
+
+
+def _chunk_forwarder(report):
+    """Turn streamed response chunks into progress notifications carrying the chunk"""
+    if report is None:
+        return None
+    sequence = 0
+
+    def forward(chunk: str, encoding: str, streamed_bytes: int) -> None:
+        nonlocal sequence
+        report(streamed_bytes, None, chunk=chunk, encoding=encoding, sequence=sequence)
+        sequence += 1
+
+    return forward
+
+
+async def lambda_invoke(aws, arguments: dict):
+    """Invoke a function, stream its response, or run a batch of invocations concurrently"""
+    lambda_client = await aws.client('lambda')
+    options = {
+        "invocation_type": arguments.get("invocation_type"),
+        "qualifier": arguments.get("qualifier"),
+        "log_tail": arguments.get("log_tail", False)
+    }
+    if arguments.get("stream"):
+        if options["invocation_type"] == "Event":
+            raise ValueError("Streaming invocations cannot use the Event invocation type")
+        params = invoke_params(arguments["function_name"], arguments.get("payload"), **options)
+        return await aws.run(
+            "lambda", invoke_stream, lambda_client, params,
+            on_chunk=_chunk_forwarder(get_progress_reporter()),
+            max_buffer_bytes=arguments.get("max_buffer_bytes")
+        )
+    if "invocations" not in arguments and "payloads" not in arguments:
+        params = invoke_params(arguments["function_name"], arguments.get("payload"), **options)
+        return await aws.run("lambda", invoke, lambda_client, params)
+
+    requests = [
+        invoke_params(
+            invocation.get("function_name") or arguments["function_name"],
+            invocation.get("payload"),
+            **{**options, **({"qualifier": invocation["qualifier"]} if "qualifier" in invocation else {})}
+        )
+        for invocation in arguments.get("invocations", [])
+    ]
+    requests.extend(
+        invoke_params(arguments["function_name"], payload, **options)
+        for payload in arguments.get("payloads", [])
+    )
+    return await batch_invoke(
+        aws, lambda_client, requests,
+        max_concurrency=arguments.get("max_concurrency"),
+        timeout=arguments.get("timeout")
+    )
+
+
+async def lambda_get_function(aws, arguments: dict):
+    """Get a function's configuration, from the metadata index while it is fresh"""
+    region = _region(arguments)
+    function_name = arguments["function_name"]
+    index = aws.function_index
+    use_index = not (arguments.get("include_code") or arguments.get("bypass_cache"))
+    if use_index and index.fresh(region):
+        configuration = index.get(region, function_name)
+        if configuration is not None:
+            return {"Configuration": configuration}
+
+    lambda_client = await aws.client('lambda', region_name=region)
+    response = await aws.run("lambda", lambda_client.get_function, FunctionName=function_name)
+    if indexed_name(function_name) is not None:
+        index.update(region, [response["Configuration"]], complete=False)
+    return response
@@ -0,0 +1,227 @@
+from datetime import datetime, timedelta
+
+
+async def bedrock_get_model_stats(aws, arguments: dict):
+    """Get model usage statistics from CloudWatch metrics"""
+    cloudwatch_client = await aws.client('cloudwatch', region_name=arguments.get("region"))
+    # Get model usage statistics from CloudWatch metrics
+    model_id = arguments["model_id"]
+    dimensions = [
+        {'Name': 'ModelId', 'Value': model_id},
+        {'Name': 'Operation', 'Value': 'InvokeModel'}
+    ]
+
+    start_time = datetime.fromisoformat(arguments.get("start_time", (datetime.now() - timedelta(hours=24)).isoformat()))
+    end_time = datetime.fromisoformat(arguments.get("end_time", datetime.now().isoformat()))
+
+    metrics_response = await aws.run("cloudwatch", cloudwatch_client.get_metric_data,
+        MetricDataQueries=[
+            {
+                'Id': 'invocations',
+                'MetricStat': {
+                    'Metric': {
+                        'Namespace': 'AWS/Bedrock',
+                        'MetricName': 'Invocations',
+                        'Dimensions': dimensions
+                    },
+                    'Period': 300,  # 5-minute periods
+                    'Stat': 'Sum'
+                }
+            },
+            {
+                'Id': 'latency',
+                'MetricStat': {
+                    'Metric': {
+                        'Namespace': 'AWS/Bedrock',
+                        'MetricName': 'Latency',
+                        'Dimensions': dimensions
+                    },
+                    'Period': 300,
+                    'Stat': 'Average'
+                }
+            },
+            {
+                'Id': 'input_tokens',
+                'MetricStat': {
+                    'Metric': {
+                        'Namespace': 'AWS/Bedrock',
+                        'MetricName': 'InputTokenCount',
+                        'Dimensions': dimensions
+                    },
+                    'Period': 300,
+                    'Stat': 'Sum'
+                }
+            },
+            {
+                'Id': 'output_tokens',
+                'MetricStat': {
+                    'Metric': {
+                        'Namespace': 'AWS/Bedrock',
+                        'MetricName': 'OutputTokenCount',
+                        'Dimensions': dimensions
+                    },
+                    'Period': 300,
+                    'Stat': 'Sum'
+                }
+            }
+        ],
+        StartTime=start_time,
+        EndTime=end_time
+    )
+
+    return {
+        'model_id': model_id,
+        'time_range': {
+            'start': start_time.isoformat(),
+            'end': end_time.isoformat()
+        },
+        'metrics': metrics_response['MetricDataResults']
+    }
+
+
+async def bedrock_analyze_requests(aws, arguments: dict):
+    """Summarise recent invocations and token counts"""
+    cloudwatch_client = await aws.client('cloudwatch', region_name=arguments.get("region"))
+    # Analyze recent requests to get statistics
+    time_period = arguments.get("time_period_hours", 24)
+    end_time = datetime.now()
+    start_time = end_time - timedelta(hours=time_period)
+
+    # Get invocations and token counts
+    metrics_response = await aws.run("cloudwatch", cloudwatch_client.get_metric_data,
+        MetricDataQueries=[
+            {
+                'Id': 'invocations',
+                'MetricStat': {
+                    'Metric': {
+                        'Namespace': 'AWS/Bedrock',
+                        'MetricName': 'Invocations',
+                        'Dimensions': [
+                            {'Name': 'ModelId', 'Value': arguments["model_id"]},
+                            {'Name': 'Operation', 'Value': 'InvokeModel'}
+                        ]
+                    },
+                    'Period': 3600,  # 1-hour periods
+                    'Stat': 'Sum'
+                }
+            },
+            {
+                'Id': 'input_tokens',
+                'MetricStat': {
+                    'Metric': {
+                        'Namespace': 'AWS/Bedrock',
+                        'MetricName': 'InputTokenCount',
+                        'Dimensions': [
+                            {'Name': 'ModelId', 'Value': arguments["model_id"]},
+                            {'Name': 'Operation', 'Value': 'InvokeModel'}
+                        ]
+                    },
+                    'Period': 3600,
+                    'Stat': 'Sum'
+                }
+            },
+            {
+                'Id': 'output_tokens',
+                'MetricStat': {
+                    'Metric': {
+                        'Namespace': 'AWS/Bedrock',
+                        'MetricName': 'OutputTokenCount',
+                        'Dimensions': [
+                            {'Name': 'ModelId', 'Value': arguments["model_id"]},
+                            {'Name': 'Operation', 'Value': 'InvokeModel'}
+                        ]
+                    },
+                    'Period': 3600,
+                    'Stat': 'Sum'
+                }
+            }
+        ],
+        StartTime=start_time,
+        EndTime=end_time
+    )
+
+    # Calculate statistics
+    total_invocations = sum(metrics_response['MetricDataResults'][0]['Values'])
+    total_input_tokens = sum(metrics_response['MetricDataResults'][1]['Values'])
+    total_output_tokens = sum(metrics_response['MetricDataResults'][2]['Values'])
+
+    return {
+        'time_range': {
+            'start': start_time.isoformat(),
+            'end': end_time.isoformat()
+        },
+        'statistics': {
+            'total_requests': total_invocations,
+            'total_input_tokens': total_input_tokens,
+            'total_output_tokens': total_output_tokens,
+            'average_input_tokens_per_request': total_input_tokens / total_invocations if total_invocations > 0 else 0,
+            'average_output_tokens_per_request': total_output_tokens / total_invocations if total_invocations > 0 else 0
+        },
+        'raw_metrics': metrics_response['MetricDataResults']
+    }
+
+
+async def bedrock_get_token_metrics(aws, arguments: dict):
+    """Get tokens-per-minute and requests-per-minute metrics"""
+    cloudwatch_client = await aws.client('cloudwatch', region_name=arguments.get("region"))
+    # Get TPM and RPM metrics
+    period_minutes = arguments.get("period", 60)
+    end_time = datetime.now()
+    start_time = end_time - timedelta(minutes=period_minutes)
+
+    metrics_response = await aws.run("cloudwatch", cloudwatch_client.get_metric_data,
+        MetricDataQueries=[
+            {
+                'Id': 'input_tpm',
+                'MetricStat': {
+                    'Metric': {
+                        'Namespace': 'AWS/Bedrock',
+                        'MetricName': 'InputTokenCount',
+                        'Dimensions': [
+                            {'Name': 'ModelId', 'Value': arguments["model_id"]},
+                            {'Name': 'Operation', 'Value': 'InvokeModel'}
+                        ]
+                    },
+                    'Period': 60,  # 1-minute periods
+                    'Stat': 'Sum'
+                }
+            },
+            {
+                'Id': 'rpm',
+                'MetricStat': {
+                    'Metric': {
+                        'Namespace': 'AWS/Bedrock',
+                        'MetricName': 'Invocations',
+                        'Dimensions': [
+                            {'Name': 'ModelId', 'Value': arguments["model_id"]},
+                            {'Name': 'Operation', 'Value': 'InvokeModel'}
+                        ]
+                    },
+                    'Period': 60,
+                    'Stat': 'Sum'
+                }
+            }
+        ],
+        StartTime=start_time,
+        EndTime=end_time
+    )
+
+    tpm_data = metrics_response['MetricDataResults'][0]['Values']
+    rpm_data = metrics_response['MetricDataResults'][1]['Values']
+
+    return {
+        'time_range': {
+            'start': start_time.isoformat(),
+            'end': end_time.isoformat()
+        },
+        'tokens_per_minute': {
+            'average': sum(tpm_data) / len(tpm_data) if tpm_data else 0,
+            'peak': max(tpm_data) if tpm_data else 0,
+            'data_points': tpm_data
+        },
+        'requests_per_minute': {
+            'average': sum(rpm_data) / len(rpm_data) if rpm_data else 0,
+            'peak': max(rpm_data) if rpm_data else 0,
+            'data_points': rpm_data
+        }
+    }
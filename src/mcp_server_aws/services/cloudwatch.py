@@ -0,0 +1,51 @@
+from datetime import datetime
+from ..regions import regional
+
+
+async def cloudwatch_get_metrics(aws, arguments: dict):
+    """Get metric data"""
+    cloudwatch_client = await aws.client('cloudwatch')
+    params = {
+        "Namespace": arguments["namespace"],
+        "MetricName": arguments["metric_name"]
+    }
+    if "dimensions" in arguments:
+        params["Dimensions"] = arguments["dimensions"]
+    if "start_time" in arguments:
+        params["StartTime"] = datetime.fromisoformat(arguments["start_time"])
+    if "end_time" in arguments:
+        params["EndTime"] = datetime.fromisoformat(arguments["end_time"])
+    if "period" in arguments:
+        params["Period"] = arguments["period"]
+
+    return await aws.run("cloudwatch", cloudwatch_client.get_metric_data, **params)
+
+
+async def cloudwatch_list_metrics(aws, arguments: dict):
+    """List metrics, in one region or across several"""
+    async def list_metrics(region):
+        cloudwatch_client = await aws.client('cloudwatch', region_name=region)
+        params = {}
+        if "namespace" in arguments:
+            params["Namespace"] = arguments["namespace"]
+        if "metric_name" in arguments:
+            params["MetricName"] = arguments["metric_name"]
+        return await aws.run("cloudwatch", cloudwatch_client.list_metrics, **params)
+
+    return await regional(aws, arguments, list_metrics, "Metrics")
+
+
+async def cloudwatch_get_logs(aws, arguments: dict):
+    """Filter log events"""
+    logs_client = await aws.client('logs')
+    params = {
+        "logGroupName": arguments["log_group_name"]
+    }
+    if "start_time" in arguments:
+        params["startTime"] = int(datetime.fromisoformat(arguments["start_time"]).timestamp() * 1000)
+    if "end_time" in arguments:
+        params["endTime"] = int(datetime.fromisoformat(arguments["end_time"]).timestamp() * 1000)
+    if "filter_pattern" in arguments:
+        params["filterPattern"] = arguments["filter_pattern"]
+
+    return await aws.run("logs", logs_client.filter_log_events, **params)
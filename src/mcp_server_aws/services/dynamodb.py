@@ -0,0 +1,285 @@
+import os
+from ..dynamodb import (
+    apply_projection,
+    batch_execute,
+    batch_get,
+    batch_write,
+    execute_paginated,
+    load_spilled_requests,
+    paginated_query,
+    parallel_scan,
+    resolve_spill_id,
+)
+from ..marshalling import marshal_item, marshal_items, unmarshal_response
+from ..regions import regional
+
+# Arguments that switch dynamodb_item_scan from a single page to the paginating scan engine
+SCAN_ENGINE_OPTIONS = ("all_pages", "total_segments", "limit", "cursor", "max_capacity_per_second")
+
+
+async def dynamodb_table_create(aws, arguments: dict):
+    """Create an on-demand table"""
+    dynamodb_client = await aws.client('dynamodb')
+    return await aws.run("dynamodb", dynamodb_client.create_table,
+        TableName=arguments["table_name"],
+        KeySchema=arguments["key_schema"],
+        AttributeDefinitions=arguments["attribute_definitions"],
+        BillingMode="PAY_PER_REQUEST"
+    )
+
+
+async def dynamodb_table_describe(aws, arguments: dict):
+    """Describe a table"""
+    dynamodb_client = await aws.client('dynamodb')
+    return await aws.run("dynamodb", dynamodb_client.describe_table,
+        TableName=arguments["table_name"])
+
+
+async def dynamodb_table_list(aws, arguments: dict):
+    """List tables, in one region or across several"""
+    async def list_tables(region):
+        dynamodb_client = await aws.client('dynamodb', region_name=region)
+        params = {}
+        if "limit" in arguments:
+            params["Limit"] = arguments["limit"]
+        if "exclusive_start_table_name" in arguments:
+            params["ExclusiveStartTableName"] = arguments["exclusive_start_table_name"]
+        return await aws.run("dynamodb", dynamodb_client.list_tables, **params)
+
+    return await regional(aws, arguments, list_tables, "TableNames",
+                          tag=lambda name, region: {"TableName": name, "Region": region})
+
+
+async def dynamodb_table_delete(aws, arguments: dict):
+    """Delete a table"""
+    dynamodb_client = await aws.client('dynamodb')
+    return await aws.run("dynamodb", dynamodb_client.delete_table,
+        TableName=arguments["table_name"])
+
+
+async def dynamodb_table_update(aws, arguments: dict):
+    """Update a table's attribute definitions"""
+    dynamodb_client = await aws.client('dynamodb')
+    update_params = {
+        "TableName": arguments["table_name"],
+        "AttributeDefinitions": arguments["attribute_definitions"]
+    }
+    return await aws.run("dynamodb", dynamodb_client.update_table, **update_params)
+
+
+async def dynamodb_describe_ttl(aws, arguments: dict):
+    """Describe a table's TTL settings"""
+    dynamodb_client = await aws.client('dynamodb')
+    return await aws.run("dynamodb", dynamodb_client.describe_time_to_live,
+        TableName=arguments["table_name"]
+    )
+
+
+async def dynamodb_update_ttl(aws, arguments: dict):
+    """Update a table's TTL settings"""
+    dynamodb_client = await aws.client('dynamodb')
+    return await aws.run("dynamodb", dynamodb_client.update_time_to_live,
+        TableName=arguments["table_name"],
+        TimeToLiveSpecification={
+            'Enabled': arguments["ttl_enabled"],
+            'AttributeName': arguments["ttl_attribute"]
+        }
+    )
+
+
+async def dynamodb_item_put(aws, arguments: dict):
+    """Put an item"""
+    dynamodb_client = await aws.client('dynamodb')
+    plain_json = arguments.get("plain_json", False)
+    item = arguments["item"]
+    if plain_json:
+        item = marshal_item(item)
+    return await aws.run("dynamodb", dynamodb_client.put_item,
+        TableName=arguments["table_name"],
+        Item=item
+    )
+
+
+async def dynamodb_item_get(aws, arguments: dict):
+    """Get an item"""
+    dynamodb_client = await aws.client('dynamodb')
+    plain_json = arguments.get("plain_json", False)
+    key = arguments["key"]
+    if plain_json:
+        key = marshal_item(key)
+    get_params = apply_projection({
+        "TableName": arguments["table_name"],
+        "Key": key
+    }, arguments.get("projection"))
+    response = await aws.run("dynamodb", dynamodb_client.get_item, **get_params)
+    return unmarshal_response(response) if plain_json else response
+
+
+async def dynamodb_item_update(aws, arguments: dict):
+    """Update an item"""
+    dynamodb_client = await aws.client('dynamodb')
+    return await aws.run("dynamodb", dynamodb_client.update_item,
+        TableName=arguments["table_name"],
+        Key=arguments["key"],
+        AttributeUpdates=arguments["item"]
+    )
+
+
+async def dynamodb_item_delete(aws, arguments: dict):
+    """Delete an item"""
+    dynamodb_client = await aws.client('dynamodb')
+    return await aws.run("dynamodb", dynamodb_client.delete_item,
+        TableName=arguments["table_name"],
+        Key=arguments["key"]
+    )
+
+
+async def dynamodb_item_query(aws, arguments: dict):
+    """Query a table or index with pagination"""
+    dynamodb_client = await aws.client('dynamodb')
+    plain_json = arguments.get("plain_json", False)
+    query_params = {
+        "TableName": arguments["table_name"],
+        "KeyConditionExpression": arguments["key_condition"],
+        "ExpressionAttributeValues": arguments["expression_values"]
+    }
+    if plain_json:
+        query_params["ExpressionAttributeValues"] = marshal_item(arguments["expression_values"])
+    if "index_name" in arguments:
+        query_params["IndexName"] = arguments["index_name"]
+    if "expression_names" in arguments:
+        query_params["ExpressionAttributeNames"] = arguments["expression_names"]
+    if "filter_expression" in arguments:
+        query_params["FilterExpression"] = arguments["filter_expression"]
+    if "scan_forward" in arguments:
+        query_params["ScanIndexForward"] = arguments["scan_forward"]
+    if "consistent_read" in arguments:
+        query_params["ConsistentRead"] = arguments["consistent_read"]
+    if arguments.get("select"):
+        query_params["Select"] = arguments["select"]
+    if query_params.get("Select") != "COUNT":
+        apply_projection(query_params, arguments.get("projection"))
+
+    response = await aws.run(
+        "dynamodb", paginated_query, dynamodb_client, query_params,
+        limit=arguments.get("limit"),
+        all_pages=arguments.get("all_pages", False),
+        cursor=arguments.get("cursor")
+    )
+    return unmarshal_response(response) if plain_json else response
+
+
+async def dynamodb_item_scan(aws, arguments: dict):
+    """Scan a table, optionally with the paginating parallel scan engine"""
+    dynamodb_client = await aws.client('dynamodb')
+    plain_json = arguments.get("plain_json", False)
+    scan_params = {"TableName": arguments["table_name"]}
+
+    if "filter_expression" in arguments:
+        scan_params["FilterExpression"] = arguments["filter_expression"]
+
+        if "expression_attributes" in arguments:
+            attrs = arguments["expression_attributes"]
+            if "names" in attrs:
+                scan_params["ExpressionAttributeNames"] = attrs["names"]
+            if "values" in attrs:
+                scan_params["ExpressionAttributeValues"] = (
+                    marshal_item(attrs["values"]) if plain_json else attrs["values"])
+
+    apply_projection(scan_params, arguments.get("projection"))
+    if any(option in arguments for option in SCAN_ENGINE_OPTIONS):
+        response = await aws.run(
+            "dynamodb", parallel_scan, dynamodb_client, scan_params,
+            total_segments=arguments.get("total_segments"),
+            limit=arguments.get("limit"),
+            cursor=arguments.get("cursor"),
+            max_capacity_per_second=arguments.get("max_capacity_per_second"),
+            max_concurrency=arguments.get("max_concurrency")
+        )
+    else:
+        response = await aws.run("dynamodb", dynamodb_client.scan, **scan_params)
+    return unmarshal_response(response) if plain_json else response
+
+
+async def dynamodb_batch_get(aws, arguments: dict):
+    """Read any number of keys in concurrent batches"""
+    dynamodb_client = await aws.client('dynamodb')
+    request_items = {
+        table: apply_projection(dict(request), arguments.get("projection"))
+        for table, request in arguments["request_items"].items()
+    }
+    return await aws.run(
+        "dynamodb", batch_get, dynamodb_client, request_items,
+        max_concurrency=arguments.get("max_concurrency"),
+        max_attempts=arguments.get("max_attempts")
+    )
+
+
+async def dynamodb_item_batch_write(aws, arguments: dict):
+    """Write or delete items in concurrent batches, or replay a spill file by its id"""
+    dynamodb_client = await aws.client('dynamodb')
+    table_name = arguments["table_name"]
+    key_attributes = arguments.get("key_attributes")
+
+    if "spill_id" in arguments:
+        spill_path = resolve_spill_id(table_name, arguments["spill_id"])
+        # Claim the spill file first so failures of this replay start a fresh one
+        replay_path = spill_path.with_name(spill_path.name + ".replay")
+        os.replace(spill_path, replay_path)
+        requests = load_spilled_requests(replay_path)
+    else:
+        operation = arguments["operation"]
+        items = arguments.get("items")
+        if not items:
+            raise ValueError("No items provided for batch operation")
+
+        if operation == "put":
+            requests = [{'PutRequest': {'Item': item}} for item in marshal_items(items)]
+        elif operation == "delete":
+            keys = [{k: item[k] for k in key_attributes} for item in items] if key_attributes else items
+            requests = [{'DeleteRequest': {'Key': key}} for key in marshal_items(keys)]
+        else:
+            raise ValueError(f"Unsupported batch operation: {operation}")
+        if operation == "delete" and not key_attributes:
+            key_attributes = list(items[0].keys())
+
+    try:
+        response = await aws.run(
+            "dynamodb", batch_write, dynamodb_client, table_name, requests,
+            key_attributes=key_attributes,
+            max_concurrency=arguments.get("max_concurrency"),
+            max_attempts=arguments.get("max_attempts")
+        )
+    except Exception:
+        if "spill_id" in arguments:
+            os.replace(replay_path, spill_path)
+        raise
+    if "spill_id" in arguments:
+        os.unlink(replay_path)
+    return response
+
+
+async def dynamodb_batch_execute(aws, arguments: dict):
+    """Run PartiQL statements in concurrent batches"""
+    dynamodb_client = await aws.client('dynamodb')
+    if "next_token" in arguments:
+        if len(arguments["statements"]) != 1:
+            raise ValueError("next_token resumes a single SELECT statement")
+        response = await aws.run(
+            "dynamodb", execute_paginated, dynamodb_client, arguments["statements"][0],
+            (arguments.get("parameters") or [None])[0],
+            limit=arguments.get("limit"),
+            next_token=arguments["next_token"],
+            consistent_read=arguments.get("consistent_read", False)
+        )
+    else:
+        response = await aws.run(
+            "dynamodb", batch_execute, dynamodb_client, arguments["statements"],
+            arguments.get("parameters"),
+            max_concurrency=arguments.get("max_concurrency"),
+            max_attempts=arguments.get("max_attempts"),
+            paginate_selects=arguments.get("paginate_selects", False),
+            limit=arguments.get("limit"),
+            consistent_read=arguments.get("consistent_read", False)
+        )
+    return response
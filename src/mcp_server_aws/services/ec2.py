@@ -0,0 +1,81 @@
+import os
+import time
+from ..clients import DEFAULT_REGION
+from ..ec2 import change_instance_states, describe_instances, instance_filters
+from ..regions import regional
+from . import get_progress_reporter
+
+
+async def ec2_list_instances(aws, arguments: dict):
+    """List instances matching filters across all pages, in one region or several"""
+    filters = instance_filters(arguments.get("filters"), arguments.get("states"), arguments.get("tags"))
+    summary = arguments.get("view", "full") == "summary"
+
+    async def describe(region):
+        ec2_client = await aws.client('ec2', region_name=region)
+        return await aws.run(
+            "ec2", describe_instances, ec2_client, filters,
+            max_results=arguments.get("max_results"),
+            max_instances=arguments.get("max_instances"),
+            next_token=arguments.get("next_token"),
+            summary=summary
+        )
+
+    return await regional(aws, arguments, describe, "Instances" if summary else "Reservations")
+
+
+async def _change_states(aws, action: str, arguments: dict):
+    ec2_client = await aws.client('ec2')
+    return await aws.run(
+        "ec2", change_instance_states, ec2_client, action, arguments["instance_ids"],
+        chunk_size=arguments.get("chunk_size"),
+        max_concurrency=arguments.get("max_concurrency"),
+        requests_per_second=arguments.get("requests_per_second"),
+        wait=arguments.get("wait", False),
+        wait_timeout=arguments.get("wait_timeout"),
+        poll_interval=arguments.get("poll_interval"),
+        progress=get_progress_reporter()
+    )
+
+
+async def ec2_start_instances(aws, arguments: dict):
+    """Start instances in concurrent chunks, optionally waiting until they run"""
+    return await _change_states(aws, "start", arguments)
+
+
+async def ec2_stop_instances(aws, arguments: dict):
+    """Stop instances in concurrent chunks, optionally waiting until they stop"""
+    return await _change_states(aws, "stop", arguments)
+
+
+async def ec2_describe_instance(aws, arguments: dict):
+    """Describe one instance"""
+    ec2_client = await aws.client('ec2')
+    return await aws.run("ec2", ec2_client.describe_instances, InstanceIds=[arguments["instance_id"]])
+
+
+async def ec2_inventory_query(aws, arguments: dict):
+    """Answer an instance lookup from the local inventory index"""
+    region = arguments.get("region") or os.getenv("AWS_REGION") or DEFAULT_REGION
+    max_staleness = 0 if arguments.get("refresh") else arguments.get("max_staleness")
+    inventory = await aws.run("ec2", aws.inventory.get, region, max_staleness)
+
+    started = time.perf_counter()
+    instances = inventory.query(
+        states=arguments.get("states"),
+        instance_types=arguments.get("instance_types"),
+        vpc_ids=arguments.get("vpc_ids"),
+        subnet_ids=arguments.get("subnet_ids"),
+        availability_zones=arguments.get("availability_zones"),
+        tags=arguments.get("tags"),
+        limit=arguments.get("limit")
+    )
+    query_seconds = time.perf_counter() - started
+    return {
+        "Instances": instances,
+        "Count": len(instances),
+        "Region": region,
+        "IndexedInstances": len(inventory),
+        **inventory.staleness(),
+        "QueryMicroseconds": round(query_seconds * 1_000_000, 1),
+    }
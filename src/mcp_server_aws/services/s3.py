@@ -0,0 +1,145 @@
+import base64
+from mcp.types import TextContent
+from ..s3 import S3Engine, S3CliEngine, resolve_download_path, use_cli_fallback
+from . import get_progress_reporter
+
+
+async def s3_bucket_create(aws, arguments: dict):
+    """Create a bucket"""
+    s3_client = await aws.client('s3', region_name=arguments.get("region"))
+    engine = S3CliEngine() if use_cli_fallback() else S3Engine(s3_client)
+    return await aws.run("s3", engine.create_bucket, arguments["bucket_name"], arguments.get("region"))
+
+
+async def s3_bucket_list(aws, arguments: dict):
+    """List buckets"""
+    s3_client = await aws.client('s3', region_name=arguments.get("region"))
+    return await aws.run("s3", s3_client.list_buckets)
+
+
+async def s3_bucket_delete(aws, arguments: dict):
+    """Delete a bucket"""
+    s3_client = await aws.client('s3', region_name=arguments.get("region"))
+    return await aws.run("s3", s3_client.delete_bucket, Bucket=arguments["bucket_name"])
+
+
+async def s3_object_upload(aws, arguments: dict):
+    """Upload an object, in parallel parts above the multipart threshold"""
+    s3_client = await aws.client('s3', region_name=arguments.get("region"))
+    engine = S3CliEngine() if use_cli_fallback() else S3Engine(s3_client)
+    content = base64.b64decode(arguments["file_content"])
+    return await aws.run(
+        "s3", engine.upload_object, arguments["bucket_name"], arguments["object_key"], content,
+        multipart_threshold=arguments.get("multipart_threshold"),
+        part_size=arguments.get("part_size"),
+        max_concurrency=arguments.get("max_concurrency"),
+        progress=get_progress_reporter()
+    )
+
+
+async def s3_object_upload_chunk(aws, arguments: dict):
+    """Stream an object to S3 one chunk per call"""
+    s3_client = await aws.client('s3', region_name=arguments.get("region"))
+    if "upload_id" in arguments:
+        upload = aws.chunked_uploads.get(arguments["upload_id"])
+        engine = S3Engine(await aws.client('s3', region_name=upload.region))
+    else:
+        engine = S3Engine(s3_client)
+        upload = await aws.run(
+            "s3", aws.chunked_uploads.start, engine, arguments["bucket_name"], arguments["object_key"],
+            part_size=arguments.get("part_size"),
+            region=arguments.get("region")
+        )
+
+    if arguments.get("abort"):
+        response = await aws.run("s3", aws.chunked_uploads.abort, engine, upload)
+    else:
+        chunk = base64.b64decode(arguments.get("file_content", ""))
+        response = await aws.run(
+            "s3", aws.chunked_uploads.append, engine, upload, chunk,
+            offset=arguments.get("offset"),
+            final=arguments.get("final", False),
+            max_concurrency=arguments.get("max_concurrency"),
+            progress=get_progress_reporter()
+        )
+    return response
+
+
+async def s3_object_delete(aws, arguments: dict):
+    """Delete an object"""
+    s3_client = await aws.client('s3', region_name=arguments.get("region"))
+    engine = S3CliEngine() if use_cli_fallback() else S3Engine(s3_client)
+    return await aws.run("s3", engine.delete_object, arguments["bucket_name"], arguments["object_key"])
+
+
+async def s3_object_list(aws, arguments: dict):
+    """List a page of objects, or every object with exhaustive"""
+    s3_client = await aws.client('s3', region_name=arguments.get("region"))
+    engine = S3CliEngine() if use_cli_fallback() else S3Engine(s3_client)
+    if arguments.get("exhaustive"):
+        response = await aws.run(
+            "s3", S3Engine(s3_client).list_objects_exhaustive, arguments["bucket_name"],
+            prefix=arguments.get("prefix"),
+            delimiter=arguments.get("delimiter"),
+            max_keys=arguments.get("max_keys"),
+            max_concurrency=arguments.get("max_concurrency")
+        )
+    elif isinstance(engine, S3Engine):
+        response = await aws.run(
+            "s3", engine.list_objects, arguments["bucket_name"],
+            prefix=arguments.get("prefix"),
+            delimiter=arguments.get("delimiter"),
+            start_after=arguments.get("start_after"),
+            max_keys=arguments.get("max_keys"),
+            cursor=arguments.get("cursor")
+        )
+    else:
+        response = await aws.run("s3", engine.list_objects, arguments["bucket_name"])
+    return response
+
+
+async def s3_object_read(aws, arguments: dict):
+    """Read or page through an object"""
+    s3_client = await aws.client('s3', region_name=arguments.get("region"))
+    bucket_name = arguments["bucket_name"]
+    object_key = arguments["object_key"]
+    encoding = arguments.get("encoding", "auto")
+    engine = S3Engine(s3_client)
+
+    if "head_lines" in arguments or "tail_lines" in arguments:
+        response = await aws.run(
+            "s3", engine.read_lines, bucket_name, object_key,
+            head=arguments.get("head_lines"),
+            tail=arguments.get("tail_lines")
+        )
+    elif arguments.get("paged") or "cursor" in arguments:
+        response = await aws.run(
+            "s3", engine.read_page, bucket_name, object_key,
+            cursor=arguments.get("cursor"),
+            chunk_size=arguments.get("chunk_size"),
+            encoding=encoding
+        )
+    elif "offset" in arguments or "length" in arguments or "encoding" in arguments:
+        response = await aws.run(
+            "s3", engine.read_range, bucket_name, object_key,
+            offset=arguments.get("offset", 0),
+            length=arguments.get("length"),
+            encoding=encoding
+        )
+    else:
+        engine = S3CliEngine() if use_cli_fallback() else engine
+        content = await aws.run("s3", engine.read_object, bucket_name, object_key)
+        return [TextContent(type="text", text=content)]
+    return response
+
+
+async def s3_object_download(aws, arguments: dict):
+    """Download an object to a file in the download directory"""
+    path = resolve_download_path(arguments["download_path"])
+    s3_client = await aws.client('s3', region_name=arguments.get("region"))
+    return await aws.run(
+        "s3", S3Engine(s3_client).download_object, arguments["bucket_name"], arguments["object_key"], path,
+        part_size=arguments.get("part_size"),
+        max_concurrency=arguments.get("max_concurrency"),
+        progress=get_progress_reporter()
+    )
@@ -1,751 +1,1554 @@
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
 from mcp.types import Tool
+from .ec2 import INSTANCE_STATES
+from .formatting import OUTPUT_FORMATS
 
+COST_CLASSES = ("low", "medium", "high")
+
+# Options accepted by every tool
+COMMON_PROPERTIES = {
+    "output_format": {
+        "type": "string",
+        "enum": list(OUTPUT_FORMATS),
+        "description": "Response format: compact JSON, pretty JSON or a CSV table of the main result list (defaults to AWS_MCP_OUTPUT_FORMAT or pretty)"
+    },
+    "fields": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Only return these dotted response paths; lists are mapped over (e.g. Functions.FunctionName)"
+    },
+    "query": {
+        "type": "string",
+        "description": "JMESPath expression applied to the response before it is returned"
+    },
+    "include_metadata": {
+        "type": "boolean",
+        "description": "Keep the ResponseMetadata block (HTTP status, headers, request id), dropped by default"
+    }
+}
+
+
+CACHE_PROPERTIES = {
+    "bypass_cache": {
+        "type": "boolean",
+        "description": "Fetch a fresh result from AWS instead of the response cache or a local metadata index (both are still refreshed)"
+    }
+}
+
+
+# Options of list tools that can fan out across regions
+REGION_PROPERTIES = {
+    "regions": {
+        "type": ["array", "string"],
+        "items": {"type": "string"},
+        "description": "Query these regions concurrently instead of the default one, or \"all\" for every region enabled in the account; results are merged and tagged with their Region"
+    },
+    "region_concurrency": {
+        "type": "integer",
+        "description": "Maximum number of regions queried at once (defaults to AWS_MCP_REGION_CONCURRENCY or 8)"
+    },
+    "region_timeout": {
+        "type": "number",
+        "description": "Seconds before a region is reported as failed (defaults to AWS_MCP_REGION_TIMEOUT or 30)"
+    }
+}
+
+
+# Options of the bulk EC2 start/stop tools
+STATE_CHANGE_PROPERTIES = {
+    "chunk_size": {
+        "type": "integer",
+        "description": "Instance IDs per API request (default 50)"
+    },
+    "max_concurrency": {
+        "type": "integer",
+        "description": "Requests in flight at once (default 4)"
+    },
+    "requests_per_second": {
+        "type": "number",
+        "description": "Rate limit shared by the state change and status polling requests (default 5)"
+    },
+    "wait_timeout": {
+        "type": "number",
+        "description": "Seconds to wait for the target state before reporting a timeout (default 600)"
+    },
+    "poll_interval": {
+        "type": "number",
+        "description": "Seconds between describe_instance_status polls (default 5)"
+    }
+}
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """A tool's schema together with everything call_tool needs to dispatch it
+
+    handler is an async callable taking (aws, arguments). cost is a rough
+    class of the AWS work one call does: low for a single request, medium
+    for paginated or multi-request reads and high for bulk writes, scans
+    and transfers. A positive cache_ttl lets the response cache keep the
+    tool's results for that many seconds.
+    """
+    tool: Tool
+    handler: Callable[..., Awaitable[Any]]
+    read_only: bool
+    cost: str = "low"
+    cache_ttl: float = 0
+    service: str = ""
+
+    @property
+    def name(self) -> str:
+        return self.tool.name
+
+
+def with_common_properties(spec: ToolSpec) -> ToolSpec:
+    properties = spec.tool.inputSchema.setdefault("properties", {})
+    for name, schema in COMMON_PROPERTIES.items():
+        properties.setdefault(name, schema)
+    if spec.cache_ttl > 0:
+        for name, schema in CACHE_PROPERTIES.items():
+            properties.setdefault(name, schema)
+    return spec
+
+
+def get_s3_tools() -> list[ToolSpec]:
+    from .services import s3 as handlers
 
-def get_s3_tools() -> list[Tool]:
     return [
-        Tool(
-            name="s3_bucket_create",
-            description="Create a new S3 bucket",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "bucket_name": {
-                        "type": "string",
-                        "description": "Name of the S3 bucket to create"
+        ToolSpec(
+            Tool(
+                name="s3_bucket_create",
+                description="Create a new S3 bucket",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "bucket_name": {
+                            "type": "string",
+                            "description": "Name of the S3 bucket to create"
+                        },
+                        "region": {
+                            "type": "string",
+                            "description": "AWS region where the bucket should be created (e.g., us-west-2)"
+                        }
                     },
-                    "region": {
-                        "type": "string",
-                        "description": "AWS region where the bucket should be created (e.g., us-west-2)"
-                    }
-                },
-                "required": ["bucket_name"]
-            }
-        ),
-        Tool(
-            name="s3_bucket_list",
-            description="List all S3 buckets",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="s3_bucket_delete",
-            description="Delete an S3 bucket",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "bucket_name": {
-                        "type": "string",
-                        "description": "Name of the S3 bucket to delete"
-                    }
-                },
-                "required": ["bucket_name"]
-            }
-        ),
-        Tool(
-            name="s3_object_upload",
-            description="Upload an object to S3",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "bucket_name": {
-                        "type": "string",
-                        "description": "Name of the S3 bucket"
+                    "required": ["bucket_name"]
+                }
+            ),
+            handler=handlers.s3_bucket_create,
+            read_only=False,
+            cost="low"
+        ),
+        ToolSpec(
+            Tool(
+                name="s3_bucket_list",
+                description="List all S3 buckets",
+                inputSchema={
+                    "type": "object",
+                    "properties": {}
+                }
+            ),
+            handler=handlers.s3_bucket_list,
+            read_only=True,
+            cost="low",
+            cache_ttl=30
+        ),
+        ToolSpec(
+            Tool(
+                name="s3_bucket_delete",
+                description="Delete an S3 bucket",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "bucket_name": {
+                            "type": "string",
+                            "description": "Name of the S3 bucket to delete"
+                        }
                     },
-                    "object_key": {
-                        "type": "string",
-                        "description": "Key/path of the object in the bucket"
+                    "required": ["bucket_name"]
+                }
+            ),
+            handler=handlers.s3_bucket_delete,
+            read_only=False,
+            cost="low"
+        ),
+        ToolSpec(
+            Tool(
+                name="s3_object_upload",
+                description="Upload an object to S3",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "bucket_name": {
+                            "type": "string",
+                            "description": "Name of the S3 bucket"
+                        },
+                        "object_key": {
+                            "type": "string",
+                            "description": "Key/path of the object in the bucket"
+                        },
+                        "file_content": {
+                            "type": "string",
+                            "description": "Base64 encoded file content for upload"
+                        },
+                        "multipart_threshold": {
+                            "type": "integer",
+                            "description": "Size in bytes above which a parallel multipart upload is used (default 8 MiB)"
+                        },
+                        "part_size": {
+                            "type": "integer",
+                            "description": "Multipart part size in bytes (minimum 5 MiB, default 8 MiB)"
+                        },
+                        "max_concurrency": {
+                            "type": "integer",
+                            "description": "Maximum number of parts uploaded in parallel (default 4)"
+                        }
                     },
-                    "file_content": {
-                        "type": "string",
-                        "description": "Base64 encoded file content for upload"
+                    "required": ["bucket_name", "object_key", "file_content"]
+                }
+            ),
+            handler=handlers.s3_object_upload,
+            read_only=False,
+            cost="high"
+        ),
+        ToolSpec(
+            Tool(
+                name="s3_object_upload_chunk",
+                description="Upload a large object across several calls. Omit upload_id to start an upload, pass the returned upload_id with each following chunk and set final on the last one",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "bucket_name": {
+                            "type": "string",
+                            "description": "Name of the S3 bucket (required to start an upload)"
+                        },
+                        "object_key": {
+                            "type": "string",
+                            "description": "Key/path of the object in the bucket (required to start an upload)"
+                        },
+                        "region": {
+                            "type": "string",
+                            "description": "AWS region of the bucket"
+                        },
+                        "upload_id": {
+                            "type": "string",
+                            "description": "Upload id returned by the first call"
+                        },
+                        "file_content": {
+                            "type": "string",
+                            "description": "Base64 encoded chunk of the object"
+                        },
+                        "offset": {
+                            "type": "integer",
+                            "description": "Byte offset of this chunk, checked against the bytes received so far"
+                        },
+                        "final": {
+                            "type": "boolean",
+                            "description": "Set on the last chunk to complete the upload"
+                        },
+                        "abort": {
+                            "type": "boolean",
+                            "description": "Abort the upload and discard uploaded parts"
+                        },
+                        "part_size": {
+                            "type": "integer",
+                            "description": "Multipart part size in bytes (minimum 5 MiB, default 8 MiB)"
+                        },
+                        "max_concurrency": {
+                            "type": "integer",
+                            "description": "Maximum number of parts uploaded in parallel (default 4)"
+                        }
                     }
-                },
-                "required": ["bucket_name", "object_key", "file_content"]
-            }
-        ),
-        Tool(
-            name="s3_object_delete",
-            description="Delete an object from S3",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "bucket_name": {
-                        "type": "string",
-                        "description": "Name of the S3 bucket"
+                }
+            ),
+            handler=handlers.s3_object_upload_chunk,
+            read_only=False,
+            cost="medium"
+        ),
+        ToolSpec(
+            Tool(
+                name="s3_object_delete",
+                description="Delete an object from S3",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "bucket_name": {
+                            "type": "string",
+                            "description": "Name of the S3 bucket"
+                        },
+                        "object_key": {
+                            "type": "string",
+                            "description": "Key/path of the object to delete"
+                        }
                     },
-                    "object_key": {
-                        "type": "string",
-                        "description": "Key/path of the object to delete"
-                    }
-                },
-                "required": ["bucket_name", "object_key"]
-            }
-        ),
-        Tool(
-            name="s3_object_list",
-            description="List objects in an S3 bucket",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "bucket_name": {
-                        "type": "string",
-                        "description": "Name of the S3 bucket"
-                    }
-                },
-                "required": ["bucket_name"]
-            }
-        ),
-        Tool(
-            name="s3_object_read",
-            description="Read an object's content from S3",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "bucket_name": {
-                        "type": "string",
-                        "description": "Name of the S3 bucket"
+                    "required": ["bucket_name", "object_key"]
+                }
+            ),
+            handler=handlers.s3_object_delete,
+            read_only=False,
+            cost="low"
+        ),
+        ToolSpec(
+            Tool(
+                name="s3_object_list",
+                description="List objects in an S3 bucket. Returns NextCursor when more keys remain",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "bucket_name": {
+                            "type": "string",
+                            "description": "Name of the S3 bucket"
+                        },
+                        "prefix": {
+                            "type": "string",
+                            "description": "Only list keys beginning with this prefix"
+                        },
+                        "delimiter": {
+                            "type": "string",
+                            "description": "Group keys sharing a prefix up to this character into CommonPrefixes (e.g. /)"
+                        },
+                        "start_after": {
+                            "type": "string",
+                            "description": "Start listing after this key"
+                        },
+                        "max_keys": {
+                            "type": "integer",
+                            "description": "Maximum number of keys to return (default 1000)"
+                        },
+                        "cursor": {
+                            "type": "string",
+                            "description": "NextCursor returned by a previous call"
+                        },
+                        "exhaustive": {
+                            "type": "boolean",
+                            "description": "List every key under the prefix, fanning out over common prefixes in parallel"
+                        },
+                        "max_concurrency": {
+                            "type": "integer",
+                            "description": "Maximum number of prefixes listed in parallel in exhaustive mode (default 8)"
+                        }
                     },
-                    "object_key": {
-                        "type": "string",
-                        "description": "Key/path of the object to read"
-                    }
-                },
-                "required": ["bucket_name", "object_key"]
-            }
+                    "required": ["bucket_name"]
+                }
+            ),
+            handler=handlers.s3_object_list,
+            read_only=True,
+            cost="medium"
+        ),
+        ToolSpec(
+            Tool(
+                name="s3_object_read",
+                description="Read an object's content from S3. Supports byte ranges, head/tail line windows and paged reads with a cursor",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "bucket_name": {
+                            "type": "string",
+                            "description": "Name of the S3 bucket"
+                        },
+                        "object_key": {
+                            "type": "string",
+                            "description": "Key/path of the object to read"
+                        },
+                        "offset": {
+                            "type": "integer",
+                            "description": "Byte offset to start reading from; negative values count from the end of the object"
+                        },
+                        "length": {
+                            "type": "integer",
+                            "minimum": 1,
+                            "description": "Number of bytes to read from offset"
+                        },
+                        "head_lines": {
+                            "type": "integer",
+                            "minimum": 1,
+                            "description": "Return only the first N lines; cannot be combined with tail_lines"
+                        },
+                        "tail_lines": {
+                            "type": "integer",
+                            "minimum": 1,
+                            "description": "Return only the last N lines; cannot be combined with head_lines"
+                        },
+                        "paged": {
+                            "type": "boolean",
+                            "description": "Read the object in fixed-size chunks; pass the returned NextCursor to continue"
+                        },
+                        "cursor": {
+                            "type": "string",
+                            "description": "Cursor returned by a previous paged read"
+                        },
+                        "chunk_size": {
+                            "type": "integer",
+                            "minimum": 1,
+                            "description": "Bytes per page in paged mode (default 1 MiB)"
+                        },
+                        "encoding": {
+                            "type": "string",
+                            "enum": ["auto", "text", "base64"],
+                            "description": "How to render the bytes; auto returns UTF-8 text as-is and base64 otherwise"
+                        },
+                    },
+                    "required": ["bucket_name", "object_key"]
+                }
+            ),
+            handler=handlers.s3_object_read,
+            read_only=True,
+            cost="high"
+        ),
+        ToolSpec(
+            Tool(
+                name="s3_object_download",
+                description="Download an object to a local file in the server's download directory using parallel ranged GETs",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "bucket_name": {
+                            "type": "string",
+                            "description": "Name of the S3 bucket"
+                        },
+                        "object_key": {
+                            "type": "string",
+                            "description": "Key/path of the object to download"
+                        },
+                        "download_path": {
+                            "type": "string",
+                            "description": "File to write, relative to the download directory (AWS_MCP_S3_DOWNLOAD_DIR); paths resolving outside it are rejected"
+                        },
+                        "part_size": {
+                            "type": "integer",
+                            "description": "Range size in bytes for parallel downloads (default 8 MiB)"
+                        },
+                        "max_concurrency": {
+                            "type": "integer",
+                            "description": "Maximum number of ranges downloaded in parallel (default 4)"
+                        }
+                    },
+                    "required": ["bucket_name", "object_key", "download_path"]
+                }
+            ),
+            handler=handlers.s3_object_download,
+            read_only=False,
+            cost="high"
         ),
     ]
 
 
-def get_dynamodb_tools() -> list[Tool]:
+def get_dynamodb_tools() -> list[ToolSpec]:
+    from .services import dynamodb as handlers
+
     return [
-        Tool(
-            name="dynamodb_table_create",
-            description="Create a new DynamoDB table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "Name of the DynamoDB table"
-                    },
-                    "key_schema": {
-                        "type": "array",
-                        "description": "Key schema for table creation"
-                    },
-                    "attribute_definitions": {
-                        "type": "array",
-                        "description": "Attribute definitions for table creation"
-                    }
-                },
-                "required": ["table_name", "key_schema", "attribute_definitions"]
-            }
-        ),
-        Tool(
-            name="dynamodb_table_describe",
-            description="Get details about a DynamoDB table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "Name of the DynamoDB table"
-                    }
-                },
-                "required": ["table_name"]
-            }
-        ),
-        Tool(
-            name="dynamodb_table_list",
-            description="List all DynamoDB tables",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="dynamodb_table_delete",
-            description="Delete a DynamoDB table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "Name of the DynamoDB table"
-                    }
-                },
-                "required": ["table_name"]
-            }
-        ),
-        Tool(
-            name="dynamodb_table_update",
-            description="Update a DynamoDB table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "Name of the DynamoDB table"
-                    },
-                    "attribute_definitions": {
-                        "type": "array",
-                        "description": "Updated attribute definitions"
-                    }
-                },
-                "required": ["table_name", "attribute_definitions"]
-            }
-        ),
-        Tool(
-            name="dynamodb_item_put",
-            description="Put an item into a DynamoDB table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "Name of the DynamoDB table"
+        ToolSpec(
+            Tool(
+                name="dynamodb_table_create",
+                description="Create a new DynamoDB table",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "table_name": {
+                            "type": "string",
+                            "description": "Name of the DynamoDB table"
+                        },
+                        "key_schema": {
+                            "type": "array",
+                            "description": "Key schema for table creation"
+                        },
+                        "attribute_definitions": {
+                            "type": "array",
+                            "description": "Attribute definitions for table creation"
+                        }
                     },
-                    "item": {
-                        "type": "object",
-                        "description": "Item data to put"
-                    }
-                },
-                "required": ["table_name", "item"]
-            }
-        ),
-        Tool(
-            name="dynamodb_item_get",
-            description="Get an item from a DynamoDB table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "Name of the DynamoDB table"
+                    "required": ["table_name", "key_schema", "attribute_definitions"]
+                }
+            ),
+            handler=handlers.dynamodb_table_create,
+            read_only=False,
+            cost="low"
+        ),
+        ToolSpec(
+            Tool(
+                name="dynamodb_table_describe",
+                description="Get details about a DynamoDB table",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "table_name": {
+                            "type": "string",
+                            "description": "Name of the DynamoDB table"
+                        }
                     },
-                    "key": {
-                        "type": "object",
-                        "description": "Key to identify the item"
+                    "required": ["table_name"]
+                }
+            ),
+            handler=handlers.dynamodb_table_describe,
+            read_only=True,
+            cost="low",
+            cache_ttl=30
+        ),
+        ToolSpec(
+            Tool(
+                name="dynamodb_table_list",
+                description="List all DynamoDB tables",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "limit": {
+                            "type": "integer",
+                            "minimum": 1,
+                            "description": "Maximum number of table names to return (at most 100 per call)"
+                        },
+                        "exclusive_start_table_name": {
+                            "type": "string",
+                            "description": "LastEvaluatedTableName from a previous call to resume listing; with regions, one region and its entry from NextTokens"
+                        },
+                        **REGION_PROPERTIES
                     }
-                },
-                "required": ["table_name", "key"]
-            }
-        ),
-        Tool(
-            name="dynamodb_item_update",
-            description="Update an item in a DynamoDB table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "Name of the DynamoDB table"
-                    },
-                    "key": {
-                        "type": "object",
-                        "description": "Key to identify the item"
+                }
+            ),
+            handler=handlers.dynamodb_table_list,
+            read_only=True,
+            cost="low",
+            cache_ttl=30
+        ),
+        ToolSpec(
+            Tool(
+                name="dynamodb_table_delete",
+                description="Delete a DynamoDB table",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "table_name": {
+                            "type": "string",
+                            "description": "Name of the DynamoDB table"
+                        }
                     },
-                    "item": {
-                        "type": "object",
-                        "description": "Updated item data"
-                    }
-                },
-                "required": ["table_name", "key", "item"]
-            }
-        ),
-        Tool(
-            name="dynamodb_item_delete",
-            description="Delete an item from a DynamoDB table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "Name of the DynamoDB table"
+                    "required": ["table_name"]
+                }
+            ),
+            handler=handlers.dynamodb_table_delete,
+            read_only=False,
+            cost="low"
+        ),
+        ToolSpec(
+            Tool(
+                name="dynamodb_table_update",
+                description="Update a DynamoDB table",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "table_name": {
+                            "type": "string",
+                            "description": "Name of the DynamoDB table"
+                        },
+                        "attribute_definitions": {
+                            "type": "array",
+                            "description": "Updated attribute definitions"
+                        }
                     },
-                    "key": {
-                        "type": "object",
-                        "description": "Key to identify the item"
-                    }
-                },
-                "required": ["table_name", "key"]
-            }
-        ),
-        Tool(
-            name="dynamodb_item_query",
-            description="Query items in a DynamoDB table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "Name of the DynamoDB table"
+                    "required": ["table_name", "attribute_definitions"]
+                }
+            ),
+            handler=handlers.dynamodb_table_update,
+            read_only=False,
+            cost="low"
+        ),
+        ToolSpec(
+            Tool(
+                name="dynamodb_item_put",
+                description="Put an item into a DynamoDB table",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "table_name": {
+                            "type": "string",
+                            "description": "Name of the DynamoDB table"
+                        },
+                        "plain_json": {
+                            "type": "boolean",
+                            "description": "Take item as plain JSON instead of DynamoDB attribute values"
+                        },
+                        "item": {
+                            "type": "object",
+                            "description": "Item data to put"
+                        }
                     },
-                    "key_condition": {
-                        "type": "string",
-                        "description": "Key condition expression"
+                    "required": ["table_name", "item"]
+                }
+            ),
+            handler=handlers.dynamodb_item_put,
+            read_only=False,
+            cost="low"
+        ),
+        ToolSpec(
+            Tool(
+                name="dynamodb_item_get",
+                description="Get an item from a DynamoDB table",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "table_name": {
+                            "type": "string",
+                            "description": "Name of the DynamoDB table"
+                        },
+                        "plain_json": {
+                            "type": "boolean",
+                            "description": "Take key as plain JSON and return the item as plain JSON"
+                        },
+                        "key": {
+                            "type": "object",
+                            "description": "Key to identify the item"
+                        },
+                        "projection": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Attribute paths to return, sent to DynamoDB as a ProjectionExpression"
+                        }
                     },
-                    "expression_values": {
-                        "type": "object",
-                        "description": "Expression attribute values"
-                    }
-                },
-                "required": ["table_name", "key_condition", "expression_values"]
-            }
-        ),
-        Tool(
-            name="dynamodb_item_scan",
-            description="Scan items in a DynamoDB table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "Name of the DynamoDB table"
+                    "required": ["table_name", "key"]
+                }
+            ),
+            handler=handlers.dynamodb_item_get,
+            read_only=True,
+            cost="low"
+        ),
+        ToolSpec(
+            Tool(
+                name="dynamodb_item_update",
+                description="Update an item in a DynamoDB table",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "table_name": {
+                            "type": "string",
+                            "description": "Name of the DynamoDB table"
+                        },
+                        "key": {
+                            "type": "object",
+                            "description": "Key to identify the item"
+                        },
+                        "item": {
+                            "type": "object",
+                            "description": "Updated item data"
+                        }
                     },
-                    "filter_expression": {
-                        "type": "string",
-                        "description": "Filter expression"
+                    "required": ["table_name", "key", "item"]
+                }
+            ),
+            handler=handlers.dynamodb_item_update,
+            read_only=False,
+            cost="low"
+        ),
+        ToolSpec(
+            Tool(
+                name="dynamodb_item_delete",
+                description="Delete an item from a DynamoDB table",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "table_name": {
+                            "type": "string",
+                            "description": "Name of the DynamoDB table"
+                        },
+                        "key": {
+                            "type": "object",
+                            "description": "Key to identify the item"
+                        }
                     },
-                    "expression_attributes": {
-                        "type": "object",
-                        "properties": {
-                            "values": {
-                                "type": "object",
-                                "description": "Expression attribute values"
-                            },
-                            "names": {
-                                "type": "object",
-                                "description": "Expression attribute names"
-                            }
+                    "required": ["table_name", "key"]
+                }
+            ),
+            handler=handlers.dynamodb_item_delete,
+            read_only=False,
+            cost="low"
+        ),
+        ToolSpec(
+            Tool(
+                name="dynamodb_item_query",
+                description="Query items in a DynamoDB table",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "table_name": {
+                            "type": "string",
+                            "description": "Name of the DynamoDB table"
+                        },
+                        "plain_json": {
+                            "type": "boolean",
+                            "description": "Take expression_values as plain JSON and return items as plain JSON"
+                        },
+                        "key_condition": {
+                            "type": "string",
+                            "description": "Key condition expression"
+                        },
+                        "expression_values": {
+                            "type": "object",
+                            "description": "Expression attribute values"
+                        },
+                        "expression_names": {
+                            "type": "object",
+                            "description": "Expression attribute names (e.g. {\"#s\": \"status\"})"
+                        },
+                        "index_name": {
+                            "type": "string",
+                            "description": "Global or local secondary index to query"
+                        },
+                        "filter_expression": {
+                            "type": "string",
+                            "description": "Filter applied to items after the key condition"
+                        },
+                        "projection": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Attribute paths to return, sent to DynamoDB as a ProjectionExpression"
+                        },
+                        "select": {
+                            "type": "string",
+                            "enum": ["ALL_ATTRIBUTES", "ALL_PROJECTED_ATTRIBUTES", "COUNT"],
+                            "description": "Attributes to return; COUNT returns only the number of matching items"
+                        },
+                        "scan_forward": {
+                            "type": "boolean",
+                            "description": "Sort key order: true for ascending (default), false for descending"
+                        },
+                        "consistent_read": {
+                            "type": "boolean",
+                            "description": "Use strongly consistent reads (not supported on global secondary indexes)"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Read pages until this many items have been returned"
+                        },
+                        "all_pages": {
+                            "type": "boolean",
+                            "description": "Read every page when no limit is given; otherwise only the first page is read"
+                        },
+                        "cursor": {
+                            "type": "string",
+                            "description": "NextCursor returned by a previous query, to continue it"
                         }
-                    }
-                },
-                "required": ["table_name"]
-            }
-        ),
-        Tool(
-            name="dynamodb_batch_get",
-            description="Batch get multiple items from DynamoDB tables",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "request_items": {
-                        "type": "object",
-                        "description": "Map of table names to keys to retrieve",
-                        "additionalProperties": {
+                    },
+                    "required": ["table_name", "key_condition", "expression_values"]
+                }
+            ),
+            handler=handlers.dynamodb_item_query,
+            read_only=True,
+            cost="medium"
+        ),
+        ToolSpec(
+            Tool(
+                name="dynamodb_item_scan",
+                description="Scan items in a DynamoDB table",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "table_name": {
+                            "type": "string",
+                            "description": "Name of the DynamoDB table"
+                        },
+                        "plain_json": {
+                            "type": "boolean",
+                            "description": "Take expression attribute values as plain JSON and return items as plain JSON"
+                        },
+                        "filter_expression": {
+                            "type": "string",
+                            "description": "Filter expression"
+                        },
+                        "expression_attributes": {
                             "type": "object",
                             "properties": {
-                                "Keys": {
-                                    "type": "array",
-                                    "items": {
-                                        "type": "object"
-                                    }
-                                },
-                                "ConsistentRead": {
-                                    "type": "boolean"
+                                "values": {
+                                    "type": "object",
+                                    "description": "Expression attribute values"
                                 },
-                                "ProjectionExpression": {
-                                    "type": "string"
+                                "names": {
+                                    "type": "object",
+                                    "description": "Expression attribute names"
                                 }
-                            },
-                            "required": ["Keys"]
+                            }
+                        },
+                        "projection": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Attribute paths to return, sent to DynamoDB as a ProjectionExpression"
+                        },
+                        "all_pages": {
+                            "type": "boolean",
+                            "description": "Follow LastEvaluatedKey until the table is exhausted or limit is reached, instead of returning the first 1 MB page"
+                        },
+                        "total_segments": {
+                            "type": "integer",
+                            "description": "Split the scan into this many parallel segments"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Return at most this many items across all segments; NextCursor resumes every segment where it stopped"
+                        },
+                        "cursor": {
+                            "type": "string",
+                            "description": "NextCursor returned by a previous scan, to resume it"
+                        },
+                        "max_capacity_per_second": {
+                            "type": "number",
+                            "description": "Throttle the scan to this many consumed read capacity units per second"
+                        },
+                        "max_concurrency": {
+                            "type": "integer",
+                            "description": "Maximum number of segments scanned at once (default 4)"
                         }
-                    }
-                },
-                "required": ["request_items"]
-            }
-        ),
-        Tool(
-            name="dynamodb_item_batch_write",
-            description="Batch write operations (put/delete) for DynamoDB items",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "Name of the DynamoDB table"
-                    },
-                    "operation": {
-                        "type": "string",
-                        "enum": ["put", "delete"],
-                        "description": "Type of batch operation (put or delete)"
                     },
-                    "items": {
-                        "type": "array",
-                        "description": "Array of items to process"
+                    "required": ["table_name"]
+                }
+            ),
+            handler=handlers.dynamodb_item_scan,
+            read_only=True,
+            cost="high"
+        ),
+        ToolSpec(
+            Tool(
+                name="dynamodb_batch_get",
+                description="Batch get any number of items from DynamoDB tables, chunked into concurrent requests with unprocessed keys retried",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "request_items": {
+                            "type": "object",
+                            "description": "Map of table names to keys to retrieve",
+                            "additionalProperties": {
+                                "type": "object",
+                                "properties": {
+                                    "Keys": {
+                                        "type": "array",
+                                        "items": {
+                                            "type": "object"
+                                        }
+                                    },
+                                    "ConsistentRead": {
+                                        "type": "boolean"
+                                    },
+                                    "ProjectionExpression": {
+                                        "type": "string"
+                                    }
+                                },
+                                "required": ["Keys"]
+                            }
+                        },
+                        "projection": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Attribute paths to return, sent to DynamoDB as a ProjectionExpression for tables without one; key attributes are always included"
+                        },
+                        "max_concurrency": {
+                            "type": "integer",
+                            "description": "Number of 100-key batch_get_item requests in flight at once (default 4)"
+                        },
+                        "max_attempts": {
+                            "type": "integer",
+                            "description": "Attempts per request before unprocessed keys are given up on (default 8)"
+                        }
                     },
-                    "key_attributes": {
-                        "type": "array",
-                        "description": "For delete operations, specify which attributes form the key",
+                    "required": ["request_items"]
+                }
+            ),
+            handler=handlers.dynamodb_batch_get,
+            read_only=True,
+            cost="medium"
+        ),
+        ToolSpec(
+            Tool(
+                name="dynamodb_item_batch_write",
+                description="Batch write operations (put/delete) for DynamoDB items",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "table_name": {
+                            "type": "string",
+                            "description": "Name of the DynamoDB table"
+                        },
+                        "operation": {
+                            "type": "string",
+                            "enum": ["put", "delete"],
+                            "description": "Type of batch operation (put or delete), required unless spill_id is given"
+                        },
                         "items": {
-                            "type": "string"
+                            "type": "array",
+                            "description": "Array of items to process, required unless spill_id is given"
+                        },
+                        "key_attributes": {
+                            "type": "array",
+                            "description": "Attributes that form the key, used for deletes and to drop duplicate keys (looked up from the table for puts if omitted)",
+                            "items": {
+                                "type": "string"
+                            }
+                        },
+                        "max_concurrency": {
+                            "type": "integer",
+                            "description": "Maximum number of batch_write_item calls in flight (default 4)"
+                        },
+                        "max_attempts": {
+                            "type": "integer",
+                            "description": "Attempts per 25-item batch before its remaining items are spilled (default 8)"
+                        },
+                        "spill_id": {
+                            "type": "string",
+                            "description": "Replay the write requests saved under this spill_id (as returned by an earlier batch write) instead of items"
                         }
-                    }
-                },
-                "required": ["table_name", "operation", "items"]
-            }
-        ),
-        Tool(
-            name="dynamodb_describe_ttl",
-            description="Get the TTL settings for a table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "Name of the DynamoDB table"
-                    }
-                },
-                "required": ["table_name"]
-            }
-        ),
-
-        Tool(
-            name="dynamodb_update_ttl",
-            description="Update the TTL settings for a table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "Name of the DynamoDB table"
                     },
-                    "ttl_enabled": {
-                        "type": "boolean",
-                        "description": "Whether TTL should be enabled"
+                    "required": ["table_name"]
+                }
+            ),
+            handler=handlers.dynamodb_item_batch_write,
+            read_only=False,
+            cost="high"
+        ),
+        ToolSpec(
+            Tool(
+                name="dynamodb_describe_ttl",
+                description="Get the TTL settings for a table",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "table_name": {
+                            "type": "string",
+                            "description": "Name of the DynamoDB table"
+                        }
                     },
-                    "ttl_attribute": {
-                        "type": "string",
-                        "description": "The attribute name to use for TTL"
-                    }
-                },
-                "required": ["table_name", "ttl_enabled", "ttl_attribute"]
-            }
-        ),
-        Tool(
-            name="dynamodb_batch_execute",
-            description="Execute multiple PartiQL statements in a batch",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "statements": {
-                        "type": "array",
-                        "description": "List of PartiQL statements to execute",
-                        "items": {
-                            "type": "string"
+                    "required": ["table_name"]
+                }
+            ),
+            handler=handlers.dynamodb_describe_ttl,
+            read_only=True,
+            cost="low",
+            cache_ttl=60
+        ),
+
+        ToolSpec(
+            Tool(
+                name="dynamodb_update_ttl",
+                description="Update the TTL settings for a table",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "table_name": {
+                            "type": "string",
+                            "description": "Name of the DynamoDB table"
+                        },
+                        "ttl_enabled": {
+                            "type": "boolean",
+                            "description": "Whether TTL should be enabled"
+                        },
+                        "ttl_attribute": {
+                            "type": "string",
+                            "description": "The attribute name to use for TTL"
                         }
                     },
-                    "parameters": {
-                        "type": "array",
-                        "description": "List of parameter lists for each statement",
-                        "items": {
-                            "type": "array"
+                    "required": ["table_name", "ttl_enabled", "ttl_attribute"]
+                }
+            ),
+            handler=handlers.dynamodb_update_ttl,
+            read_only=False,
+            cost="low"
+        ),
+        ToolSpec(
+            Tool(
+                name="dynamodb_batch_execute",
+                description="Execute any number of PartiQL statements in concurrent batches, optionally paginating SELECTs",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "statements": {
+                            "type": "array",
+                            "description": "List of PartiQL statements to execute",
+                            "items": {
+                                "type": "string"
+                            }
+                        },
+                        "parameters": {
+                            "type": "array",
+                            "description": "List of parameter lists for each statement",
+                            "items": {
+                                "type": "array"
+                            }
+                        },
+                        "max_concurrency": {
+                            "type": "integer",
+                            "description": "Number of 25-statement batches and paginated SELECTs in flight at once (default 4)"
+                        },
+                        "max_attempts": {
+                            "type": "integer",
+                            "description": "Attempts per statement before a throttling error is returned (default 8)"
+                        },
+                        "paginate_selects": {
+                            "type": "boolean",
+                            "description": "Run SELECT statements through execute_statement, following NextToken, instead of as single-item batch reads"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Maximum items returned per paginated SELECT"
+                        },
+                        "next_token": {
+                            "type": "string",
+                            "description": "NextToken from a previous paginated SELECT; resumes it when a single statement is given"
+                        },
+                        "consistent_read": {
+                            "type": "boolean",
+                            "description": "Use strongly consistent reads"
                         }
-                    }
-                },
-                "required": ["statements", "parameters"]
-            }
+                    },
+                    "required": ["statements"]
+                }
+            ),
+            handler=handlers.dynamodb_batch_execute,
+            read_only=False,
+            cost="high"
         ),
     ]
 
 
-def get_ec2_tools() -> list[Tool]:
+def get_ec2_tools() -> list[ToolSpec]:
+    from .services import ec2 as handlers
+
     return [
-        Tool(
-            name="ec2_list_instances",
-            description="List EC2 instances and their details",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filters": {
-                        "type": "array",
-                        "description": "Optional filters to apply",
-                        "items": {
+        ToolSpec(
+            Tool(
+                name="ec2_list_instances",
+                description="List EC2 instances and their details, following every page of results",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "states": {
+                            "type": "array",
+                            "items": {"type": "string", "enum": list(INSTANCE_STATES)},
+                            "description": "Only instances in one of these states (e.g. running)"
+                        },
+                        "tags": {
                             "type": "object",
-                            "properties": {
-                                "Name": {"type": "string"},
-                                "Values": {
-                                    "type": "array",
-                                    "items": {"type": "string"}
+                            "description": "Tag key to required value, list of accepted values, or null to only require the key"
+                        },
+                        "view": {
+                            "type": "string",
+                            "enum": ["full", "summary"],
+                            "description": "full returns the Reservations tree; summary a flat Instances list with id, name, state, type, IPs, placement and tags",
+                            "default": "full"
+                        },
+                        "max_results": {
+                            "type": "integer",
+                            "description": "Instances requested per page (5-1000, default 1000)"
+                        },
+                        "max_instances": {
+                            "type": "integer",
+                            "minimum": 1,
+                            "description": "Return at most this many instances and a NextToken to continue"
+                        },
+                        "next_token": {
+                            "type": "string",
+                            "description": "NextToken from a previous call to resume listing; with regions, one region and its entry from NextTokens"
+                        },
+                        "filters": {
+                            "type": "array",
+                            "description": "Optional filters to apply",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "Name": {"type": "string"},
+                                    "Values": {
+                                        "type": "array",
+                                        "items": {"type": "string"}
+                                    }
                                 }
                             }
-                        }
+                        },
+                        **REGION_PROPERTIES
                     }
                 }
-            }
-        ),
-        Tool(
-            name="ec2_start_instances",
-            description="Start one or more EC2 instances",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "instance_ids": {
-                        "type": "array",
-                        "description": "List of instance IDs to start",
-                        "items": {"type": "string"}
-                    }
-                },
-                "required": ["instance_ids"]
-            }
-        ),
-        Tool(
-            name="ec2_stop_instances",
-            description="Stop one or more EC2 instances",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "instance_ids": {
-                        "type": "array",
-                        "description": "List of instance IDs to stop",
-                        "items": {"type": "string"}
-                    }
-                },
-                "required": ["instance_ids"]
-            }
-        ),
-        Tool(
-            name="ec2_describe_instance",
-            description="Get detailed information about an EC2 instance",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "instance_id": {
-                        "type": "string",
-                        "description": "ID of the instance to describe"
+            ),
+            handler=handlers.ec2_list_instances,
+            read_only=True,
+            cost="medium",
+            cache_ttl=10
+        ),
+        ToolSpec(
+            Tool(
+                name="ec2_start_instances",
+                description="Start one or more EC2 instances",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "instance_ids": {
+                            "type": "array",
+                            "description": "List of instance IDs to start",
+                            "items": {"type": "string"}
+                        },
+                        "wait": {
+                            "type": "boolean",
+                            "description": "Wait until every instance is running and report each one's outcome and timing",
+                            "default": False
+                        },
+                        **STATE_CHANGE_PROPERTIES
+                    },
+                    "required": ["instance_ids"]
+                }
+            ),
+            handler=handlers.ec2_start_instances,
+            read_only=False,
+            cost="high"
+        ),
+        ToolSpec(
+            Tool(
+                name="ec2_stop_instances",
+                description="Stop one or more EC2 instances",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "instance_ids": {
+                            "type": "array",
+                            "description": "List of instance IDs to stop",
+                            "items": {"type": "string"}
+                        },
+                        "wait": {
+                            "type": "boolean",
+                            "description": "Wait until every instance is stopped and report each one's outcome and timing",
+                            "default": False
+                        },
+                        **STATE_CHANGE_PROPERTIES
+                    },
+                    "required": ["instance_ids"]
+                }
+            ),
+            handler=handlers.ec2_stop_instances,
+            read_only=False,
+            cost="high"
+        ),
+        ToolSpec(
+            Tool(
+                name="ec2_describe_instance",
+                description="Get detailed information about an EC2 instance",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "instance_id": {
+                            "type": "string",
+                            "description": "ID of the instance to describe"
+                        }
+                    },
+                    "required": ["instance_id"]
+                }
+            ),
+            handler=handlers.ec2_describe_instance,
+            read_only=True,
+            cost="low",
+            cache_ttl=10
+        ),
+        ToolSpec(
+            Tool(
+                name="ec2_inventory_query",
+                description="Find instances by state, type, VPC, subnet, availability zone or tags from a locally indexed, background-refreshed inventory instead of calling EC2",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "region": {
+                            "type": "string",
+                            "description": "Region of the inventory (defaults to AWS_REGION)"
+                        },
+                        "states": {
+                            "type": "array",
+                            "items": {"type": "string", "enum": list(INSTANCE_STATES)},
+                            "description": "Only instances in one of these states"
+                        },
+                        "instance_types": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Only instances of one of these types"
+                        },
+                        "vpc_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Only instances in one of these VPCs"
+                        },
+                        "subnet_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Only instances in one of these subnets"
+                        },
+                        "availability_zones": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Only instances in one of these availability zones"
+                        },
+                        "tags": {
+                            "type": "object",
+                            "description": "Tag key to required value, list of accepted values, or null to only require the key"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Maximum number of instances to return"
+                        },
+                        "max_staleness": {
+                            "type": "number",
+                            "description": "Re-sweep the region first if the inventory is older than this many seconds"
+                        },
+                        "refresh": {
+                            "type": "boolean",
+                            "description": "Re-sweep the region before answering",
+                            "default": False
+                        }
                     }
-                },
-                "required": ["instance_id"]
-            }
+                }
+            ),
+            handler=handlers.ec2_inventory_query,
+            read_only=True,
+            cost="low"
         )
     ]
 
-def get_lambda_tools() -> list[Tool]:
+def get_lambda_tools() -> list[ToolSpec]:
+    from .services import awslambda as handlers
+
     return [
-        Tool(
-            name="lambda_list_functions",
-            description="List all Lambda functions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "max_items": {
-                        "type": "integer",
-                        "description": "Maximum number of functions to return"
+        ToolSpec(
+            Tool(
+                name="lambda_list_functions",
+                description="List all Lambda functions, following every page of results",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "max_items": {
+                            "type": "integer",
+                            "description": "Maximum number of functions to return"
+                        },
+                        "marker": {
+                            "type": "string",
+                            "description": "NextMarker from a previous call to resume listing; with regions, one region and its entry from NextTokens"
+                        },
+                        "runtimes": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Only functions with one of these runtimes (e.g. python3.12)"
+                        },
+                        "name_prefix": {
+                            "type": "string",
+                            "description": "Only functions whose name starts with this prefix"
+                        },
+                        "tags": {
+                            "type": "object",
+                            "description": "Tag key to required value, list of accepted values, or null to only require the key"
+                        },
+                        "refresh": {
+                            "type": "boolean",
+                            "description": "List from AWS even if the function metadata index or the response cache is fresh (same as bypass_cache)",
+                            "default": False
+                        },
+                        **REGION_PROPERTIES
                     }
                 }
-            }
-        ),
-        Tool(
-            name="lambda_invoke",
-            description="Invoke a Lambda function",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "function_name": {
-                        "type": "string",
-                        "description": "Name or ARN of the Lambda function"
-                    },
-                    "payload": {
-                        "type": "object",
-                        "description": "JSON payload to send to the function"
-                    },
-                    "invocation_type": {
-                        "type": "string",
-                        "enum": ["RequestResponse", "Event", "DryRun"],
-                        "description": "Invocation type for the Lambda function"
-                    }
-                },
-                "required": ["function_name"]
-            }
-        ),
-        Tool(
-            name="lambda_get_function",
-            description="Get information about a Lambda function",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "function_name": {
-                        "type": "string",
-                        "description": "Name or ARN of the Lambda function"
+            ),
+            handler=handlers.lambda_list_functions,
+            read_only=True,
+            cost="medium",
+            cache_ttl=60
+        ),
+        ToolSpec(
+            Tool(
+                name="lambda_invoke",
+                description="Invoke a Lambda function, stream its response, or fan out a batch of invocations concurrently",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "function_name": {
+                            "type": "string",
+                            "description": "Name or ARN of the Lambda function (the default for batch invocations)"
+                        },
+                        "payload": {
+                            "type": "object",
+                            "description": "JSON payload to send to the function"
+                        },
+                        "invocation_type": {
+                            "type": "string",
+                            "enum": ["RequestResponse", "Event", "DryRun"],
+                            "description": "Invocation type for the Lambda function"
+                        },
+                        "qualifier": {
+                            "type": "string",
+                            "description": "Version or alias to invoke"
+                        },
+                        "log_tail": {
+                            "type": "boolean",
+                            "description": "Return the last 4 KB of the execution log as LogResult",
+                            "default": False
+                        },
+                        "stream": {
+                            "type": "boolean",
+                            "description": "Invoke with response streaming and forward each chunk as a progress notification (chunk, encoding and sequence fields) as it arrives",
+                            "default": False
+                        },
+                        "max_buffer_bytes": {
+                            "type": "integer",
+                            "description": "Streaming mode: bytes of the response kept for the final result (defaults to AWS_MCP_LAMBDA_STREAM_BUFFER_BYTES or 1 MiB)"
+                        },
+                        "payloads": {
+                            "type": "array",
+                            "items": {"type": "object"},
+                            "description": "Batch mode: invoke function_name once per payload"
+                        },
+                        "invocations": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "function_name": {"type": "string"},
+                                    "payload": {"type": "object"},
+                                    "qualifier": {"type": "string"}
+                                }
+                            },
+                            "description": "Batch mode: invocations of possibly different functions"
+                        },
+                        "max_concurrency": {
+                            "type": "integer",
+                            "description": "Batch invocations in flight at once (defaults to AWS_MCP_LAMBDA_INVOKE_CONCURRENCY or 16)"
+                        },
+                        "timeout": {
+                            "type": "number",
+                            "description": "Seconds before a batch invocation is reported as timed out (default 60)"
+                        }
                     }
-                },
-                "required": ["function_name"]
-            }
+                }
+            ),
+            handler=handlers.lambda_invoke,
+            read_only=False,
+            cost="high"
+        ),
+        ToolSpec(
+            Tool(
+                name="lambda_get_function",
+                description="Get information about a Lambda function",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "function_name": {
+                            "type": "string",
+                            "description": "Name or ARN of the Lambda function"
+                        },
+                        "include_code": {
+                            "type": "boolean",
+                            "description": "Call GetFunction for the code location and tags instead of answering from the function metadata index",
+                            "default": False
+                        }
+                    },
+                    "required": ["function_name"]
+                }
+            ),
+            handler=handlers.lambda_get_function,
+            read_only=True,
+            cost="low",
+            cache_ttl=60
         )
     ]
 
-def get_cloudwatch_tools() -> list[Tool]:
+def get_cloudwatch_tools() -> list[ToolSpec]:
+    from .services import cloudwatch as handlers
+
     return [
-        Tool(
-            name="cloudwatch_get_metrics",
-            description="Get CloudWatch metrics for a resource",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "namespace": {
-                        "type": "string",
-                        "description": "Namespace of the metric (e.g., AWS/EC2)"
-                    },
-                    "metric_name": {
-                        "type": "string",
-                        "description": "Name of the metric"
-                    },
-                    "dimensions": {
-                        "type": "array",
-                        "description": "Dimensions to filter the metric",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "Name": {"type": "string"},
-                                "Value": {"type": "string"}
+        ToolSpec(
+            Tool(
+                name="cloudwatch_get_metrics",
+                description="Get CloudWatch metrics for a resource",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "namespace": {
+                            "type": "string",
+                            "description": "Namespace of the metric (e.g., AWS/EC2)"
+                        },
+                        "metric_name": {
+                            "type": "string",
+                            "description": "Name of the metric"
+                        },
+                        "dimensions": {
+                            "type": "array",
+                            "description": "Dimensions to filter the metric",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "Name": {"type": "string"},
+                                    "Value": {"type": "string"}
+                                }
                             }
+                        },
+                        "start_time": {
+                            "type": "string",
+                            "description": "Start time in ISO format"
+                        },
+                        "end_time": {
+                            "type": "string",
+                            "description": "End time in ISO format"
+                        },
+                        "period": {
+                            "type": "integer",
+                            "description": "Period in seconds"
                         }
                     },
-                    "start_time": {
-                        "type": "string",
-                        "description": "Start time in ISO format"
-                    },
-                    "end_time": {
-                        "type": "string",
-                        "description": "End time in ISO format"
-                    },
-                    "period": {
-                        "type": "integer",
-                        "description": "Period in seconds"
-                    }
-                },
-                "required": ["namespace", "metric_name"]
-            }
-        ),
-        Tool(
-            name="cloudwatch_list_metrics",
-            description="List available CloudWatch metrics",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "namespace": {
-                        "type": "string",
-                        "description": "Optional namespace to filter metrics"
-                    },
-                    "metric_name": {
-                        "type": "string",
-                        "description": "Optional metric name to filter"
+                    "required": ["namespace", "metric_name"]
+                }
+            ),
+            handler=handlers.cloudwatch_get_metrics,
+            read_only=True,
+            cost="low"
+        ),
+        ToolSpec(
+            Tool(
+                name="cloudwatch_list_metrics",
+                description="List available CloudWatch metrics",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "namespace": {
+                            "type": "string",
+                            "description": "Optional namespace to filter metrics"
+                        },
+                        "metric_name": {
+                            "type": "string",
+                            "description": "Optional metric name to filter"
+                        },
+                        **REGION_PROPERTIES
                     }
                 }
-            }
-        ),
-        Tool(
-            name="cloudwatch_get_logs",
-            description="Get CloudWatch logs from a log group",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "log_group_name": {
-                        "type": "string",
-                        "description": "Name of the log group"
-                    },
-                    "start_time": {
-                        "type": "string",
-                        "description": "Start time in ISO format"
-                    },
-                    "end_time": {
-                        "type": "string",
-                        "description": "End time in ISO format"
+            ),
+            handler=handlers.cloudwatch_list_metrics,
+            read_only=True,
+            cost="medium",
+            cache_ttl=300
+        ),
+        ToolSpec(
+            Tool(
+                name="cloudwatch_get_logs",
+                description="Get CloudWatch logs from a log group",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "log_group_name": {
+                            "type": "string",
+                            "description": "Name of the log group"
+                        },
+                        "start_time": {
+                            "type": "string",
+                            "description": "Start time in ISO format"
+                        },
+                        "end_time": {
+                            "type": "string",
+                            "description": "End time in ISO format"
+                        },
+                        "filter_pattern": {
+                            "type": "string",
+                            "description": "Optional filter pattern for the logs"
+                        }
                     },
-                    "filter_pattern": {
-                        "type": "string",
-                        "description": "Optional filter pattern for the logs"
-                    }
-                },
-                "required": ["log_group_name"]
-            }
+                    "required": ["log_group_name"]
+                }
+            ),
+            handler=handlers.cloudwatch_get_logs,
+            read_only=True,
+            cost="medium"
         )
     ]
 
-def get_bedrock_tools() -> list[Tool]:
+def get_bedrock_tools() -> list[ToolSpec]:
+    from .services import bedrock as handlers
+
     return [
-        Tool(
-            name="bedrock_get_model_stats",
-            description="Get detailed usage statistics for a Bedrock model",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "model_id": {
-                        "type": "string",
-                        "description": "Bedrock model ID (e.g., anthropic.claude-3-sonnet-20240229-v1:0)"
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "AWS region (e.g., us-west-2)"
-                    },
-                    "start_time": {
-                        "type": "string",
-                        "description": "Start time in ISO format"
-                    },
-                    "end_time": {
-                        "type": "string",
-                        "description": "End time in ISO format"
-                    }
-                },
-                "required": ["model_id", "region"]
-            }
-        ),
-        Tool(
-            name="bedrock_analyze_requests",
-            description="Analyze Bedrock API requests to get token statistics",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "model_id": {
-                        "type": "string",
-                        "description": "Bedrock model ID"
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "AWS region"
+        ToolSpec(
+            Tool(
+                name="bedrock_get_model_stats",
+                description="Get detailed usage statistics for a Bedrock model",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "model_id": {
+                            "type": "string",
+                            "description": "Bedrock model ID (e.g., anthropic.claude-3-sonnet-20240229-v1:0)"
+                        },
+                        "region": {
+                            "type": "string",
+                            "description": "AWS region (e.g., us-west-2)"
+                        },
+                        "start_time": {
+                            "type": "string",
+                            "description": "Start time in ISO format"
+                        },
+                        "end_time": {
+                            "type": "string",
+                            "description": "End time in ISO format"
+                        }
                     },
-                    "time_period_hours": {
-                        "type": "integer",
-                        "description": "Number of hours to analyze",
-                        "default": 24
-                    }
-                },
-                "required": ["model_id", "region"]
-            }
-        ),
-        Tool(
-            name="bedrock_get_token_metrics",
-            description="Get token usage metrics for a Bedrock model",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "model_id": {
-                        "type": "string",
-                        "description": "Bedrock model ID"
+                    "required": ["model_id", "region"]
+                }
+            ),
+            handler=handlers.bedrock_get_model_stats,
+            read_only=True,
+            cost="medium"
+        ),
+        ToolSpec(
+            Tool(
+                name="bedrock_analyze_requests",
+                description="Analyze Bedrock API requests to get token statistics",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "model_id": {
+                            "type": "string",
+                            "description": "Bedrock model ID"
+                        },
+                        "region": {
+                            "type": "string",
+                            "description": "AWS region"
+                        },
+                        "time_period_hours": {
+                            "type": "integer",
+                            "description": "Number of hours to analyze",
+                            "default": 24
+                        }
                     },
-                    "region": {
-                        "type": "string",
-                        "description": "AWS region"
+                    "required": ["model_id", "region"]
+                }
+            ),
+            handler=handlers.bedrock_analyze_requests,
+            read_only=True,
+            cost="medium"
+        ),
+        ToolSpec(
+            Tool(
+                name="bedrock_get_token_metrics",
+                description="Get token usage metrics for a Bedrock model",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "model_id": {
+                            "type": "string",
+                            "description": "Bedrock model ID"
+                        },
+                        "region": {
+                            "type": "string",
+                            "description": "AWS region"
+                        },
+                        "period": {
+                            "type": "integer",
+                            "description": "Period in minutes to analyze",
+                            "default": 60
+                        }
                     },
-                    "period": {
-                        "type": "integer",
-                        "description": "Period in minutes to analyze",
-                        "default": 60
-                    }
-                },
-                "required": ["model_id", "region"]
-            }
+                    "required": ["model_id", "region"]
+                }
+            ),
+            handler=handlers.bedrock_get_token_metrics,
+            read_only=True,
+            cost="medium"
         )
     ]
 
-def get_aws_tools() -> list[Tool]:
-    return [
-        *get_s3_tools(),
-        *get_dynamodb_tools(),
-        *get_ec2_tools(),
-        *get_lambda_tools(),
-        *get_cloudwatch_tools(),
-        *get_bedrock_tools()
-    ]
+
+# Services shipped with the server; plugins can add more, see registry.py
+BUILTIN_SERVICES = {
+    "s3": get_s3_tools,
+    "dynamodb": get_dynamodb_tools,
+    "ec2": get_ec2_tools,
+    "lambda": get_lambda_tools,
+    "cloudwatch": get_cloudwatch_tools,
+    "bedrock": get_bedrock_tools,
+}
@@ -1,16 +1,28 @@
-def get_dynamodb_type(value):
-    if isinstance(value, str):
-        return {'S': value}
-    elif isinstance(value, (int, float)):
-        return {'N': str(value)}
-    elif isinstance(value, bool):
-        return {'BOOL': value}
-    elif value is None:
-        return {'NULL': True}
-    elif isinstance(value, list):
-        return {'L': [get_dynamodb_type(v) for v in value]}
-    elif isinstance(value, dict):
-        return {'M': {k: get_dynamodb_type(v) for k, v in value.items()}}
-    else:
-        raise ValueError(
-            f"Unsupported type for DynamoDB: {type(value)}")
+import json
+import base64
+
+
+def _encode_cursor_value(obj):
+    if isinstance(obj, (bytes, bytearray)):
+        return {"__bytes__": base64.b64encode(obj).decode()}
+    raise TypeError(f"Object of type {type(obj)} cannot be stored in a cursor")
+
+
+def _decode_cursor_value(obj: dict):
+    if obj.keys() == {"__bytes__"}:
+        return base64.b64decode(obj["__bytes__"])
+    return obj
+
+
+def encode_cursor(state: dict) -> str:
+    """Pack pagination state into an opaque cursor string"""
+    data = json.dumps(state, separators=(",", ":"), default=_encode_cursor_value)
+    return base64.urlsafe_b64encode(data.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Unpack a cursor produced by encode_cursor"""
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode()), object_hook=_decode_cursor_value)
+    except ValueError as e:
+        raise ValueError(f"Invalid cursor: {e}")
@@ -0,0 +1,104 @@
+import json
+import asyncio
+
+import pytest
+from moto import mock_aws
+from mcp import types
+
+REGION = "us-east-1"
+
+
+@pytest.fixture(autouse=True)
+def aws_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.delenv("AWS_SESSION_TOKEN", raising=False)
+    monkeypatch.delenv("AWS_PROFILE", raising=False)
+    monkeypatch.setenv("AWS_REGION", REGION)
+    monkeypatch.setenv("AWS_DEFAULT_REGION", REGION)
+    monkeypatch.setenv("AWS_MCP_AUDIT_DB", ":memory:")
+    monkeypatch.setenv("AWS_MCP_DYNAMODB_SPILL_DIR", str(tmp_path / "spill"))
+    monkeypatch.setenv("AWS_MCP_S3_DOWNLOAD_DIR", str(tmp_path / "downloads"))
+
+
+@pytest.fixture
+def mocked_aws():
+    with mock_aws():
+        yield
+
+
+@pytest.fixture
+def dynamodb(mocked_aws):
+    import boto3
+    return boto3.client("dynamodb", region_name=REGION)
+
+
+@pytest.fixture
+def s3(mocked_aws):
+    import boto3
+    return boto3.client("s3", region_name=REGION)
+
+
+def create_table(client, name: str, range_key: bool = False) -> None:
+    key_schema = [{"AttributeName": "pk", "KeyType": "HASH"}]
+    definitions = [{"AttributeName": "pk", "AttributeType": "S"}]
+    if range_key:
+        key_schema.append({"AttributeName": "sk", "KeyType": "RANGE"})
+        definitions.append({"AttributeName": "sk", "AttributeType": "N"})
+    client.create_table(
+        TableName=name,
+        KeySchema=key_schema,
+        AttributeDefinitions=definitions,
+        BillingMode="PAY_PER_REQUEST"
+    )
+
+
+class ServerHarness:
+    """Drives the MCP request handlers of a fresh server on one event loop"""
+
+    def __init__(self):
+        from mcp_server_aws.server import _get_server
+        self.server, self.aws = _get_server()
+        self.loop = asyncio.new_event_loop()
+
+    def run(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def call_text(self, name: str, arguments: dict) -> str:
+        handler = self.server.request_handlers[types.CallToolRequest]
+        request = types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(name=name, arguments=arguments)
+        )
+        result = self.run(handler(request)).root
+        text = result.content[0].text
+        if result.isError:
+            raise RuntimeError(text)
+        return text
+
+    def call(self, name: str, arguments: dict):
+        """Call a tool and parse its JSON result"""
+        text = self.call_text(name, arguments)
+        return json.loads(text.removeprefix("Operation Result:\n"))
+
+    def read_resource(self, uri: str):
+        handler = self.server.request_handlers[types.ReadResourceRequest]
+        request = types.ReadResourceRequest(
+            method="resources/read",
+            params=types.ReadResourceRequestParams(uri=uri)
+        )
+        return self.run(handler(request)).root.contents[0]
+
+    def close(self):
+        self.aws.chunked_uploads.close()
+        self.aws.executor.shutdown()
+        self.aws.inventory.close()
+        self.aws.audit_log.close()
+        self.loop.close()
+
+
+@pytest.fixture
+def server(mocked_aws):
+    harness = ServerHarness()
+    yield harness
+    harness.close()
@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from mcp_server_aws import audit
+from mcp_server_aws.audit import AuditLog, compact_parameters
+
+
+def test_payload_bodies_and_large_values_are_summarised():
+    compacted = compact_parameters({
+        "bucket_name": "b",
+        "file_content": "x" * 1000,
+        "items": [{"pk": 1}] * 3,
+        "instance_ids": [f"i-{n}" for n in range(25)],
+        "description": "y" * 300,
+    })
+    assert compacted["bucket_name"] == "b"
+    assert compacted["file_content"] == "<1000 chars omitted>"
+    assert compacted["items"] == "<list of 3 entries omitted>"
+    assert compacted["instance_ids"][-1] == "<5 more entries omitted>"
+    assert len(compacted["instance_ids"]) == 21
+    assert compacted["description"].endswith("...<44 chars omitted>")
+
+
+def test_queries_filter_newest_first_and_page_by_id():
+    log = AuditLog(":memory:")
+    for n in range(5):
+        log.append("s3", "bucket_list", {"n": n})
+        log.append("ec2", "start_instances", {"n": n})
+
+    entries = log.query(service="s3", limit=2)
+    assert [entry["parameters"]["n"] for entry in entries] == [4, 3]
+    older = log.query(service="s3", limit=10, before_id=entries[-1]["id"])
+    assert [entry["parameters"]["n"] for entry in older] == [2, 1, 0]
+    assert len(log.query(operation="start_instances")) == 5
+
+    # Offset timestamps are compared in UTC
+    future = (datetime.now(timezone(timedelta(hours=-5))) + timedelta(minutes=5)).isoformat()
+    assert log.query(since=future) == []
+    assert len(log.query(until=future)) == 10
+    log.close()
+
+
+def test_entries_beyond_the_limits_are_pruned(monkeypatch):
+    monkeypatch.setattr(audit, "PRUNE_INTERVAL", 4)
+    log = AuditLog(":memory:", max_entries=3)
+    for n in range(8):
+        log.append("s3", "bucket_list", {"n": n})
+    assert log.count() == 3
+    assert [entry["parameters"]["n"] for entry in log.query()] == [7, 6, 5]
+
+    log.max_entries = 100
+    log.max_age_days = -1
+    log.prune()
+    assert log.count() == 0
+    log.close()
+
+
+def test_entries_survive_a_restart(tmp_path):
+    path = str(tmp_path / "audit" / "audit.db")
+    log = AuditLog(path)
+    log.append("lambda", "invoke", {"function_name": "orders", "payload": {"a": 1}})
+    log.close()
+
+    reopened = AuditLog(path)
+    (entry,) = reopened.query()
+    assert entry["parameters"] == {"function_name": "orders", "payload": "<dict of 1 entries omitted>"}
+    reopened.close()
+
+
+def test_audit_resource_pages_with_a_cursor(server, s3):
+    for _ in range(3):
+        server.call("s3_bucket_list", {"bypass_cache": True})
+
+    first = server.read_resource("audit://aws-operations?service=s3&limit=2").text
+    assert first.count("Operation: bucket_list") == 2
+    cursor = first.rsplit("More entries: ", 1)[1].strip()
+    rest = server.read_resource(cursor).text
+    assert rest.count("Operation: bucket_list") == 1
+    assert "More entries" not in rest
+
+    assert "No AWS operations match" in server.read_resource("audit://aws-operations?service=ec2").text
+    with pytest.raises(ValueError, match="Unknown audit log filters: region"):
+        server.read_resource("audit://aws-operations?region=us-east-1")
@@ -0,0 +1,59 @@
+from conftest import create_table
+
+
+def bucket_names(response):
+    return sorted(bucket["Name"] for bucket in response["Buckets"])
+
+
+def test_every_mutating_tool_has_an_invalidation_entry():
+    from mcp_server_aws.cache import INVALIDATIONS
+    from mcp_server_aws.registry import ToolRegistry
+    from mcp_server_aws.tools import BUILTIN_SERVICES
+
+    registry = ToolRegistry(BUILTIN_SERVICES, enabled=None, read_only=False)
+    mutators = {spec.name for spec in registry.specs() if not spec.read_only}
+    assert mutators - set(INVALIDATIONS) == set()
+    assert set(INVALIDATIONS) - mutators == set()
+
+
+def test_bucket_create_and_delete_invalidate_the_bucket_list(server, s3):
+    s3.create_bucket(Bucket="first-bucket")
+    assert bucket_names(server.call("s3_bucket_list", {})) == ["first-bucket"]
+
+    server.call("s3_bucket_create", {"bucket_name": "second-bucket"})
+    assert bucket_names(server.call("s3_bucket_list", {})) == ["first-bucket", "second-bucket"]
+
+    server.call("s3_bucket_delete", {"bucket_name": "first-bucket"})
+    assert bucket_names(server.call("s3_bucket_list", {})) == ["second-bucket"]
+    assert server.aws.cache.stats()["invalidations"] == 2
+
+
+def test_unrelated_mutations_keep_cached_reads(server, s3):
+    s3.create_bucket(Bucket="kept-bucket")
+    server.call("s3_bucket_list", {})
+    server.call("s3_object_upload", {
+        "bucket_name": "kept-bucket", "object_key": "a.txt", "file_content": "aGk="})
+    server.call("s3_bucket_list", {})
+
+    stats = server.aws.cache.stats()
+    assert stats["hits"] == 1
+    assert stats["invalidations"] == 0
+
+
+def test_table_delete_invalidates_list_and_describe(server, dynamodb):
+    create_table(dynamodb, "orders")
+    assert server.call("dynamodb_table_list", {})["TableNames"] == ["orders"]
+    server.call("dynamodb_table_describe", {"table_name": "orders"})
+
+    server.call("dynamodb_table_delete", {"table_name": "orders"})
+    assert server.call("dynamodb_table_list", {})["TableNames"] == []
+    assert server.aws.cache.stats()["invalidations"] == 2
+
+
+def test_unmapped_mutator_drops_every_entry():
+    from mcp_server_aws.cache import ResponseCache
+
+    cache = ResponseCache({"s3_bucket_list": 30}, max_entries=8, ttls={})
+    cache.put("s3_bucket_list", {}, "buckets")
+    assert cache.invalidate("plugin_resource_delete", {}) == 1
+    assert cache.get("s3_bucket_list", {}) is None
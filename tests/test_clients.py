@@ -0,0 +1,79 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from botocore.exceptions import ClientError
+
+from mcp_server_aws.clients import ClientPool
+
+from conftest import REGION, ServerHarness
+
+
+def test_clients_are_built_off_the_event_loop(mocked_aws, monkeypatch):
+    harness = ServerHarness()
+    built_on = []
+    get = harness.aws.clients.get
+
+    def recording_get(service_name, region_name=None):
+        built_on.append(threading.current_thread())
+        return get(service_name, region_name)
+
+    monkeypatch.setattr(harness.aws.clients, "get", recording_get)
+    try:
+        harness.call("dynamodb_table_list", {})
+        harness.call("s3_bucket_list", {})
+        assert built_on and threading.main_thread() not in built_on
+
+        # Pooled clients come straight from the pool without a worker hop
+        built_on.clear()
+        harness.call("dynamodb_table_list", {"bypass_cache": True})
+        assert built_on == []
+    finally:
+        harness.close()
+
+
+def test_clients_are_pooled_per_service_and_region(mocked_aws):
+    pool = ClientPool()
+    with ThreadPoolExecutor(max_workers=8) as workers:
+        clients = list(workers.map(lambda _: pool.get("s3"), range(16)))
+    assert all(client is clients[0] for client in clients)
+    assert pool.get("s3", REGION) is clients[0]
+    assert pool.get("s3", "eu-west-1") is not clients[0]
+    assert pool.get("dynamodb") is not clients[0]
+    assert len(pool) == 3
+    assert clients[0].meta.config.max_pool_connections == pool.max_pool_connections
+
+
+def test_rotated_credentials_release_the_previous_clients(mocked_aws, monkeypatch):
+    pool = ClientPool()
+    first = pool.get("s3")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "rotated")
+    assert pool.cached("s3") is None
+    second = pool.get("s3")
+    assert second is not first
+    assert len(pool) == 1
+
+
+def test_stale_sessions_are_rebuilt_and_reset_drops_everything(mocked_aws):
+    pool = ClientPool(session_ttl=0)
+    first = pool.get("s3")
+    assert pool.cached("s3") is None
+    assert pool.get("s3") is not first
+
+    pool = ClientPool()
+    pool.get("s3")
+    pool.reset()
+    assert len(pool) == 0
+
+
+def test_expired_credentials_reset_the_pool(server, monkeypatch):
+    server.call("s3_bucket_list", {})
+    assert len(server.aws.clients) == 1
+
+    def expired(**kwargs):
+        raise ClientError({"Error": {"Code": "ExpiredToken", "Message": "expired"}}, "ListBuckets")
+
+    monkeypatch.setattr(server.aws.clients.get("s3"), "list_buckets", expired)
+    with pytest.raises(RuntimeError, match="ExpiredToken"):
+        server.call("s3_bucket_list", {"bypass_cache": True})
+    assert len(server.aws.clients) == 0
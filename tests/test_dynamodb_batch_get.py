@@ -0,0 +1,118 @@
+import pytest
+from botocore.exceptions import ClientError
+
+from mcp_server_aws.dynamodb import batch_get
+
+from conftest import create_table
+
+
+@pytest.fixture
+def table(dynamodb):
+    create_table(dynamodb, "read-table", range_key=True)
+    for i in range(0, 40, 2):
+        dynamodb.put_item(TableName="read-table", Item={
+            "pk": {"S": f"p{i % 3}"}, "sk": {"N": str(i)}, "v": {"N": str(i * 10)}, "extra": {"S": "x"}})
+    return "read-table"
+
+
+def key(i):
+    return {"pk": {"S": f"p{i % 3}"}, "sk": {"N": str(i)}}
+
+
+def test_projected_items_keep_their_keys_in_request_order(dynamodb, table):
+    keys = [key(i) for i in range(40)]
+    response = batch_get(dynamodb, {table: {"Keys": keys, "ProjectionExpression": "v"}})
+
+    items = response["Responses"][table]
+    assert [item["sk"]["N"] for item in items] == [str(i) for i in range(0, 40, 2)]
+    for item in items:
+        assert set(item) == {"pk", "sk", "v"}
+        assert item["pk"] == {"S": f"p{int(item['sk']['N']) % 3}"}
+        assert item["v"]["N"] == str(int(item["sk"]["N"]) * 10)
+    assert response["MissingKeys"][table] == [key(i) for i in range(1, 40, 2)]
+
+
+def test_nested_paths_do_not_count_as_projected_keys(dynamodb, table):
+    response = batch_get(dynamodb, {table: {
+        "Keys": [key(2)],
+        "ProjectionExpression": "#e.pk, v",
+        "ExpressionAttributeNames": {"#e": "extra"},
+    }})
+    assert response["Responses"][table] == [{"pk": {"S": "p2"}, "sk": {"N": "2"}, "v": {"N": "20"}}]
+
+
+class FlakyReads:
+    """Wraps a client so batch_get_item leaves keys unprocessed or throttles"""
+
+    def __init__(self, client, unprocessed_calls=1, throttled_calls=0, error_code=None):
+        self.client = client
+        self.exceptions = client.exceptions
+        self.unprocessed_calls = unprocessed_calls
+        self.throttled_calls = throttled_calls
+        self.error_code = error_code
+        self.calls = 0
+        self.sizes = []
+
+    def batch_get_item(self, RequestItems, **kwargs):
+        self.calls += 1
+        (table, request), = RequestItems.items()
+        self.sizes.append(len(request["Keys"]))
+        if self.error_code is not None or self.calls <= self.throttled_calls:
+            code = self.error_code or "ProvisionedThroughputExceededException"
+            raise ClientError({"Error": {"Code": code, "Message": "no"}}, "BatchGetItem")
+        if self.calls <= self.throttled_calls + self.unprocessed_calls:
+            half = len(request["Keys"]) // 2
+            response = self.client.batch_get_item(
+                RequestItems={table: {**request, "Keys": request["Keys"][:half]}}, **kwargs)
+            response["UnprocessedKeys"] = {table: {**request, "Keys": request["Keys"][half:]}}
+            return response
+        return self.client.batch_get_item(RequestItems=RequestItems, **kwargs)
+
+
+def test_partially_unprocessed_keys_are_retried(dynamodb, table):
+    client = FlakyReads(dynamodb)
+    keys = [key(i) for i in range(0, 40, 2)]
+    response = batch_get(client, {table: {"Keys": keys}})
+
+    assert client.sizes == [20, 10]
+    assert response["Retries"] == 1
+    assert response["UnprocessedKeys"] == {}
+    assert [item["sk"]["N"] for item in response["Responses"][table]] == [str(i) for i in range(0, 40, 2)]
+
+
+def test_throttled_reads_are_retried(dynamodb, table):
+    client = FlakyReads(dynamodb, unprocessed_calls=0, throttled_calls=2)
+    response = batch_get(client, {table: {"Keys": [key(0), key(2)]}})
+    assert response["ThrottledRequests"] == 2
+    assert response["Retries"] == 2
+    assert len(response["Responses"][table]) == 2
+    assert response["Errors"] is None
+
+
+def test_keys_still_unread_after_max_attempts_are_returned(dynamodb, table):
+    client = FlakyReads(dynamodb, unprocessed_calls=5)
+    response = batch_get(client, {table: {"Keys": [key(i) for i in range(0, 16, 2)]}}, max_attempts=2)
+
+    assert client.sizes == [8, 4]
+    assert len(response["Responses"][table]) == 6
+    assert response["UnprocessedKeys"] == {table: {"Keys": [key(12), key(14)]}}
+    assert response["MissingKeys"] == {}
+
+
+def test_other_errors_are_reported_without_retrying(dynamodb, table):
+    client = FlakyReads(dynamodb, error_code="ValidationException")
+    response = batch_get(client, {table: {"Keys": [key(0)]}})
+    assert client.calls == 1
+    assert "ValidationException" in response["Errors"][0]
+    assert response["Retries"] == 0
+
+
+def test_duplicate_keys_are_read_once_across_concurrent_chunks(dynamodb, table):
+    keys = [key(i) for i in range(250)] + [key(0), key(2)]
+    response = batch_get(dynamodb, {table: {"Keys": keys}}, max_concurrency=3)
+
+    assert response["RequestedKeys"] == 252
+    assert response["DuplicateKeysRemoved"] == 2
+    assert response["Requests"] == 3
+    assert [item["sk"]["N"] for item in response["Responses"][table]] == [str(i) for i in range(0, 40, 2)]
+    assert len(response["MissingKeys"][table]) == 230
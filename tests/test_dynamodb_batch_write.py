@@ -0,0 +1,98 @@
+import os
+
+import pytest
+
+from mcp_server_aws.dynamodb import batch_write, load_spilled_requests, spill_write_requests
+
+from conftest import create_table
+
+
+@pytest.fixture
+def table(dynamodb):
+    create_table(dynamodb, "write-table")
+    return "write-table"
+
+
+def put(pk, value="v"):
+    return {"PutRequest": {"Item": {"pk": {"S": pk}, "value": {"S": value}}}}
+
+
+def stored(dynamodb, table):
+    items = dynamodb.scan(TableName=table)["Items"]
+    return {item["pk"]["S"]: item["value"]["S"] for item in items}
+
+
+class UnprocessedOnce:
+    """Wraps a client so the first call leaves half of its batch unprocessed"""
+
+    def __init__(self, client):
+        self.client = client
+        self.exceptions = client.exceptions
+        self.calls = 0
+
+    def batch_write_item(self, RequestItems):
+        self.calls += 1
+        (table, requests), = RequestItems.items()
+        if self.calls == 1:
+            half = len(requests) // 2
+            self.client.batch_write_item(RequestItems={table: requests[:half]})
+            return {"UnprocessedItems": {table: requests[half:]}}
+        return self.client.batch_write_item(RequestItems=RequestItems)
+
+
+def test_batch_write_round_trip_with_duplicates(dynamodb, table):
+    requests = [put(f"k{i}") for i in range(60)] + [put("k0", "latest")]
+    response = batch_write(dynamodb, table, requests, max_concurrency=3)
+    assert response["duplicates_removed"] == 1
+    assert response["processed_items"] == 60
+    assert response["batches"] == 3
+    assert response["spill_id"] is None
+    assert stored(dynamodb, table) == {**{f"k{i}": "v" for i in range(60)}, "k0": "latest"}
+
+
+def test_batch_write_retries_unprocessed_items(dynamodb, table):
+    client = UnprocessedOnce(dynamodb)
+    response = batch_write(client, table, [put(f"k{i}") for i in range(10)], key_attributes=["pk"])
+    assert response["processed_items"] == 10
+    assert response["retries"] == 1
+    assert len(stored(dynamodb, table)) == 10
+
+
+def test_failed_writes_are_spilled_and_replayed_by_id(server, dynamodb, table):
+    invalid = [{"PutRequest": {"Item": {"other": {"S": "no key"}}}}]
+    response = batch_write(dynamodb, table, invalid, key_attributes=["pk"])
+    assert response["failed_items"] == 1
+    assert os.path.basename(response["spill_file"]) == response["spill_id"]
+    assert load_spilled_requests(response["spill_file"]) == invalid
+
+    spill_id = spill_write_requests(table, [put("a"), put("b")])
+    replayed = server.call("dynamodb_item_batch_write", {"table_name": table, "spill_id": spill_id})
+    assert replayed["processed_items"] == 2
+    assert stored(dynamodb, table) == {"a": "v", "b": "v"}
+    with pytest.raises(RuntimeError, match="Unknown spill id"):
+        server.call("dynamodb_item_batch_write", {"table_name": table, "spill_id": spill_id})
+
+
+@pytest.mark.parametrize("spill_id", [
+    "/etc/passwd",
+    "../write-table-20240101T000000-0123abcd.jsonl",
+    "write-table.jsonl",
+    "write-table-20240101T000000-0123abcd.jsonl/../../x",
+])
+def test_spill_ids_outside_the_spill_directory_are_rejected(server, table, spill_id):
+    with pytest.raises(RuntimeError, match="Invalid spill id"):
+        server.call("dynamodb_item_batch_write", {"table_name": table, "spill_id": spill_id})
+
+
+def test_spill_ids_of_other_tables_and_symlinks_are_rejected(server, table, tmp_path):
+    other = spill_write_requests("other-table", [put("x")])
+    with pytest.raises(RuntimeError, match="was not written for table"):
+        server.call("dynamodb_item_batch_write", {"table_name": table, "spill_id": other})
+
+    target = tmp_path / "outside.txt"
+    target.write_text("keep me")
+    link_id = "write-table-20240101T000000-0123abcd.jsonl"
+    os.symlink(target, os.path.join(os.environ["AWS_MCP_DYNAMODB_SPILL_DIR"], link_id))
+    with pytest.raises(RuntimeError, match="outside the spill directory"):
+        server.call("dynamodb_item_batch_write", {"table_name": table, "spill_id": link_id})
+    assert target.read_text() == "keep me"
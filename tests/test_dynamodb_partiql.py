@@ -0,0 +1,145 @@
+import pytest
+from botocore.exceptions import ClientError
+
+from mcp_server_aws.dynamodb import batch_execute, execute_paginated
+
+from conftest import create_table
+
+
+@pytest.fixture
+def table(dynamodb):
+    create_table(dynamodb, "statements")
+    return "statements"
+
+
+def insert(pk):
+    return f"INSERT INTO statements VALUE {{'pk': '{pk}', 'value': 'v'}}"
+
+
+def select(pk):
+    return f"SELECT * FROM statements WHERE pk = '{pk}'"
+
+
+def stored(dynamodb, table):
+    return sorted(item["pk"]["S"] for item in dynamodb.scan(TableName=table)["Items"])
+
+
+class FlakyStatements:
+    """Wraps a client so batch calls fail per statement or as a whole"""
+
+    def __init__(self, client, throttled_statements=False, throttled_calls=0, error_code=None):
+        self.client = client
+        self.exceptions = client.exceptions
+        self.throttled_statements = throttled_statements
+        self.throttled_calls = throttled_calls
+        self.error_code = error_code
+        self.calls = 0
+        self.sizes = []
+
+    def batch_execute_statement(self, Statements, **kwargs):
+        self.calls += 1
+        self.sizes.append(len(Statements))
+        if self.error_code is not None or self.calls <= self.throttled_calls:
+            code = self.error_code or "ThrottlingException"
+            raise ClientError({"Error": {"Code": code, "Message": "no"}}, "BatchExecuteStatement")
+        if self.calls > self.throttled_calls + 1 or not self.throttled_statements:
+            return self.client.batch_execute_statement(Statements=Statements, **kwargs)
+        # Leave every other statement throttled on the first successful call
+        executed = self.client.batch_execute_statement(Statements=Statements[1::2], **kwargs)["Responses"]
+        throttled = {"Error": {"Code": "ProvisionedThroughputExceeded", "Message": "slow down"}}
+        responses = [throttled] * len(Statements)
+        responses[1::2] = executed
+        return {"Responses": responses}
+
+
+class PagedStatements:
+    """Wraps a client so execute_statement returns pages of page_size items"""
+
+    def __init__(self, client, page_size=2):
+        self.client = client
+        self.exceptions = client.exceptions
+        self.page_size = page_size
+        self.limits = []
+
+    def execute_statement(self, Statement, Limit=None, NextToken=None, **kwargs):
+        self.limits.append(Limit)
+        items = self.client.execute_statement(Statement=Statement, **kwargs)["Items"]
+        start = int(NextToken or 0)
+        end = start + min(self.page_size, Limit or self.page_size)
+        response = {"Items": items[start:end]}
+        if end < len(items):
+            response["NextToken"] = str(end)
+        return response
+
+
+def test_statements_run_in_concurrent_chunks_in_order(dynamodb, table):
+    response = batch_execute(dynamodb, [insert(f"k{i:02}") for i in range(60)], max_concurrency=3)
+    assert response["Chunks"] == 3
+    assert response["Succeeded"] == 60
+    assert stored(dynamodb, table) == [f"k{i:02}" for i in range(60)]
+
+    reads = batch_execute(dynamodb, [select(f"k{i:02}") for i in reversed(range(60))], max_concurrency=3)
+    assert [r["Item"]["pk"]["S"] for r in reads["Responses"]] == [f"k{i:02}" for i in reversed(range(60))]
+
+
+def test_throttled_statements_are_retried_alone(dynamodb, table):
+    client = FlakyStatements(dynamodb, throttled_statements=True)
+    response = batch_execute(client, [insert(f"k{i}") for i in range(6)])
+    assert client.sizes == [6, 3]
+    assert response["Retries"] == 1
+    assert response["Failed"] == 0
+    assert stored(dynamodb, table) == [f"k{i}" for i in range(6)]
+
+
+def test_throttled_statements_are_returned_after_max_attempts(dynamodb, table):
+    client = FlakyStatements(dynamodb, throttled_statements=True)
+    response = batch_execute(client, [insert(f"k{i}") for i in range(4)], max_attempts=1)
+    assert response["Failed"] == 2
+    assert [r.get("Error", {}).get("Code") for r in response["Responses"]] == [
+        "ProvisionedThroughputExceeded", None, "ProvisionedThroughputExceeded", None]
+    assert stored(dynamodb, table) == ["k1", "k3"]
+
+
+def test_throttled_batch_calls_are_retried(dynamodb, table):
+    client = FlakyStatements(dynamodb, throttled_calls=2)
+    response = batch_execute(client, [insert("a"), insert("b")])
+    assert response["ThrottledRequests"] == 2
+    assert response["Succeeded"] == 2
+    assert stored(dynamodb, table) == ["a", "b"]
+
+
+def test_failed_batch_calls_fail_every_statement_in_the_chunk(dynamodb, table):
+    client = FlakyStatements(dynamodb, error_code="ValidationException")
+    response = batch_execute(client, [insert("a"), insert("b")])
+    assert client.calls == 1
+    assert response["Failed"] == 2
+    assert all(r["Error"]["Code"] == "ValidationException" for r in response["Responses"])
+
+
+def test_statement_errors_are_not_retried(dynamodb, table):
+    response = batch_execute(dynamodb, [insert("a"), "SELECT * FROM missing WHERE pk = 'a'"])
+    assert response["Retries"] == 0
+    assert response["Succeeded"] == 1
+    assert response["Responses"][1]["Error"]["Code"] == "ResourceNotFound"
+
+
+def test_paginated_selects_follow_next_token_up_to_limit(dynamodb, table):
+    batch_execute(dynamodb, [insert(f"k{i}") for i in range(7)])
+    client = PagedStatements(dynamodb)
+
+    response = batch_execute(
+        client, ["SELECT * FROM statements"], paginate_selects=True, limit=5)
+    page = response["Responses"][0]
+    assert response["PaginatedSelects"] == 1
+    assert page["Count"] == 5
+    assert page["Pages"] == 3
+    assert client.limits == [5, 3, 1]
+
+    rest = execute_paginated(client, "SELECT * FROM statements", next_token=page["NextToken"])
+    assert rest["NextToken"] is None
+    assert sorted(item["pk"]["S"] for item in page["Items"] + rest["Items"]) == stored(dynamodb, table)
+
+
+def test_next_token_resumes_a_single_select(server, table):
+    with pytest.raises(RuntimeError, match="single SELECT"):
+        server.call("dynamodb_batch_execute", {"statements": [select("a"), select("b")], "next_token": "1"})
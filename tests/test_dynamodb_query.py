@@ -0,0 +1,81 @@
+import pytest
+
+from mcp_server_aws.dynamodb import paginated_query
+
+from conftest import create_table
+
+
+@pytest.fixture
+def table(dynamodb):
+    create_table(dynamodb, "query-table", range_key=True)
+    for i in range(120):
+        dynamodb.put_item(TableName="query-table", Item={
+            "pk": {"S": "user#1"},
+            "sk": {"N": str(i)},
+            "kind": {"S": "even" if i % 2 == 0 else "odd"},
+            "body": {"S": "x" * 10},
+        })
+    dynamodb.put_item(TableName="query-table", Item={"pk": {"S": "user#2"}, "sk": {"N": "0"}})
+    return "query-table"
+
+
+def query_params(table, **extra):
+    return {
+        "TableName": table,
+        "KeyConditionExpression": "pk = :pk",
+        "ExpressionAttributeValues": {":pk": {"S": "user#1"}},
+        **extra,
+    }
+
+
+def sort_keys(items):
+    return [int(item["sk"]["N"]) for item in items]
+
+
+def test_query_limit_and_cursor_round_trip(dynamodb, table):
+    seen = []
+    cursor = None
+    while True:
+        response = paginated_query(dynamodb, query_params(table), limit=25, cursor=cursor)
+        assert response["Count"] <= 25
+        seen.extend(sort_keys(response["Items"]))
+        cursor = response["NextCursor"]
+        if cursor is None:
+            break
+    assert seen == list(range(120))
+
+
+def test_query_all_pages_follows_every_page(dynamodb, table):
+    response = paginated_query(dynamodb, query_params(table, Limit=10), all_pages=True)
+    assert sort_keys(response["Items"]) == list(range(120))
+    assert response["Pages"] >= 12
+    assert response["NextCursor"] is None
+
+
+def test_query_limit_counts_filtered_items(dynamodb, table):
+    params = query_params(table, FilterExpression="kind = :kind")
+    params["ExpressionAttributeValues"][":kind"] = {"S": "odd"}
+    response = paginated_query(dynamodb, params, limit=10)
+    assert sort_keys(response["Items"]) == list(range(1, 20, 2))
+    rest = paginated_query(dynamodb, params, all_pages=True, cursor=response["NextCursor"])
+    assert sort_keys(rest["Items"]) == list(range(21, 120, 2))
+
+
+def test_query_count_only(dynamodb, table):
+    response = paginated_query(dynamodb, query_params(table, Select="COUNT"), all_pages=True)
+    assert response["Count"] == 120
+    assert "Items" not in response
+
+
+def test_query_tool_projection_and_reverse_order(server, dynamodb, table):
+    response = server.call("dynamodb_item_query", {
+        "table_name": table,
+        "key_condition": "pk = :pk",
+        "expression_values": {":pk": "user#1"},
+        "plain_json": True,
+        "scan_forward": False,
+        "projection": ["sk"],
+        "limit": 3,
+    })
+    assert response["Items"] == [{"sk": 119}, {"sk": 118}, {"sk": 117}]
+    assert response["NextCursor"]
@@ -0,0 +1,99 @@
+import time
+import threading
+
+import pytest
+
+from mcp_server_aws.dynamodb import DEFAULT_SCAN_CONCURRENCY, parallel_scan
+from mcp_server_aws.utils import decode_cursor
+
+from conftest import create_table
+
+
+@pytest.fixture
+def table(dynamodb):
+    create_table(dynamodb, "scan-table")
+    for i in range(300):
+        dynamodb.put_item(TableName="scan-table", Item={"pk": {"S": f"k{i:03d}"}, "n": {"N": str(i)}})
+    return "scan-table"
+
+
+def keys(items):
+    return [item["pk"]["S"] for item in items]
+
+
+def test_scan_without_limit_reads_every_segment(dynamodb, table):
+    response = parallel_scan(dynamodb, {"TableName": table}, total_segments=4)
+    assert sorted(keys(response["Items"])) == [f"k{i:03d}" for i in range(300)]
+    assert response["NextCursor"] is None
+
+
+@pytest.mark.parametrize("limit, segments", [(10, 3), (250, 2), (7, 8), (1, 4)])
+def test_scan_never_returns_more_than_limit(dynamodb, table, limit, segments):
+    response = parallel_scan(dynamodb, {"TableName": table}, total_segments=segments, limit=limit)
+    assert len(response["Items"]) == limit
+    assert response["Count"] == limit
+    assert response["NextCursor"] is not None
+
+
+@pytest.mark.parametrize("limit, segments", [(10, 3), (250, 2), (64, 5)])
+def test_scan_cursor_resumes_without_losing_or_repeating_rows(dynamodb, table, limit, segments):
+    seen = []
+    cursor = None
+    while True:
+        response = parallel_scan(
+            dynamodb, {"TableName": table}, total_segments=segments, limit=limit, cursor=cursor)
+        assert len(response["Items"]) <= limit
+        seen.extend(keys(response["Items"]))
+        cursor = response["NextCursor"]
+        if cursor is None:
+            break
+        assert decode_cursor(cursor)["total_segments"] == segments
+    assert len(seen) == len(set(seen)) == 300
+
+
+def test_scan_limit_with_filter_counts_returned_rows(dynamodb, table):
+    params = {
+        "TableName": table,
+        "FilterExpression": "n < :n",
+        "ExpressionAttributeValues": {":n": {"N": "50"}},
+    }
+    seen = []
+    cursor = None
+    while True:
+        response = parallel_scan(dynamodb, params, total_segments=3, limit=20, cursor=cursor)
+        assert len(response["Items"]) <= 20
+        seen.extend(keys(response["Items"]))
+        cursor = response["NextCursor"]
+        if cursor is None:
+            break
+    assert sorted(seen) == [f"k{i:03d}" for i in range(50)]
+
+
+class ConcurrencyProbe:
+    """Counts how many scan calls are in flight at once"""
+
+    def __init__(self, client):
+        self.client = client
+        self.exceptions = client.exceptions
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def scan(self, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.01)
+            return self.client.scan(**kwargs)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+@pytest.mark.parametrize("limit", [None, 50])
+def test_many_segments_run_on_a_bounded_number_of_threads(dynamodb, table, limit):
+    probe = ConcurrencyProbe(dynamodb)
+    response = parallel_scan(probe, {"TableName": table}, total_segments=32, limit=limit)
+    assert probe.peak <= DEFAULT_SCAN_CONCURRENCY
+    assert len(response["Items"]) == (limit or 300)
@@ -0,0 +1,148 @@
+import time
+
+import boto3
+import pytest
+
+from mcp_server_aws.inventory import EC2Inventory, InstanceInventory, InventoryStore
+
+from conftest import REGION
+
+
+@pytest.fixture
+def ec2(mocked_aws):
+    return boto3.client("ec2", region_name=REGION)
+
+
+@pytest.fixture
+def image_id(ec2):
+    return ec2.describe_images()["Images"][0]["ImageId"]
+
+
+def launch(ec2, image_id, count=1, instance_type="t3.micro", tags=None):
+    params = {"ImageId": image_id, "MinCount": count, "MaxCount": count, "InstanceType": instance_type}
+    if tags:
+        params["TagSpecifications"] = [{
+            "ResourceType": "instance",
+            "Tags": [{"Key": key, "Value": value} for key, value in tags.items()],
+        }]
+    return sorted(instance["InstanceId"] for instance in ec2.run_instances(**params)["Instances"])
+
+
+@pytest.fixture
+def fleet(ec2, image_id):
+    return {
+        "web": launch(ec2, image_id, 3, tags={"role": "web", "env": "prod"}),
+        "db": launch(ec2, image_id, 2, instance_type="m5.large", tags={"role": "db", "env": "prod"}),
+        "scratch": launch(ec2, image_id, 1, instance_type="t3.nano"),
+    }
+
+
+def ids(instances):
+    return sorted(instance["InstanceId"] for instance in instances)
+
+
+class FilteredStatuses:
+    """Wraps a client so describe_instance_status omits some instances"""
+
+    def __init__(self, client, hidden):
+        self.client = client
+        self.hidden = set(hidden)
+
+    def describe_instances(self, **kwargs):
+        return self.client.describe_instances(**kwargs)
+
+    def describe_instance_status(self, **kwargs):
+        response = self.client.describe_instance_status(**kwargs)
+        response["InstanceStatuses"] = [
+            status for status in response["InstanceStatuses"] if status["InstanceId"] not in self.hidden]
+        return response
+
+
+def test_queries_intersect_the_indexes_they_name(ec2, fleet):
+    inventory = InstanceInventory(REGION)
+    assert inventory.full_refresh(ec2) == {"added": 6, "updated": 0, "removed": 0}
+
+    assert ids(inventory.query(tags={"role": "web"})) == fleet["web"]
+    assert ids(inventory.query(tags={"env": None})) == sorted(fleet["web"] + fleet["db"])
+    assert ids(inventory.query(tags={"role": ["web", "db"]}, instance_types="m5.large")) == fleet["db"]
+    assert ids(inventory.query(instance_types=["t3.micro", "t3.nano"])) == sorted(fleet["web"] + fleet["scratch"])
+    assert inventory.query(states=["stopped"]) == []
+    assert inventory.query(tags={"role": "web"}, instance_types=["m5.large"]) == []
+    assert len(inventory.query(limit=4)) == 4
+
+
+def test_state_refresh_reindexes_changed_and_new_instances(ec2, image_id, fleet):
+    inventory = InstanceInventory(REGION)
+    inventory.full_refresh(ec2)
+    ec2.stop_instances(InstanceIds=fleet["web"][:2])
+    added = launch(ec2, image_id, tags={"role": "web"})
+
+    assert inventory.state_refresh(ec2) == {"added": 1, "updated": 2, "removed": 0}
+    assert ids(inventory.query(states=["stopped"])) == fleet["web"][:2]
+    assert ids(inventory.query(states=["running"], tags={"role": "web"})) == sorted(fleet["web"][2:] + added)
+
+
+def test_state_refresh_drops_instances_that_disappeared(ec2, fleet):
+    inventory = InstanceInventory(REGION)
+    inventory.full_refresh(ec2)
+
+    stats = inventory.state_refresh(FilteredStatuses(ec2, fleet["db"]))
+    assert stats == {"added": 0, "updated": 0, "removed": 2}
+    assert inventory.query(tags={"role": "db"}) == []
+    assert inventory.query(instance_types=["m5.large"]) == []
+
+
+def test_store_round_trips_a_snapshot(ec2, fleet, tmp_path):
+    inventory = InstanceInventory(REGION)
+    inventory.full_refresh(ec2)
+    store = InventoryStore(str(tmp_path / "inventory" / "ec2.db"))
+    store.save(inventory)
+    store.close()
+
+    store = InventoryStore(str(tmp_path / "inventory" / "ec2.db"))
+    loaded = InstanceInventory(REGION)
+    assert store.load(loaded) is True
+    assert store.load(InstanceInventory("eu-west-1")) is False
+    store.close()
+    assert sorted(loaded.snapshot(), key=lambda i: i["InstanceId"]) == \
+        sorted(inventory.snapshot(), key=lambda i: i["InstanceId"])
+    assert (loaded.synced_at, loaded.states_synced_at) == (inventory.synced_at, inventory.states_synced_at)
+    assert ids(loaded.query(tags={"role": "db"})) == fleet["db"]
+
+
+def test_background_thread_picks_up_state_changes(ec2, fleet, tmp_path):
+    clients = []
+
+    def get_client(service, region):
+        clients.append(region)
+        return ec2
+
+    inventory = EC2Inventory(get_client, state_interval=0.05, db_path=str(tmp_path / "ec2.db"))
+    try:
+        assert len(inventory.get(REGION)) == 6
+        ec2.stop_instances(InstanceIds=fleet["db"])
+        deadline = time.monotonic() + 5
+        while not inventory.get(REGION).query(states=["stopped"]) and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert ids(inventory.get(REGION).query(states=["stopped"])) == fleet["db"]
+    finally:
+        inventory.close()
+    assert set(clients) == {REGION}
+
+    # A new inventory on the same file starts warm without sweeping
+    restarted = EC2Inventory(lambda service, region: pytest.fail("swept"), db_path=str(tmp_path / "ec2.db"))
+    try:
+        assert ids(restarted.get(REGION).query(states=["stopped"])) == fleet["db"]
+    finally:
+        restarted.close()
+
+
+def test_inventory_query_tool_answers_from_the_index(server, ec2, image_id, fleet):
+    response = server.call("ec2_inventory_query", {"tags": {"role": "web"}})
+    assert ids(response["Instances"]) == fleet["web"]
+    assert response["IndexedInstances"] == 6
+
+    added = launch(ec2, image_id, tags={"role": "web"})
+    assert server.call("ec2_inventory_query", {"tags": {"role": "web"}})["Count"] == 3
+    refreshed = server.call("ec2_inventory_query", {"tags": {"role": "web"}, "refresh": True})
+    assert ids(refreshed["Instances"]) == sorted(fleet["web"] + added)
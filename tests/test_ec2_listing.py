@@ -0,0 +1,51 @@
+import boto3
+import pytest
+
+from mcp_server_aws.ec2 import describe_instances
+
+from conftest import REGION
+
+
+@pytest.fixture
+def ec2(mocked_aws):
+    client = boto3.client("ec2", region_name=REGION)
+    image_id = client.describe_images()["Images"][0]["ImageId"]
+    for _ in range(6):
+        client.run_instances(ImageId=image_id, MinCount=1, MaxCount=1, InstanceType="t3.micro")
+    # Reservations holding several instances must be split across slices too
+    client.run_instances(ImageId=image_id, MinCount=3, MaxCount=3, InstanceType="t3.micro")
+    client.run_instances(ImageId=image_id, MinCount=4, MaxCount=4, InstanceType="t3.micro")
+    return client
+
+
+def list_in_slices(client, max_instances, max_results=None):
+    seen = []
+    token = None
+    while True:
+        response = describe_instances(
+            client, [], max_results=max_results, max_instances=max_instances, next_token=token, summary=True)
+        assert len(response["Instances"]) == response["Count"] <= max_instances
+        seen.extend(instance["InstanceId"] for instance in response["Instances"])
+        token = response["NextToken"]
+        if token is None:
+            return seen
+
+
+@pytest.mark.parametrize("max_instances, max_results", [(1, None), (2, None), (4, None), (5, None), (6, 5), (12, 5)])
+def test_slices_never_exceed_max_instances_and_cover_every_instance(ec2, max_instances, max_results):
+    seen = list_in_slices(ec2, max_instances, max_results)
+    assert len(seen) == len(set(seen)) == 13
+
+
+def test_cut_reservations_keep_their_remaining_instances_for_the_next_slice(ec2):
+    first = describe_instances(ec2, [], max_instances=8)
+    assert first["Count"] == 8
+    assert sum(len(r["Instances"]) for r in first["Reservations"]) == 8
+    rest = describe_instances(ec2, [], next_token=first["NextToken"])
+    assert rest["Count"] == 5
+    assert rest["NextToken"] is None
+
+
+def test_max_instances_must_be_positive(ec2):
+    with pytest.raises(ValueError, match="max_instances must be at least 1"):
+        describe_instances(ec2, [], max_instances=0)
@@ -0,0 +1,110 @@
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+
+from mcp_server_aws.ec2 import change_instance_states
+
+from conftest import REGION
+
+UNKNOWN_ID = "i-0123456789abcdef0"
+
+
+@pytest.fixture
+def ec2(mocked_aws):
+    return boto3.client("ec2", region_name=REGION)
+
+
+@pytest.fixture
+def instance_ids(ec2):
+    image_id = ec2.describe_images()["Images"][0]["ImageId"]
+    instances = ec2.run_instances(ImageId=image_id, MinCount=7, MaxCount=7)["Instances"]
+    return [instance["InstanceId"] for instance in instances]
+
+
+def states(ec2, instance_ids):
+    statuses = ec2.describe_instance_status(InstanceIds=instance_ids, IncludeAllInstances=True)
+    return {status["InstanceState"]["Name"] for status in statuses["InstanceStatuses"]}
+
+
+class FlakyStates:
+    """Wraps a client so state changes are throttled or instances never settle"""
+
+    def __init__(self, client, throttled_calls=0, stuck_state=None):
+        self.client = client
+        self.exceptions = client.exceptions
+        self.throttled_calls = throttled_calls
+        self.stuck_state = stuck_state
+        self.calls = 0
+
+    def stop_instances(self, **kwargs):
+        self.calls += 1
+        if self.calls <= self.throttled_calls:
+            raise ClientError({"Error": {"Code": "RequestLimitExceeded", "Message": "no"}}, "StopInstances")
+        return self.client.stop_instances(**kwargs)
+
+    def describe_instance_status(self, **kwargs):
+        response = self.client.describe_instance_status(**kwargs)
+        if self.stuck_state is not None:
+            for status in response["InstanceStatuses"]:
+                status["InstanceState"] = {"Name": self.stuck_state}
+        return response
+
+
+def test_state_changes_run_in_concurrent_chunks(ec2, instance_ids):
+    response = change_instance_states(
+        ec2, "stop", instance_ids + instance_ids[:2], chunk_size=3, max_concurrency=3, requests_per_second=100)
+
+    assert response["Chunks"] == 3
+    assert response["Requests"] == 3
+    assert response["Outcomes"] == {"requested": 7}
+    assert [outcome["InstanceId"] for outcome in response["Instances"]] == instance_ids
+    assert states(ec2, instance_ids) == {"stopped"}
+
+
+def test_rejected_chunks_are_retried_id_by_id(ec2, instance_ids):
+    response = change_instance_states(
+        ec2, "stop", instance_ids[:2] + [UNKNOWN_ID], chunk_size=3, requests_per_second=100)
+
+    assert response["Requests"] == 4
+    assert response["Outcomes"] == {"requested": 2, "failed": 1}
+    failed = response["Instances"][2]
+    assert failed["InstanceId"] == UNKNOWN_ID
+    assert "InvalidInstanceID.NotFound" in failed["Error"]
+    assert states(ec2, instance_ids[:2]) == {"stopped"}
+
+
+def test_throttled_requests_are_retried(ec2, instance_ids):
+    client = FlakyStates(ec2, throttled_calls=2)
+    response = change_instance_states(client, "stop", instance_ids, requests_per_second=100)
+    assert response["ThrottledRequests"] == 2
+    assert response["Retries"] == 2
+    assert response["Outcomes"] == {"requested": 7}
+
+
+def test_wait_polls_until_every_instance_reaches_the_target(ec2, instance_ids):
+    reported = []
+    response = change_instance_states(
+        ec2, "stop", instance_ids, requests_per_second=100, wait=True, poll_interval=0.01,
+        progress=lambda done, total: reported.append((done, total)))
+
+    assert response["TargetState"] == "stopped"
+    assert response["Outcomes"] == {"reached": 7}
+    assert all(outcome["State"] == "stopped" for outcome in response["Instances"])
+    assert reported == [(7, 7)]
+
+
+def test_wait_stops_at_dead_ends_and_the_timeout(ec2, instance_ids):
+    for stuck_state, outcome in (("terminated", "failed"), ("stopping", "timeout")):
+        client = FlakyStates(ec2, stuck_state=stuck_state)
+        response = change_instance_states(
+            client, "stop", instance_ids[:2], requests_per_second=100,
+            wait=True, wait_timeout=0.05, poll_interval=0.01)
+        assert response["Outcomes"] == {outcome: 2}
+
+
+def test_start_instances_tool_reports_each_instance(server, ec2, instance_ids):
+    ec2.stop_instances(InstanceIds=instance_ids)
+    response = server.call("ec2_start_instances", {
+        "instance_ids": instance_ids[:3] + [UNKNOWN_ID], "requests_per_second": 100})
+    assert response["Outcomes"] == {"requested": 3, "failed": 1}
+    assert [change["CurrentState"]["Name"] for change in response["StartingInstances"]] == ["pending"] * 3
@@ -0,0 +1,51 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from mcp_server_aws.formatting import serialize_response
+
+RESPONSE = {
+    "Functions": [
+        {"FunctionName": "orders", "MemorySize": Decimal("128"), "Timeout": Decimal("2.5"),
+         "Environment": {"Variables": {"STAGE": "prod"}}, "Layers": ["a", "b"]},
+        {"FunctionName": "billing", "MemorySize": Decimal("256"), "Timeout": Decimal("3"),
+         "LastModified": datetime(2024, 1, 2, 3, 4, 5)},
+    ],
+    "NextMarker": None,
+    "ResponseMetadata": {"HTTPStatusCode": 200},
+}
+
+
+def test_compact_and_pretty_json_encode_the_same_values():
+    compact = serialize_response(RESPONSE, "compact")
+    assert " " not in compact
+    assert json.loads(compact) == json.loads(serialize_response(RESPONSE, "pretty"))
+    billing = json.loads(compact)["Functions"][1]
+    assert billing["MemorySize"] == 256
+    assert billing["LastModified"] == "2024-01-02T03:04:05"
+    assert json.loads(compact)["Functions"][0]["Timeout"] == 2.5
+
+
+def test_table_flattens_the_main_list():
+    lines = serialize_response(RESPONSE, "table").splitlines()
+    assert lines[0] == (
+        "FunctionName,MemorySize,Timeout,Environment.Variables.STAGE,Layers,LastModified")
+    assert lines[1] == 'orders,128,2.5,prod,"[""a"",""b""]",'
+    assert lines[2] == "billing,256,3,,,2024-01-02T03:04:05"
+
+
+def test_unknown_output_formats_are_rejected(monkeypatch):
+    monkeypatch.setenv("AWS_MCP_OUTPUT_FORMAT", "yaml")
+    with pytest.raises(ValueError, match="Unsupported output format"):
+        serialize_response(RESPONSE)
+
+
+def test_per_call_format_overrides_the_server_default(server, s3, monkeypatch):
+    monkeypatch.setenv("AWS_MCP_OUTPUT_FORMAT", "compact")
+    s3.create_bucket(Bucket="only-bucket")
+
+    assert "\n" not in server.call_text("s3_bucket_list", {}).removeprefix("Operation Result:\n")
+    pretty = server.call_text("s3_bucket_list", {"output_format": "pretty"})
+    assert '\n  "Buckets": [' in pretty
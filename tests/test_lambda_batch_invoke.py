@@ -0,0 +1,108 @@
+import io
+import json
+import time
+import base64
+import asyncio
+import threading
+
+import pytest
+from botocore.exceptions import ClientError
+
+from mcp_server_aws.awslambda import batch_invoke, invoke_params
+from mcp_server_aws.executor import AWSExecutor
+
+
+class FakeLambda:
+    """Answers invoke by its payload and records how many calls overlap
+
+    moto only runs functions in docker, so invocations are faked: a
+    payload may ask to sleep, raise a client error or fail in the handler.
+    """
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def invoke(self, FunctionName, Payload, LogType=None, **kwargs):
+        event = json.loads(Payload)
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(event.get("sleep", 0.02))
+            if "raise" in event:
+                raise ClientError({"Error": {"Code": event["raise"], "Message": "no"}}, "Invoke")
+            response = {"StatusCode": 200, "Payload": io.BytesIO(json.dumps(event).encode())}
+            if event.get("fail"):
+                response["FunctionError"] = "Unhandled"
+            if LogType == "Tail":
+                response["LogResult"] = base64.b64encode(f"ran {FunctionName}".encode()).decode()
+            return response
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def aws():
+    executor = AWSExecutor(max_workers=16)
+    yield executor
+    executor.shutdown()
+
+
+def run_batch(aws, client, payloads, **kwargs):
+    requests = [invoke_params("orders", payload) for payload in payloads]
+    return asyncio.run(batch_invoke(aws, client, requests, **kwargs))
+
+
+def test_invocations_run_concurrently_up_to_the_limit_in_request_order(aws):
+    client = FakeLambda()
+    response = run_batch(aws, client, [{"n": i, "sleep": 0.05} for i in range(12)], max_concurrency=4)
+
+    assert client.max_active == 4
+    assert response["Succeeded"] == 12
+    assert [result["Index"] for result in response["Results"]] == list(range(12))
+    assert [result["Payload"]["n"] for result in response["Results"]] == list(range(12))
+    assert "ResponseMetadata" not in response["Results"][0]
+
+
+def test_errors_and_timeouts_are_reported_per_invocation(aws):
+    response = run_batch(
+        aws, FakeLambda(),
+        [{"n": 0}, {"raise": "TooManyRequestsException"}, {"fail": True}, {"sleep": 0.5}],
+        timeout=0.2)
+
+    ok, raised, failed, slow = response["Results"]
+    assert ok["Payload"] == {"n": 0}
+    assert "TooManyRequestsException" in raised["Error"]
+    assert failed["FunctionError"] == "Unhandled"
+    assert slow["Error"] == "Timed out after 0.2s"
+    assert (response["Succeeded"], response["FunctionErrors"], response["Failed"]) == (1, 1, 2)
+
+
+def test_concurrency_must_be_positive(aws, monkeypatch):
+    monkeypatch.setenv("AWS_MCP_LAMBDA_INVOKE_CONCURRENCY", "-1")
+    with pytest.raises(ValueError, match="at least 1"):
+        run_batch(aws, FakeLambda(), [{}])
+
+
+def test_invoke_tool_mixes_invocations_and_payloads(server, monkeypatch):
+    client = FakeLambda()
+
+    async def lambda_client(service_name, region_name=None):
+        return client
+
+    monkeypatch.setattr(server.aws, "client", lambda_client)
+    response = server.call("lambda_invoke", {
+        "function_name": "orders",
+        "log_tail": True,
+        "invocations": [{"function_name": "billing", "payload": {"n": 0}}],
+        "payloads": [{"n": 1}, {"n": 2}],
+        "max_concurrency": 2,
+    })
+
+    assert [result["FunctionName"] for result in response["Results"]] == ["billing", "orders", "orders"]
+    assert [result["Payload"] for result in response["Results"]] == [{"n": 0}, {"n": 1}, {"n": 2}]
+    assert response["Results"][0]["LogResult"] == "ran billing"
+    assert client.max_active <= 2
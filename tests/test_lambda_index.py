@@ -0,0 +1,89 @@
+import io
+import zipfile
+
+import boto3
+import pytest
+
+from conftest import REGION
+
+
+@pytest.fixture
+def function_arn(mocked_aws):
+    iam = boto3.client("iam", region_name=REGION)
+    role = iam.create_role(RoleName="lambda-role", AssumeRolePolicyDocument="{}")["Role"]["Arn"]
+    code = io.BytesIO()
+    with zipfile.ZipFile(code, "w") as archive:
+        archive.writestr("handler.py", "def handle(event, context):\n    return event\n")
+    client = boto3.client("lambda", region_name=REGION)
+    return client.create_function(
+        FunctionName="orders", Runtime="python3.12", Role=role, Handler="handler.handle",
+        Code={"ZipFile": code.getvalue()}, Description="v1"
+    )["FunctionArn"]
+
+
+def set_description(description):
+    boto3.client("lambda", region_name=REGION).update_function_configuration(
+        FunctionName="orders", Description=description)
+
+
+def test_index_answers_by_name_and_arn_with_get_function_keys(server, function_arn):
+    server.call("lambda_list_functions", {})
+    set_description("v2")
+
+    by_name = server.call("lambda_get_function", {"function_name": "orders"})
+    by_arn = server.call("lambda_get_function", {"function_name": function_arn})
+    for response in (by_name, by_arn):
+        assert set(response) == {"Configuration"}
+        assert response["Configuration"]["Description"] == "v1"
+
+
+def test_bypass_cache_skips_the_index(server, function_arn):
+    server.call("lambda_list_functions", {})
+    set_description("v2")
+
+    fresh = server.call("lambda_get_function", {"function_name": function_arn, "bypass_cache": True})
+    assert fresh["Configuration"]["Description"] == "v2"
+    assert "Code" in fresh
+
+
+def test_arn_lookups_are_indexed_under_the_function_name(server, function_arn):
+    server.call("lambda_get_function", {"function_name": function_arn})
+    assert server.aws.function_index.get(REGION, "orders")["FunctionArn"] == function_arn
+
+    server.call("lambda_get_function", {"function_name": f"{function_arn}:$LATEST"})
+    assert server.aws.function_index.get(REGION, f"{function_arn}:$LATEST") is None
+
+
+def test_indexed_name():
+    from mcp_server_aws.awslambda import indexed_name
+
+    assert indexed_name("orders") == "orders"
+    assert indexed_name("arn:aws:lambda:us-east-1:123456789012:function:orders") == "orders"
+    assert indexed_name("123456789012:function:orders") == "orders"
+    assert indexed_name("orders:live") is None
+    assert indexed_name("arn:aws:lambda:us-east-1:123456789012:function:orders:3") is None
+
+
+def descriptions(response):
+    return [function["Description"] for function in response["Functions"]]
+
+
+def test_list_bypass_cache_skips_the_index(server, function_arn):
+    server.call("lambda_list_functions", {})
+    set_description("v2")
+
+    assert server.call("lambda_list_functions", {"name_prefix": "ord"})["FromIndex"] is True
+    fresh = server.call("lambda_list_functions", {"name_prefix": "ord", "bypass_cache": True})
+    assert fresh["FromIndex"] is False
+    assert descriptions(fresh) == ["v2"]
+
+
+def test_repeated_refresh_is_not_served_from_the_response_cache(server, function_arn):
+    assert descriptions(server.call("lambda_list_functions", {"refresh": True})) == ["v1"]
+    set_description("v2")
+
+    refreshed = server.call("lambda_list_functions", {"refresh": True})
+    assert refreshed["FromIndex"] is False
+    assert descriptions(refreshed) == ["v2"]
+    # The refreshed result replaces the cached plain listing
+    assert descriptions(server.call("lambda_list_functions", {})) == ["v2"]
@@ -0,0 +1,117 @@
+from decimal import Decimal
+
+import pytest
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+from mcp_server_aws.marshalling import (
+    marshal_item,
+    marshal_items,
+    marshal_value,
+    unmarshal_item,
+    unmarshal_items,
+    unmarshal_value,
+)
+
+from conftest import create_table
+
+ITEM = {
+    "pk": "user#1",
+    "visits": 42,
+    "big": 2 ** 70,
+    "score": Decimal("1.50"),
+    "ratio": 0.25,
+    "active": True,
+    "deleted": False,
+    "email": None,
+    "avatar": b"\x00\xff",
+    "tags": ["a", 1, None, {"nested": [True]}],
+    "address": {"city": "Seattle", "zip": "98101", "geo": {"lat": Decimal("47.6")}},
+    "roles": {"admin", "dev"},
+    "lucky": {3, 7},
+    "blobs": {b"x", b"y"},
+}
+
+
+def test_marshal_matches_boto3_serializer():
+    serializer = TypeSerializer()
+    comparable = {k: v for k, v in ITEM.items() if k != "ratio"}
+    expected = {k: serializer.serialize(v) for k, v in comparable.items()}
+    marshalled = marshal_item(comparable)
+    for key in ("roles", "lucky", "blobs"):
+        (tag, values), = marshalled[key].items()
+        marshalled[key] = {tag: sorted(values)}
+        expected[key] = {tag: sorted(expected[key][tag])}
+    assert marshalled == expected
+
+
+def test_booleans_are_not_numbers():
+    assert marshal_value(True) == {"BOOL": True}
+    assert marshal_value(0) == {"N": "0"}
+    assert unmarshal_value({"BOOL": False}) is False
+
+
+def test_round_trip_preserves_values():
+    round_tripped = unmarshal_item(marshal_item(ITEM))
+    assert round_tripped == {**ITEM, "ratio": Decimal("0.25"), "tags": ["a", 1, None, {"nested": [True]}]}
+    assert type(round_tripped["visits"]) is int
+    assert round_tripped["big"] == 2 ** 70
+
+
+def test_unmarshal_matches_boto3_deserializer():
+    deserializer = TypeDeserializer()
+    marshalled = marshal_item({k: v for k, v in ITEM.items() if k != "ratio"})
+    expected = {k: deserializer.deserialize(v) for k, v in marshalled.items()}
+    expected["avatar"] = expected["avatar"].value
+    expected["blobs"] = {blob.value for blob in expected["blobs"]}
+    assert unmarshal_item(marshalled) == expected
+
+
+def test_batches_handle_mixed_schemas():
+    items = [{"pk": "a", "n": 1}, {"pk": "b", "n": "one"}, {"pk": "c"}, {"n": None, "pk": "d"}]
+    assert unmarshal_items(marshal_items(items)) == items
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), set(), {1, "a"}, object()])
+def test_unsupported_values_are_rejected(value):
+    with pytest.raises(ValueError):
+        marshal_value(value)
+
+
+def test_plain_json_put_and_get_round_trip(server, dynamodb):
+    create_table(dynamodb, "plain-table")
+    item = {"pk": "k1", "count": 3, "flag": True, "nested": {"list": [1, "two", None]}}
+    server.call("dynamodb_item_put", {"table_name": "plain-table", "item": item, "plain_json": True})
+    stored = dynamodb.get_item(TableName="plain-table", Key={"pk": {"S": "k1"}})["Item"]
+    assert stored["flag"] == {"BOOL": True}
+    response = server.call("dynamodb_item_get", {"table_name": "plain-table", "key": {"pk": "k1"}, "plain_json": True})
+    assert response["Item"] == item
+
+
+def test_batch_write_tool_marshals_plain_items(server, dynamodb):
+    create_table(dynamodb, "batch-plain")
+    items = [{"pk": f"k{i}", "n": i, "ok": i % 2 == 0} for i in range(30)]
+    response = server.call("dynamodb_item_batch_write", {"table_name": "batch-plain", "operation": "put", "items": items})
+    assert response["processed_items"] == 30
+    scanned = server.call("dynamodb_item_scan", {"table_name": "batch-plain", "plain_json": True, "all_pages": True})
+    assert sorted(scanned["Items"], key=lambda item: item["n"]) == items
+
+
+def test_large_batches_restore_the_gc_state():
+    import gc
+    from mcp_server_aws.marshalling import GC_PAUSE_MIN_ITEMS, marshal_items, unmarshal_items
+
+    items = [{"pk": f"k{i}", "n": i, "flag": True} for i in range(GC_PAUSE_MIN_ITEMS)]
+    assert gc.isenabled()
+    assert unmarshal_items(marshal_items(items)) == items
+    assert gc.isenabled()
+
+    gc.disable()
+    try:
+        marshal_items(items)
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+
+    with pytest.raises(ValueError):
+        marshal_items(items + [{"pk": float("nan")}])
+    assert gc.isenabled()
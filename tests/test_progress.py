@@ -0,0 +1,58 @@
+import asyncio
+
+from mcp.server import request_ctx
+from mcp.shared.context import RequestContext
+from mcp.types import RequestParams
+
+
+class RecordingSession:
+    """Records progress notifications; earlier ones take longer to send"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_progress_notification(self, token, progress, total=None):
+        await asyncio.sleep(0.02 * (5 - progress))
+        self.sent.append(progress)
+
+
+def run_with_progress(session, work, after=None):
+    from mcp_server_aws.services import get_progress_reporter, progress_scope
+
+    async def handle():
+        token = request_ctx.set(RequestContext(
+            request_id=1, meta=RequestParams.Meta(progressToken="token"), session=session))
+        try:
+            async with progress_scope():
+                report = get_progress_reporter()
+                await asyncio.to_thread(work, report)
+            # The result would go out here
+            sent = list(session.sent)
+            if after is not None:
+                await asyncio.to_thread(after, report)
+                await asyncio.sleep(0.2)
+            return sent
+        finally:
+            request_ctx.reset(token)
+
+    return asyncio.run(handle())
+
+
+def test_progress_is_sent_in_order_before_the_result():
+    session = RecordingSession()
+
+    def work(report):
+        for progress in range(5):
+            report(progress, 5)
+
+    assert run_with_progress(session, work) == [0, 1, 2, 3, 4]
+
+
+def test_reports_after_the_result_are_dropped():
+    session = RecordingSession()
+
+    def late(report):
+        report(2, 2)
+
+    assert run_with_progress(session, lambda report: report(1, 2), after=late) == [1]
+    assert session.sent == [1]
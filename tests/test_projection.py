@@ -0,0 +1,45 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from mcp_server_aws.formatting import project_response
+
+RESPONSE = {
+    "Functions": [
+        {"FunctionName": "orders", "MemorySize": Decimal("128"), "Timeout": Decimal("2.5"),
+         "Environment": {"Variables": {"STAGE": "prod"}}, "Layers": ["a", "b"]},
+        {"FunctionName": "billing", "MemorySize": Decimal("256"), "Timeout": Decimal("3"),
+         "LastModified": datetime(2024, 1, 2, 3, 4, 5)},
+    ],
+    "NextMarker": None,
+    "ResponseMetadata": {"HTTPStatusCode": 200},
+}
+
+
+def test_projection_drops_metadata_and_keeps_dotted_fields():
+    assert "ResponseMetadata" in project_response(RESPONSE, include_metadata=True)
+    projected = project_response(RESPONSE, fields=["Functions.FunctionName", "Functions.Environment.Variables"])
+    assert projected == {"Functions": [
+        {"FunctionName": "orders", "Environment": {"Variables": {"STAGE": "prod"}}},
+        {"FunctionName": "billing"},
+    ]}
+
+
+def test_queries_run_after_field_projection():
+    query = "Functions[?MemorySize > `200`].FunctionName"
+    assert project_response(RESPONSE, query=query) == ["billing"]
+    assert project_response(RESPONSE, fields=["Functions.FunctionName"], query=query) == []
+    with pytest.raises(ValueError, match="Invalid JMESPath query"):
+        project_response(RESPONSE, query="Functions[")
+
+
+def test_tools_apply_fields_query_and_output_format(server, s3):
+    for name in ("first-bucket", "second-bucket"):
+        s3.create_bucket(Bucket=name)
+
+    names = server.call("s3_bucket_list", {"query": "Buckets[].Name", "output_format": "compact"})
+    assert names == ["first-bucket", "second-bucket"]
+    table = server.call_text("s3_bucket_list", {"fields": ["Buckets.Name"], "output_format": "table"})
+    assert table.removeprefix("Operation Result:\n").splitlines() == ["Name", "first-bucket", "second-bucket"]
+    assert "ResponseMetadata" not in server.call("s3_bucket_list", {"bypass_cache": True})
@@ -0,0 +1,53 @@
+import boto3
+import pytest
+
+REGIONS = ["us-east-1", "us-west-2"]
+
+
+@pytest.fixture
+def instances(mocked_aws):
+    for region in REGIONS:
+        ec2 = boto3.client("ec2", region_name=region)
+        image_id = ec2.describe_images()["Images"][0]["ImageId"]
+        for _ in range(7):
+            ec2.run_instances(ImageId=image_id, MinCount=1, MaxCount=1, InstanceType="t3.micro")
+
+
+def test_fan_out_returns_a_token_per_region(server, instances):
+    response = server.call("ec2_list_instances", {
+        "regions": REGIONS, "view": "summary", "max_instances": 5})
+
+    assert response["Regions"] == {"us-east-1": 5, "us-west-2": 5}
+    assert set(response["NextTokens"]) == set(REGIONS)
+
+    for region in REGIONS:
+        rest = server.call("ec2_list_instances", {
+            "regions": [region], "view": "summary", "next_token": response["NextTokens"][region]})
+        assert rest["Regions"] == {region: 2}
+        assert rest["NextTokens"] is None
+        seen = {i["InstanceId"] for i in response["Instances"] + rest["Instances"] if i["Region"] == region}
+        assert len(seen) == 7
+
+
+def test_cursor_is_rejected_across_several_regions(server):
+    with pytest.raises(RuntimeError, match="next_token resumes a single region"):
+        server.call("ec2_list_instances", {"regions": REGIONS, "next_token": "token"})
+
+
+def test_table_list_tokens_are_kept_per_region(server, mocked_aws):
+    from conftest import create_table
+
+    for region in REGIONS:
+        client = boto3.client("dynamodb", region_name=region)
+        for name in ("alpha", "beta", "gamma"):
+            create_table(client, f"{name}-{region}")
+
+    response = server.call("dynamodb_table_list", {"regions": REGIONS, "limit": 2})
+    assert response["Regions"] == {"us-east-1": 2, "us-west-2": 2}
+    assert set(response["NextTokens"]) == set(REGIONS)
+
+    for region in REGIONS:
+        rest = server.call("dynamodb_table_list", {
+            "regions": [region], "exclusive_start_table_name": response["NextTokens"][region]})
+        assert [table["TableName"] for table in rest["TableNames"]] == [f"gamma-{region}"]
+        assert rest["NextTokens"] is None
@@ -0,0 +1,67 @@
+import pytest
+from mcp.types import Tool
+
+from mcp_server_aws.registry import ToolRegistry
+from mcp_server_aws.tools import BUILTIN_SERVICES, ToolSpec
+
+
+async def echo(aws, arguments):
+    return arguments
+
+
+def plugin_tools(name="plugin_echo", cost="low", read_only=True):
+    return lambda: [ToolSpec(
+        Tool(name=name, description="Echo", inputSchema={"type": "object", "properties": {}}),
+        handler=echo, read_only=read_only, cost=cost, cache_ttl=30)]
+
+
+def test_enabled_services_and_read_only_mode_filter_the_tools():
+    registry = ToolRegistry(BUILTIN_SERVICES, enabled=["s3", "ec2"], read_only=True)
+    assert {spec.service for spec in registry.specs()} == {"s3", "ec2"}
+    assert all(spec.read_only for spec in registry.specs())
+    assert "s3_bucket_list" in registry
+    assert "s3_bucket_create" not in registry
+    with pytest.raises(ValueError, match="Unknown tool: s3_bucket_create"):
+        registry.get("s3_bucket_create")
+
+
+def test_environment_selects_services_and_read_only_mode(monkeypatch):
+    monkeypatch.setenv("AWS_MCP_SERVICES", "lambda")
+    monkeypatch.setenv("AWS_MCP_READ_ONLY", "true")
+    registry = ToolRegistry(BUILTIN_SERVICES)
+    assert {spec.service for spec in registry.specs()} == {"lambda"}
+    assert "lambda_invoke" not in registry
+
+    monkeypatch.setenv("AWS_MCP_SERVICES", "s3,sqs")
+    with pytest.raises(ValueError, match="Unknown services: sqs"):
+        ToolRegistry(BUILTIN_SERVICES)
+
+
+def test_plugins_get_common_and_cache_properties():
+    registry = ToolRegistry({"plugin": plugin_tools()}, enabled=None, read_only=False)
+    spec = registry.get("plugin_echo")
+    assert spec.service == "plugin"
+    assert {"output_format", "fields", "query", "bypass_cache"} <= set(spec.tool.inputSchema["properties"])
+    assert registry.cache_ttls() == {"plugin_echo": 30}
+    assert registry.tools() == [spec.tool]
+
+
+def test_invalid_plugins_are_rejected():
+    with pytest.raises(ValueError, match="Invalid cost class for plugin_echo"):
+        ToolRegistry({"plugin": plugin_tools(cost="huge")}, enabled=None, read_only=False)
+    with pytest.raises(ValueError, match="Duplicate tool: s3_bucket_list"):
+        ToolRegistry(
+            {**BUILTIN_SERVICES, "plugin": plugin_tools(name="s3_bucket_list")}, enabled=None, read_only=False)
+
+
+def test_disabled_services_are_never_loaded():
+    def broken():
+        raise AssertionError("loaded")
+
+    registry = ToolRegistry({"s3": BUILTIN_SERVICES["s3"], "broken": broken}, enabled=["s3"], read_only=False)
+    assert len(registry) == len(BUILTIN_SERVICES["s3"]())
+
+
+def test_unknown_tools_are_reported_as_errors(server):
+    with pytest.raises(RuntimeError, match="Unknown tool: s3_bucket_rename"):
+        server.call("s3_bucket_rename", {})
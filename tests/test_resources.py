@@ -0,0 +1,15 @@
+import json
+
+
+def test_resources_are_served_with_their_listed_mime_type(server):
+    from mcp import types
+    handler = server.server.request_handlers[types.ListResourcesRequest]
+    listed = server.run(handler(types.ListResourcesRequest(method="resources/list"))).root.resources
+    mime_types = {str(resource.uri): resource.mimeType for resource in listed}
+
+    stats = server.read_resource("cache://aws-responses/stats")
+    assert stats.mimeType == mime_types["cache://aws-responses/stats"] == "application/json"
+    assert json.loads(stats.text)["hits"] == 0
+
+    audit = server.read_resource("audit://aws-operations?limit=5")
+    assert audit.mimeType == "text/plain"
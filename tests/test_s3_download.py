@@ -0,0 +1,50 @@
+import os
+
+import pytest
+
+from mcp_server_aws.s3 import resolve_download_path
+
+BODY = bytes(range(256)) * 40
+
+
+@pytest.fixture
+def bucket(s3):
+    s3.create_bucket(Bucket="downloads")
+    s3.put_object(Bucket="downloads", Key="data.bin", Body=BODY)
+
+
+def test_download_writes_inside_the_download_directory(server, bucket, tmp_path):
+    response = server.call("s3_object_download", {
+        "bucket_name": "downloads", "object_key": "data.bin",
+        "download_path": "nested/data.bin", "part_size": 4096})
+
+    path = tmp_path / "downloads" / "nested" / "data.bin"
+    assert response["Path"] == os.path.realpath(path)
+    assert response["Parts"] == 3
+    assert path.read_bytes() == BODY
+
+
+@pytest.mark.parametrize("download_path", ["../escaped.bin", "/etc/passwd", "nested/../../escaped.bin", "."])
+def test_paths_escaping_the_download_directory_are_rejected(download_path):
+    with pytest.raises(ValueError, match="outside the download directory"):
+        resolve_download_path(download_path)
+
+
+def test_symlinks_out_of_the_download_directory_are_rejected(tmp_path):
+    directory = tmp_path / "downloads"
+    directory.mkdir()
+    (directory / "link").symlink_to(tmp_path)
+    with pytest.raises(ValueError, match="outside the download directory"):
+        resolve_download_path("link/escaped.bin")
+    assert not (tmp_path / "escaped.bin").exists()
+
+
+def test_download_tool_is_hidden_in_read_only_mode():
+    from mcp_server_aws.registry import ToolRegistry
+    from mcp_server_aws.tools import BUILTIN_SERVICES
+
+    registry = ToolRegistry(BUILTIN_SERVICES, enabled=["s3"], read_only=True)
+    assert "s3_object_read" in registry
+    assert "s3_object_download" not in registry
+    read_schema = registry.get("s3_object_read").tool.inputSchema["properties"]
+    assert "download_path" not in read_schema
@@ -0,0 +1,70 @@
+import pytest
+
+from mcp_server_aws.s3 import S3Engine
+
+KEYS = sorted(
+    [f"logs/2024/{i:03d}.log" for i in range(30)]
+    + [f"logs/2025/{i:03d}.log" for i in range(25)]
+    + [f"data/{i:02d}.csv" for i in range(12)]
+    + ["root.txt"]
+)
+
+
+@pytest.fixture
+def engine(s3):
+    s3.create_bucket(Bucket="listing")
+    for key in KEYS:
+        s3.put_object(Bucket="listing", Key=key, Body=b"x")
+    return S3Engine(s3)
+
+
+@pytest.mark.parametrize("max_keys", [1, 7, 50, 1000])
+def test_list_cursor_round_trip(engine, max_keys):
+    seen = []
+    cursor = None
+    while True:
+        page = engine.list_objects("listing", max_keys=max_keys, cursor=cursor)
+        assert page["KeyCount"] <= max_keys
+        seen.extend(item["Key"] for item in page["Contents"])
+        cursor = page["NextCursor"]
+        assert page["IsTruncated"] == (cursor is not None)
+        if cursor is None:
+            break
+    assert seen == KEYS
+
+
+def test_list_with_prefix_and_start_after(engine):
+    page = engine.list_objects("listing", prefix="logs/2025/", start_after="logs/2025/019.log")
+    assert [item["Key"] for item in page["Contents"]] == [f"logs/2025/{i:03d}.log" for i in range(20, 25)]
+
+
+def test_common_prefixes_count_towards_max_keys(engine):
+    page = engine.list_objects("listing", delimiter="/", max_keys=2)
+    assert page["KeyCount"] + len(page["CommonPrefixes"]) == 2
+    rest = engine.list_objects("listing", delimiter="/", cursor=page["NextCursor"])
+    prefixes = [p["Prefix"] for p in page["CommonPrefixes"] + rest["CommonPrefixes"]]
+    keys = [item["Key"] for item in page["Contents"] + rest["Contents"]]
+    assert prefixes == ["data/", "logs/"] and keys == ["root.txt"]
+
+
+def test_exhaustive_listing_walks_every_prefix(engine):
+    response = engine.list_objects_exhaustive("listing", max_concurrency=4)
+    assert [item["Key"] for item in response["Contents"]] == KEYS
+    assert not response["IsTruncated"]
+    assert response["PrefixesListed"] == 5
+
+
+def test_exhaustive_listing_stops_at_max_keys(engine):
+    response = engine.list_objects_exhaustive("listing", prefix="logs/", max_keys=10)
+    assert response["KeyCount"] == 10
+    assert response["IsTruncated"]
+
+
+def test_list_tool_pages_through_cursor(server, s3):
+    s3.create_bucket(Bucket="tool-listing")
+    for i in range(5):
+        s3.put_object(Bucket="tool-listing", Key=f"k{i}", Body=b"x")
+    first = server.call("s3_object_list", {"bucket_name": "tool-listing", "max_keys": 3})
+    second = server.call("s3_object_list", {"bucket_name": "tool-listing", "max_keys": 3, "cursor": first["NextCursor"]})
+    assert [item["Key"] for item in first["Contents"] + second["Contents"]] == [f"k{i}" for i in range(5)]
+    assert second["NextCursor"] is None
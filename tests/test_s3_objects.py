@@ -0,0 +1,63 @@
+import base64
+import subprocess
+
+import pytest
+
+from mcp_server_aws.s3 import S3CliEngine
+
+
+@pytest.fixture
+def no_subprocesses(monkeypatch):
+    def refuse(*args, **kwargs):
+        raise AssertionError(f"Spawned a subprocess: {args}")
+
+    monkeypatch.setattr(subprocess, "run", refuse)
+
+
+def encoded(data: bytes) -> str:
+    return base64.b64encode(data).decode()
+
+
+def test_object_round_trip_runs_in_process(server, s3, no_subprocesses):
+    server.call("s3_bucket_create", {"bucket_name": "eu-bucket", "region": "eu-west-1"})
+    assert s3.get_bucket_location(Bucket="eu-bucket")["LocationConstraint"] == "eu-west-1"
+
+    server.call("s3_bucket_create", {"bucket_name": "objects"})
+    server.call("s3_object_upload", {
+        "bucket_name": "objects", "object_key": "notes.txt", "file_content": encoded("héllo".encode())})
+    server.call("s3_object_upload", {
+        "bucket_name": "objects", "object_key": "raw.bin", "file_content": encoded(b"ok\xff")})
+
+    listed = server.call("s3_object_list", {"bucket_name": "objects"})
+    assert [entry["Key"] for entry in listed["Contents"]] == ["notes.txt", "raw.bin"]
+    assert server.call_text("s3_object_read", {"bucket_name": "objects", "object_key": "notes.txt"}) == "héllo"
+    assert server.call_text("s3_object_read", {"bucket_name": "objects", "object_key": "raw.bin"}) == "ok�"
+
+    server.call("s3_object_delete", {"bucket_name": "objects", "object_key": "notes.txt"})
+    assert [entry["Key"] for entry in s3.list_objects_v2(Bucket="objects")["Contents"]] == ["raw.bin"]
+
+
+def test_missing_objects_surface_the_s3_error(server, s3, no_subprocesses):
+    s3.create_bucket(Bucket="objects")
+    with pytest.raises(RuntimeError, match="NoSuchKey"):
+        server.call_text("s3_object_read", {"bucket_name": "objects", "object_key": "missing.txt"})
+
+
+def test_cli_fallback_is_opt_in(server, s3, monkeypatch):
+    commands = []
+
+    def run(self, cli_command):
+        commands.append(cli_command)
+        if cli_command[2] == "get-object":
+            with open(cli_command[-1], "wb") as f:
+                f.write(b"from the cli")
+        return subprocess.CompletedProcess(cli_command, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(S3CliEngine, "_run", run)
+    monkeypatch.setenv("AWS_MCP_S3_USE_CLI", "true")
+
+    text = server.call_text("s3_object_read", {"bucket_name": "objects", "object_key": "a.txt"})
+    assert text == "from the cli"
+    server.call("s3_object_delete", {"bucket_name": "objects", "object_key": "a.txt"})
+    assert [command[:3] for command in commands] == [
+        ["aws", "s3api", "get-object"], ["aws", "s3api", "delete-object"]]
@@ -0,0 +1,96 @@
+import base64
+
+import pytest
+
+from mcp_server_aws.s3 import S3Engine
+
+TEXT = "".join(f"line {i} – ünïcødé €\n" for i in range(200)).encode()
+SHORT = "naïve €😀 ok\n".encode()
+
+
+@pytest.fixture
+def engine(s3):
+    s3.create_bucket(Bucket="reads")
+    s3.put_object(Bucket="reads", Key="text.txt", Body=TEXT)
+    s3.put_object(Bucket="reads", Key="short.txt", Body=SHORT)
+    s3.put_object(Bucket="reads", Key="binary.bin", Body=bytes(range(256)) * 10)
+    s3.put_object(Bucket="reads", Key="no-newline.txt", Body=b"a\nb\nc")
+    return S3Engine(s3)
+
+
+def read_all_pages(engine, key, chunk_size, encoding="auto"):
+    chunks = []
+    cursor = None
+    pages = 0
+    while True:
+        page = engine.read_page("reads", key, cursor=cursor, chunk_size=chunk_size, encoding=encoding)
+        pages += 1
+        assert pages <= len(TEXT) + 1, "paged read stopped moving forward"
+        data = page["Body"].encode() if page["Encoding"] == "text" else base64.b64decode(page["Body"])
+        chunks.append(data)
+        cursor = page["NextCursor"]
+        if cursor is None:
+            return b"".join(chunks), pages
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5])
+def test_paged_read_moves_forward_inside_multibyte_characters(engine, chunk_size):
+    data, _ = read_all_pages(engine, "short.txt", chunk_size)
+    assert data == SHORT
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1000, 1 << 20])
+def test_paged_read_reassembles_text(engine, chunk_size):
+    data, pages = read_all_pages(engine, "text.txt", chunk_size)
+    assert data == TEXT
+    if chunk_size >= len(TEXT):
+        assert pages == 1
+
+
+def test_paged_read_reassembles_binary(engine):
+    data, _ = read_all_pages(engine, "binary.bin", 100)
+    assert data == bytes(range(256)) * 10
+
+
+def test_paged_read_rejects_empty_chunks(engine):
+    with pytest.raises(ValueError):
+        engine.read_page("reads", "text.txt", chunk_size=-1)
+
+
+def test_read_range_and_negative_offset(engine):
+    page = engine.read_range("reads", "text.txt", offset=0, length=6)
+    assert page["Body"] == "line 0"
+    assert page["Range"] == {"Start": 0, "End": 5}
+    tail = engine.read_range("reads", "no-newline.txt", offset=-3)
+    assert tail["Body"] == "b\nc"
+
+
+@pytest.mark.parametrize("length", [0, -1])
+def test_read_range_rejects_empty_lengths(engine, length):
+    with pytest.raises(ValueError, match="length must be at least 1"):
+        engine.read_range("reads", "text.txt", offset=0, length=length)
+
+
+def test_head_and_tail_lines(engine):
+    lines = TEXT.decode().splitlines(keepends=True)
+    head = engine.read_lines("reads", "text.txt", head=3)
+    assert head["Lines"] == 3 and head["Body"] == "".join(lines[:3])
+    tail = engine.read_lines("reads", "text.txt", tail=2)
+    assert tail["Lines"] == 2 and tail["Body"] == "".join(lines[-2:])
+    assert engine.read_lines("reads", "no-newline.txt", tail=1)["Body"] == "c"
+    assert engine.read_lines("reads", "no-newline.txt", head=10)["Lines"] == 3
+
+
+@pytest.mark.parametrize("head, tail", [(0, None), (None, 0), (-1, None), (None, None), (1, 1)])
+def test_invalid_line_windows_are_rejected(engine, head, tail):
+    with pytest.raises(ValueError):
+        engine.read_lines("reads", "text.txt", head=head, tail=tail)
+
+
+def test_read_tool_rejects_zero_head_lines(server, s3):
+    s3.create_bucket(Bucket="tool-reads")
+    s3.put_object(Bucket="tool-reads", Key="k", Body=b"x\ny\n")
+    with pytest.raises(RuntimeError, match="at least 1"):
+        server.call("s3_object_read", {"bucket_name": "tool-reads", "object_key": "k", "head_lines": 0})
+    response = server.call("s3_object_read", {"bucket_name": "tool-reads", "object_key": "k", "head_lines": 1})
+    assert response["Body"] == "x\n"
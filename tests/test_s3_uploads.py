@@ -0,0 +1,60 @@
+import base64
+import time
+
+import pytest
+
+from mcp_server_aws.s3 import MIN_PART_SIZE
+
+
+@pytest.fixture
+def bucket(s3):
+    s3.create_bucket(Bucket="uploads")
+    return "uploads"
+
+
+def chunk(server, arguments):
+    return server.call("s3_object_upload_chunk", {"bucket_name": "uploads", "object_key": "big.bin", **arguments})
+
+
+def encode(data: bytes) -> str:
+    return base64.b64encode(data).decode()
+
+
+def test_chunked_upload_round_trip(server, s3, bucket):
+    data = bytes(range(256)) * (MIN_PART_SIZE // 256 + 100)
+    first = chunk(server, {"file_content": encode(data[:MIN_PART_SIZE + 10]), "part_size": MIN_PART_SIZE})
+    assert first["PartsUploaded"] == 1 and first["BufferedBytes"] == 10
+    done = chunk(server, {"upload_id": first["UploadId"], "file_content": encode(data[MIN_PART_SIZE + 10:]),
+                          "offset": MIN_PART_SIZE + 10, "final": True})
+    assert done["BytesUploaded"] == len(data)
+    assert s3.get_object(Bucket=bucket, Key="big.bin")["Body"].read() == data
+    assert s3.list_multipart_uploads(Bucket=bucket).get("Uploads", []) == []
+
+
+def test_multipart_upload_round_trip(server, s3, bucket):
+    data = b"z" * (MIN_PART_SIZE * 2 + 3)
+    response = server.call("s3_object_upload", {
+        "bucket_name": bucket, "object_key": "multi.bin", "file_content": encode(data),
+        "multipart_threshold": MIN_PART_SIZE, "part_size": MIN_PART_SIZE,
+    })
+    assert len(response["Parts"]) == 3
+    assert s3.get_object(Bucket=bucket, Key="multi.bin")["Body"].read() == data
+
+
+def test_idle_chunked_uploads_are_aborted(server, s3, bucket):
+    uploads = server.aws.chunked_uploads
+    started = chunk(server, {"file_content": encode(b"a" * 100)})
+    upload_id = started["UploadId"]
+    assert len(s3.list_multipart_uploads(Bucket=bucket)["Uploads"]) == 1
+
+    assert uploads.sweep() == []
+    assert uploads.sweep(now=time.monotonic() + uploads.ttl + 1) == [upload_id]
+    assert s3.list_multipart_uploads(Bucket=bucket).get("Uploads", []) == []
+    with pytest.raises(RuntimeError, match="Unknown or expired upload id"):
+        chunk(server, {"upload_id": upload_id, "file_content": encode(b"b"), "final": True})
+
+
+def test_open_chunked_uploads_are_aborted_on_close(server, s3, bucket):
+    chunk(server, {"file_content": encode(b"a" * 100)})
+    server.aws.chunked_uploads.close()
+    assert s3.list_multipart_uploads(Bucket=bucket).get("Uploads", []) == []